@@ -0,0 +1,123 @@
+"""
+Benchmark the K-means clustering engines of CustomerClusterAnalysis.
+
+Compares, on synthetic customer_spend_score rows:
+  kmeans     - the original full-batch KMeans(max_iter=500) on all rows in memory
+  minibatch  - perform_clustering(engine='minibatch') on all rows in memory
+  streaming  - perform_clustering_streaming, reading the rows in chunks
+
+Wall time and inertia (on all rows, in the space the model was fitted in) are
+reported; inertia_excess is relative to the full-batch engine.
+
+Usage (from the repository root):
+    python -m customer_bonus.bench_kmeans --rows 10000 100000 1000000
+"""
+
+import argparse
+import json
+import os
+import time
+
+import numpy as np
+import pandas as pd
+
+from customer_bonus.customer_cluster_analysis import CLUSTERING_COLUMNS, CustomerClusterAnalysis
+
+ENGINES = ('kmeans', 'minibatch', 'streaming')
+
+
+class FrameConnector:
+    """Serve an in-memory DataFrame the way Connector serves the clustering query"""
+
+    def __init__(self, df):
+        self.df = df
+
+    def queryDataset(self, sql):
+        return self.df.copy()
+
+    def queryDatasetChunks(self, sql, chunksize=10000, val=None):
+        for start in range(0, len(self.df), chunksize):
+            yield self.df.iloc[start:start + chunksize]
+
+
+def make_customers(n_rows, n_segments=5, seed=0):
+    """Customers drawn from a few Age/Income/Spending_Score segments, like the Mall Customers data"""
+    rng = np.random.default_rng(seed)
+    centers = np.column_stack([
+        rng.uniform(20, 65, n_segments),
+        rng.uniform(20, 130, n_segments),
+        rng.uniform(5, 95, n_segments),
+    ])
+    segment = rng.integers(0, n_segments, n_rows)
+    X = centers[segment] + rng.normal(0, [6.0, 12.0, 9.0], (n_rows, 3))
+    return pd.DataFrame({
+        'CustomerID': np.arange(1, n_rows + 1),
+        'Name': 'Customer',
+        'Gender': np.where(rng.random(n_rows) < 0.5, 'Male', 'Female'),
+        'Age': np.clip(X[:, 0], 18, 80).round(),
+        'Annual_Income': np.clip(X[:, 1], 10, 150).round(),
+        'Spending_Score': np.clip(X[:, 2], 1, 100).round(),
+    })[CLUSTERING_COLUMNS]
+
+
+def run_engine(df, engine, features, n_clusters, scale_data, chunksize, batch_size):
+    analysis = CustomerClusterAnalysis(conn=FrameConnector(df))
+    start = time.perf_counter()
+    if engine == 'streaming':
+        ok = analysis.perform_clustering_streaming(features, n_clusters, scale_data,
+                                                   chunksize=chunksize, batch_size=batch_size)
+    else:
+        analysis.df_clustered = df.copy()
+        ok = analysis.perform_clustering(features, n_clusters, scale_data,
+                                         engine=engine, batch_size=batch_size)
+    seconds = time.perf_counter() - start
+    if not ok:
+        raise RuntimeError(f"{engine} clustering failed")
+    X = df[features].to_numpy(dtype=np.float64)
+    if analysis.scaler is not None:
+        X = analysis.scaler.transform(X)
+    return seconds, float(-analysis.kmeans.score(X))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare full-batch, mini-batch and streaming K-means")
+    parser.add_argument("--rows", type=int, nargs='+', default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--engines", nargs='+', choices=ENGINES, default=list(ENGINES))
+    parser.add_argument("--features", nargs='+', default=['Age', 'Annual_Income', 'Spending_Score'])
+    parser.add_argument("--n_clusters", type=int, default=5)
+    parser.add_argument("--scale", action="store_true", help="Standardize the features first")
+    parser.add_argument("--chunksize", type=int, default=100_000, help="Rows per chunk for the streaming engine")
+    parser.add_argument("--batch_size", type=int, default=4096, help="Mini-batch size")
+    parser.add_argument("--out", default="customer_bonus/bench_results/kmeans.json", help="JSON report path")
+    args = parser.parse_args()
+
+    # Warm up sklearn's imports and thread pools so the first timing is not inflated
+    warmup = make_customers(2000, seed=1)
+    for engine in args.engines:
+        run_engine(warmup, engine, args.features, args.n_clusters, args.scale, 1000, 500)
+
+    records = []
+    for n_rows in args.rows:
+        df = make_customers(n_rows)
+        print(f"\n=== {n_rows} rows ===")
+        baseline = None
+        for engine in args.engines:
+            seconds, inertia = run_engine(df, engine, args.features, args.n_clusters, args.scale,
+                                          args.chunksize, args.batch_size)
+            if engine == 'kmeans':
+                baseline = inertia
+            record = {'engine': engine, 'rows': n_rows, 'seconds': seconds, 'inertia': inertia,
+                      'inertia_excess': inertia / baseline - 1.0 if baseline else None}
+            records.append(record)
+            excess = f"{record['inertia_excess']:+.2%}" if baseline else "n/a"
+            print(f"  {engine:<10} {seconds * 1e3:10.1f} ms  inertia={inertia:.6g}  vs kmeans={excess}")
+
+    os.makedirs(os.path.dirname(args.out) or '.', exist_ok=True)
+    with open(args.out, 'w') as f:
+        json.dump({'benchmark': 'kmeans', 'features': args.features, 'n_clusters': args.n_clusters,
+                   'scaled': args.scale, 'records': records}, f, indent=2)
+    print(f"\nReport written to {args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""Membership index of CustomerClusterAnalysis: per-cluster slices, pages and sorting.
+
+Run from the repository root: python -m pytest customer_bonus/test_cluster_membership.py
+"""
+import numpy as np
+import pandas as pd
+import pytest
+
+from customer_bonus.bench_kmeans import FrameConnector, make_customers
+from customer_bonus.customer_cluster_analysis import CustomerClusterAnalysis
+
+LABELS = np.array([2, 0, 1, 0, 2, 2, 0, 1, 0, 2, 0, 1])
+
+
+@pytest.fixture
+def analysis():
+    """12 customers with fixed labels, and a customer table with a column the clustering query lacks"""
+    df = make_customers(len(LABELS), seed=3)
+    analysis = CustomerClusterAnalysis(conn=FrameConnector(df))
+    analysis.df_clustered = df.copy()
+    analysis.df_customers = pd.DataFrame({
+        'CustomerID': df['CustomerID'][::-1].to_numpy(),
+        'Age': 0,
+        'Email': [f"c{i}@example.com" for i in df['CustomerID'][::-1]],
+    })
+    analysis.n_clusters = 4
+    analysis.set_cluster_labels(LABELS)
+    return analysis
+
+
+def test_offsets_bound_each_cluster(analysis):
+    np.testing.assert_array_equal(analysis.cluster_offsets, [0, 5, 8, 12, 12])
+    assert [analysis.cluster_slice(c) for c in range(4)] == [(0, 5), (5, 8), (8, 12), (12, 12)]
+
+
+def test_clusters_keep_original_row_order(analysis):
+    for cluster_id in range(3):
+        expected = analysis.df_clustered.loc[LABELS == cluster_id, 'CustomerID'].tolist()
+        members = analysis.get_customers_by_cluster(cluster_id)
+        assert members['CustomerID'].tolist() == expected
+        assert (members['Cluster'] == cluster_id).all()
+
+
+def test_customer_columns_are_joined_once(analysis):
+    members = analysis.df_members
+    assert members['Email'].tolist() == [f"c{i}@example.com" for i in members['CustomerID']]
+    # Columns the clustering query returns are not duplicated or suffixed
+    assert list(members.columns).count('Age') == 1
+    assert not any(c.endswith(('_x', '_y')) for c in members.columns)
+    assert (members['Age'] > 0).all()
+
+
+def test_empty_and_unknown_clusters(analysis):
+    assert analysis.get_customers_by_cluster(3) is None
+    assert analysis.get_customers_by_cluster(4) is None
+    assert analysis.cluster_members(3).empty
+
+
+@pytest.mark.parametrize('start, stop', [(0, None), (1, 3), (3, 100), (-2, 2), (4, 1), (10, None)])
+def test_pages_are_clamped_slices(analysis, start, stop):
+    whole = analysis.get_customers_by_cluster(0)
+    size = len(whole)
+    lo = min(max(start, 0), size)
+    hi = size if stop is None else min(max(stop, lo), size)
+    page = analysis.cluster_members(0, start, stop)
+    assert page['CustomerID'].tolist() == whole['CustomerID'].iloc[lo:hi].tolist()
+
+
+@pytest.mark.parametrize('descending', [False, True])
+def test_sorted_pages_match_sort_values(analysis, descending):
+    for cluster_id in range(3):
+        whole = analysis.get_customers_by_cluster(cluster_id)
+        expected = whole.sort_values('Spending_Score', kind='stable')['CustomerID'].tolist()
+        if descending:
+            expected = expected[::-1]
+        assert analysis.cluster_members(cluster_id, sort='Spending_Score',
+                                        descending=descending)['CustomerID'].tolist() == expected
+        page = analysis.cluster_members(cluster_id, 1, 3, sort='Spending_Score', descending=descending)
+        assert page['CustomerID'].tolist() == expected[1:3]
+
+
+def test_sort_orders_are_rebuilt_with_new_labels(analysis):
+    analysis.cluster_members(0, sort='Age')
+    analysis.set_cluster_labels(np.roll(LABELS, 1))
+    after = analysis.cluster_members(0, sort='Age')
+    assert (after['Cluster'] == 0).all()
+    expected = analysis.get_customers_by_cluster(0).sort_values('Age', kind='stable')['CustomerID'].tolist()
+    assert after['CustomerID'].tolist() == expected
+
+
+def test_index_matches_fitted_labels():
+    df = make_customers(3_000)
+    analysis = CustomerClusterAnalysis(conn=FrameConnector(df))
+    assert analysis.load_customer_data()
+    assert analysis.perform_clustering(['Age', 'Annual_Income', 'Spending_Score'], n_clusters=5, scale_data=True)
+    counts = np.bincount(analysis.cluster_labels, minlength=5)
+    np.testing.assert_array_equal(np.diff(analysis.cluster_offsets), counts)
+    assert [s['count'] for s in analysis.cluster_summary] == counts.tolist()
+    for cluster_id in range(5):
+        members = analysis.cluster_members(cluster_id)
+        assert (members['Cluster'] == cluster_id).all()
+        assert sorted(members['CustomerID']) == sorted(df['CustomerID'][analysis.cluster_labels == cluster_id])
@@ -0,0 +1 @@
+"""Performance benchmarks for the house price train/load/predict paths."""
\ No newline at end of file
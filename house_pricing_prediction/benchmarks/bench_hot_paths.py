@@ -0,0 +1,109 @@
+"""Benchmark the house price load/split/train/save/load/predict hot paths.
+
+Example:
+    python -m house_price_prediction.benchmarks.bench_hot_paths --rows 1000 100000 1000000
+
+Synthetic CSVs are cached in --workdir. Sizes above --max_in_memory_rows only
+run the streaming engine, so 10^8-row files can be benchmarked too.
+"""
+import argparse
+import os
+import tempfile
+
+import numpy as np
+
+from house_price_prediction.benchmarks.harness import BenchmarkReport, time_call
+from house_price_prediction.benchmarks.synthetic import ensure_housing_csv
+from house_price_prediction.core.data_loader import FEATURE_COLUMNS, load_dataset, split_features_target
+from house_price_prediction.core.model_utils import (
+    IncrementalLeastSquares,
+    linear_regression_from_coef,
+    load_model_zip,
+    save_model_zip,
+    train_linear_regression,
+    train_linear_regression_streaming,
+)
+from house_price_prediction.core.scorer import load_scorer_zip
+
+ENGINES = ('sklearn', 'numpy', 'streaming')
+
+
+def _train_numpy(X, y):
+    solver = IncrementalLeastSquares().partial_fit(X, y)
+    coef, intercept = solver.solve()
+    return linear_regression_from_coef(coef, intercept, FEATURE_COLUMNS)
+
+
+def bench_size(report: BenchmarkReport, csv_path: str, n_rows: int, engines, repeat: int,
+               in_memory: bool, workdir: str):
+    if 'streaming' in engines:
+        best, mean, _ = time_call(lambda: train_linear_regression_streaming(csv_path), repeat=1)
+        report.add('train', best, mean, rows=n_rows, engine='streaming')
+    if not in_memory:
+        return
+
+    best, mean, df = time_call(lambda: load_dataset(csv_path), repeat=repeat)
+    report.add('load_dataset', best, mean, rows=n_rows, bytes=os.path.getsize(csv_path))
+    best, mean, (X, y) = time_call(lambda: split_features_target(df), repeat=repeat)
+    report.add('split_features_target', best, mean, rows=n_rows)
+
+    model = None
+    if 'sklearn' in engines:
+        best, mean, out = time_call(lambda: train_linear_regression(X, y), repeat=repeat)
+        report.add('train', best, mean, rows=n_rows, engine='sklearn')
+        model = out[0]
+    if 'numpy' in engines:
+        Xa, ya = X.to_numpy(dtype=np.float64), y.to_numpy(dtype=np.float64)
+        best, mean, np_model = time_call(lambda: _train_numpy(Xa, ya), repeat=repeat)
+        report.add('train', best, mean, rows=n_rows, engine='numpy')
+        model = model or np_model
+    if model is None:
+        return
+
+    zip_path = os.path.join(workdir, 'bench_model.zip')
+    best, mean, _ = time_call(lambda: save_model_zip(model, list(FEATURE_COLUMNS), zip_path), repeat=repeat)
+    report.add('save_model_zip', best, mean)
+    best, mean, _ = time_call(lambda: load_model_zip(zip_path), repeat=repeat)
+    report.add('load_model_zip', best, mean)
+    best, mean, (scorer, _) = time_call(lambda: load_scorer_zip(zip_path), repeat=repeat)
+    report.add('load_scorer_zip', best, mean)
+
+    row = X.iloc[0].tolist()
+    Xa = X.to_numpy(dtype=np.float64)
+    best, mean, _ = time_call(lambda: model.predict(Xa[:1]), repeat=repeat, number=200)
+    report.add('predict_single', best, mean, rows=1, engine='sklearn')
+    best, mean, _ = time_call(lambda: scorer.predict([row]), repeat=repeat, number=2000)
+    report.add('predict_single', best, mean, rows=1, engine='numpy')
+    best, mean, _ = time_call(lambda: scorer.predict_one(row), repeat=repeat, number=2000)
+    report.add('predict_single', best, mean, rows=1, engine='predict_one')
+    best, mean, _ = time_call(lambda: model.predict(Xa), repeat=repeat)
+    report.add('predict_batch', best, mean, rows=n_rows, engine='sklearn')
+    best, mean, _ = time_call(lambda: scorer.predict(Xa), repeat=repeat)
+    report.add('predict_batch', best, mean, rows=n_rows, engine='numpy')
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark house price train/load/predict hot paths")
+    parser.add_argument("--rows", type=int, nargs='+', default=[1_000, 10_000, 100_000, 1_000_000],
+                        help="Dataset sizes to benchmark (10^3 .. 10^8)")
+    parser.add_argument("--engines", nargs='+', choices=ENGINES, default=list(ENGINES), help="Training engines to compare")
+    parser.add_argument("--repeat", type=int, default=3, help="Timing rounds per measurement (best is reported)")
+    parser.add_argument("--max_in_memory_rows", type=int, default=20_000_000,
+                        help="Above this size only the streaming engine runs")
+    parser.add_argument("--workdir", default=os.path.join(tempfile.gettempdir(), 'house_price_bench'),
+                        help="Directory for cached synthetic CSVs")
+    parser.add_argument("--out", default="house_price_prediction/benchmarks/results/hot_paths.json", help="JSON report path")
+    args = parser.parse_args()
+
+    os.makedirs(args.workdir, exist_ok=True)
+    report = BenchmarkReport('hot_paths')
+    for n_rows in args.rows:
+        print(f"\n=== {n_rows} rows ===")
+        csv_path = ensure_housing_csv(args.workdir, n_rows)
+        bench_size(report, csv_path, n_rows, args.engines, args.repeat,
+                   in_memory=n_rows <= args.max_in_memory_rows, workdir=args.workdir)
+    report.write(args.out)
+
+
+if __name__ == "__main__":
+    main()
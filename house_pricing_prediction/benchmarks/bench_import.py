@@ -0,0 +1,97 @@
+"""Measure cold import time of the house price entry points.
+
+Each module is imported in a fresh interpreter (``python -X importtime``) so
+results reflect what a cron-launched job pays before doing any work.
+
+Example:
+    python -m house_price_prediction.benchmarks.bench_import --repeat 5
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+from house_price_prediction.benchmarks.harness import BenchmarkReport
+
+DEFAULT_MODULES = [
+    'house_price_prediction.core.scorer',
+    'house_price_prediction.core.registry',
+    'house_price_prediction.core.data_loader',
+    'house_price_prediction.core.model_utils',
+    'house_price_prediction.ui.web.app',
+    'house_price_prediction.train_console',
+    'customer_bonus.customer_cluster_analysis',
+]
+
+# Heavy dependencies that entry points should only load on first use.
+HEAVY_MODULES = ['sklearn', 'matplotlib', 'seaborn', 'plotly', 'flask', 'PyQt6', 'tkinter', 'mysql']
+
+_PROBE = (
+    "import importlib, json, sys, time\n"
+    "t = time.perf_counter()\n"
+    "importlib.import_module({module!r})\n"
+    "elapsed = time.perf_counter() - t\n"
+    "heavy = sorted(m for m in {heavy!r} if m in sys.modules)\n"
+    "print(json.dumps({{'seconds': elapsed, 'heavy': heavy}}))\n"
+)
+
+
+def _parse_importtime(stderr: str, top: int):
+    """Return the ``top`` imports by cumulative microseconds from ``-X importtime`` output."""
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        parts = line[len('import time:'):].split('|')
+        if len(parts) != 3:
+            continue
+        try:
+            rows.append((int(parts[1]), parts[2].strip()))
+        except ValueError:
+            continue
+    rows.sort(reverse=True)
+    return [{'module': name, 'cumulative_us': us} for us, name in rows[:top]]
+
+
+def measure(module: str, repeat: int, top: int):
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(p for p in sys.path if p))
+    code = _PROBE.format(module=module, heavy=HEAVY_MODULES)
+    times, heavy, slowest = [], [], []
+    for _ in range(max(repeat, 1)):
+        proc = subprocess.run([sys.executable, '-X', 'importtime', '-c', code],
+                              capture_output=True, text=True, env=env)
+        if proc.returncode != 0:
+            err = proc.stderr.strip().splitlines()
+            return {'error': err[-1] if err else f'exit code {proc.returncode}'}
+        result = json.loads(proc.stdout.strip().splitlines()[-1])
+        times.append(result['seconds'])
+        heavy = result['heavy']
+        slowest = _parse_importtime(proc.stderr, top)
+    return {'best': min(times), 'mean': sum(times) / len(times), 'heavy': heavy, 'slowest': slowest}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark cold import time of entry points")
+    parser.add_argument("--modules", nargs='+', default=DEFAULT_MODULES, help="Modules to import")
+    parser.add_argument("--repeat", type=int, default=3, help="Fresh interpreters per module (best is reported)")
+    parser.add_argument("--top", type=int, default=10, help="Slowest imports to record per module")
+    parser.add_argument("--out", default="house_price_prediction/benchmarks/results/import_time.json", help="JSON report path")
+    args = parser.parse_args()
+
+    report = BenchmarkReport('import_time')
+    for module in args.modules:
+        result = measure(module, args.repeat, args.top)
+        if 'error' in result:
+            print(f"{module:<40} failed: {result['error']}")
+            report.records.append({'step': 'import', 'engine': module, 'error': result['error']})
+            continue
+        report.add('import', result['best'], result['mean'], engine=module,
+                   heavy_modules=result['heavy'], slowest_imports=result['slowest'])
+        if result['heavy']:
+            print(f"  eagerly loaded: {', '.join(result['heavy'])}")
+    report.write(args.out)
+
+
+if __name__ == "__main__":
+    main()
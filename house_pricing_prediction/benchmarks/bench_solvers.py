@@ -0,0 +1,91 @@
+"""Benchmark the closed-form OLS solvers against scikit-learn's LinearRegression.
+
+Example:
+    python -m house_price_prediction.benchmarks.bench_solvers --rows 10000 1000000
+
+Each size is fitted on synthetic USA_Housing.csv-schema data twice: on the
+five raw features, and on their raw degree-2 expansion (20 badly scaled,
+nearly collinear columns) where the normal equations lose precision. Every
+solver is timed; its training RMSE is compared with the best one found, and
+its coefficients with that best fit's (relative error).
+"""
+import argparse
+
+import numpy as np
+
+from house_price_prediction.benchmarks.harness import BenchmarkReport, time_call
+from house_price_prediction.benchmarks.synthetic import make_housing_frame
+from house_price_prediction.core.data_loader import FEATURE_COLUMNS, TARGET_COLUMN
+from house_price_prediction.core.pipeline import FeaturePipeline
+from house_price_prediction.core.solvers import SOLVERS, least_squares
+
+METHODS = ('sklearn', 'inv', *SOLVERS, 'auto')
+
+
+def _fit_sklearn(X, y):
+    from sklearn.linear_model import LinearRegression
+
+    model = LinearRegression().fit(X, y)
+    return model.coef_, float(model.intercept_)
+
+
+def _fit_inv(X, y):
+    # The textbook (X'X)^-1 X'y with a column of ones, as MLR_mannual.py used to do.
+    A = np.column_stack([np.ones(X.shape[0]), X])
+    b = np.linalg.inv(A.T @ A) @ (A.T @ y)
+    return b[1:], float(b[0])
+
+
+def _fitter(method):
+    if method == 'sklearn':
+        return _fit_sklearn
+    if method == 'inv':
+        return _fit_inv
+    return lambda X, y: least_squares(X, y, method=method)
+
+
+def bench_design(report: BenchmarkReport, name: str, X: np.ndarray, y: np.ndarray, methods, repeat: int):
+    results = {}
+    for method in methods:
+        try:
+            best, mean, (coef, intercept) = time_call(lambda: _fitter(method)(X, y), repeat=repeat)
+        except np.linalg.LinAlgError as e:
+            print(f"{method:<10} {name}: failed ({e})")
+            continue
+        resid = y - (X @ coef + intercept)
+        results[method] = (best, mean, coef, float(np.sqrt(resid @ resid / y.shape[0])))
+    ref = min(results.values(), key=lambda r: r[3])
+    best_rmse = ref[3]
+    for method, (best, mean, coef, rmse) in results.items():
+        rel_err = float(np.linalg.norm(coef - ref[2]) / max(np.linalg.norm(ref[2]), 1e-300))
+        report.add('fit', best, mean, rows=X.shape[0], engine=method, design=name, n_features=X.shape[1],
+                   coef_rel_err=rel_err, rmse=rmse, rmse_excess=rmse / best_rmse - 1.0)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare Cholesky/QR/SVD least squares with sklearn")
+    parser.add_argument("--rows", type=int, nargs='+', default=[10_000, 100_000, 1_000_000],
+                        help="Dataset sizes to benchmark")
+    parser.add_argument("--methods", nargs='+', choices=METHODS, default=list(METHODS), help="Solvers to compare")
+    parser.add_argument("--repeat", type=int, default=3, help="Timing rounds per measurement (best is reported)")
+    parser.add_argument("--out", default="house_price_prediction/benchmarks/results/solvers.json", help="JSON report path")
+    args = parser.parse_args()
+
+    report = BenchmarkReport('solvers')
+    for n_rows in args.rows:
+        df = make_housing_frame(n_rows)
+        X = df[FEATURE_COLUMNS].to_numpy(dtype=np.float64)
+        y = df[TARGET_COLUMN].to_numpy(dtype=np.float64)
+        print(f"\n=== {n_rows} rows, raw features ===")
+        bench_design(report, 'raw', X, y, args.methods, args.repeat)
+        print(f"\n=== {n_rows} rows, raw degree-2 terms ===")
+        X2 = FeaturePipeline(degree=2).fit_transform(df[FEATURE_COLUMNS])
+        bench_design(report, 'poly2', X2, y, args.methods, args.repeat)
+        for r in report.records[-2 * len(args.methods):]:
+            print(f"  {r['design']:<6} {r['engine']:<8} coef_rel_err={r['coef_rel_err']:.2e} "
+                  f"rmse_excess={r['rmse_excess']:.2e}")
+    report.write(args.out)
+
+
+if __name__ == "__main__":
+    main()
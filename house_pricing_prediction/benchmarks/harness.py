@@ -0,0 +1,83 @@
+"""Timing, peak-RSS and JSON reporting helpers shared by the benchmarks."""
+import json
+import os
+import platform
+import sys
+import time
+from datetime import datetime, timezone
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+def peak_rss_mb() -> float:
+    """Peak resident set size of this process so far, in MiB (0.0 if unavailable)."""
+    if resource is None:
+        return 0.0
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS reports bytes.
+    return peak / (1024.0 * 1024.0) if sys.platform == 'darwin' else peak / 1024.0
+
+
+def time_call(fn, repeat: int = 3, number: int = 1):
+    """Run ``fn`` ``number`` times per round for ``repeat`` rounds.
+
+    Returns ``(best, mean, result)`` where the times are seconds per call and
+    ``result`` is the last return value.
+    """
+    times = []
+    result = None
+    for _ in range(max(repeat, 1)):
+        start = time.perf_counter()
+        for _ in range(number):
+            result = fn()
+        times.append((time.perf_counter() - start) / number)
+    return min(times), sum(times) / len(times), result
+
+
+class BenchmarkReport:
+    """Collect benchmark records and write them as one JSON document."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.records = []
+
+    def add(self, step: str, best: float, mean: float, rows: int = 0, engine: str = '', **extra):
+        record = {
+            'step': step,
+            'engine': engine,
+            'rows': rows,
+            'best_s': best,
+            'mean_s': mean,
+            'rows_per_s': rows / best if rows and best > 0 else None,
+            'peak_rss_mb': round(peak_rss_mb(), 1),
+        }
+        record.update(extra)
+        self.records.append(record)
+        label = f"{step}[{engine}]" if engine else step
+        print(f"{label:<40} rows={rows:<11} best={best * 1e3:10.3f} ms  peak_rss={record['peak_rss_mb']} MiB")
+        return record
+
+    def to_dict(self) -> dict:
+        try:
+            import numpy
+            numpy_version = numpy.__version__
+        except ImportError:
+            numpy_version = None
+        return {
+            'benchmark': self.name,
+            'created': datetime.now(timezone.utc).isoformat(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'numpy': numpy_version,
+            'cpu_count': os.cpu_count(),
+            'results': self.records,
+        }
+
+    def write(self, path: str):
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as fh:
+            json.dump(self.to_dict(), fh, indent=2)
+        print(f"\nResults written to: {os.path.abspath(path)}")
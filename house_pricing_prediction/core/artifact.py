@@ -0,0 +1,325 @@
+"""Versioned model artifact: JSON manifest + raw coefficient arrays, no pickle.
+
+An artifact is still a ``.zip`` (so the registry, downloads and existing
+file names keep working), but every entry is stored uncompressed:
+
+* ``manifest.json``: format name and version, feature names, training
+  metadata, and for each array its entry name, dtype, shape and SHA-256.
+* ``coefficients.f64``: ``[intercept, coef_0, ..., coef_n-1]`` as
+  little-endian float64, aligned to 64 bytes inside the file so it can be
+  ``np.memmap``-ed in place.
+* ``feature_names.json``: kept so readers from before the manifest still
+  load the file.
+
+Models trained with a ``FeaturePipeline`` also store its parameters under
+``pipeline`` in the manifest and its fitted statistics as more aligned
+arrays (``pipeline_<name>.f64``). Those artifacts are written as format
+version 2 and leave out ``feature_names.json``, so older readers refuse
+them instead of scoring raw inputs with the wrong coefficients.
+
+``load_artifact`` never runs arbitrary pickled code. Zips from before this
+format that carry ``coefficients.f64`` load the same way. Zips holding only
+``model.pkl`` are read with a restricted unpickler that resolves nothing but
+scikit-learn's ``LinearRegression`` (as a plain attribute holder, without
+importing sklearn) and the NumPy array/dtype/scalar constructors; any other
+global raises ``LegacyPickleError`` unless the caller opts in to full pickle
+with ``allow_pickle=True`` (for files it trusts).
+``python -m house_price_prediction.core.artifact upgrade`` rewrites legacy zips
+once in the new format.
+"""
+import argparse
+import hashlib
+import json
+import io
+import os
+import pickle
+import struct
+import zipfile
+from datetime import datetime, timezone
+from typing import List, Optional
+
+import numpy as np
+
+from house_price_prediction.core.metrics import timed
+from house_price_prediction.core.pipeline import FeaturePipeline
+from house_price_prediction.core.scorer import COEF_DTYPE, COEF_ENTRY, LinearScorer, coefficients_to_bytes
+
+FORMAT_NAME = 'house-price-linear-model'
+FORMAT_VERSION = 2
+# Artifacts without a feature pipeline are still written as version 1.
+PLAIN_FORMAT_VERSION = 1
+MANIFEST_ENTRY = 'manifest.json'
+FEATURE_NAMES_ENTRY = 'feature_names.json'
+LEGACY_PICKLE_ENTRY = 'model.pkl'
+ARRAY_ALIGNMENT = 64
+
+_LOCAL_HEADER = struct.Struct('<IHHHHHIIIHH')
+# Extra-field id used for alignment padding (the one Android's zipalign uses).
+_PADDING_ID = 0xD935
+
+
+class ArtifactError(ValueError):
+    """The file is not a valid model artifact (bad manifest, checksum, layout)."""
+
+
+class LegacyPickleError(ArtifactError):
+    """The zip only has a pickled estimator and pickle loading was not allowed."""
+
+
+# Globals a pickled ``LinearRegression`` from the legacy zips may reference.
+_LEGACY_ESTIMATORS = {
+    ('sklearn.linear_model._base', 'LinearRegression'),
+    ('sklearn.linear_model', 'LinearRegression'),
+}
+_LEGACY_NUMPY_GLOBALS = {
+    ('numpy', 'ndarray'),
+    ('numpy', 'dtype'),
+    ('numpy._core.multiarray', '_reconstruct'),
+    ('numpy._core.multiarray', 'scalar'),
+    ('numpy.core.multiarray', '_reconstruct'),
+    ('numpy.core.multiarray', 'scalar'),
+}
+
+
+class _LegacyEstimator:
+    """Stand-in for the pickled ``LinearRegression``: keeps its state, runs nothing."""
+
+    def __setstate__(self, state):
+        if not isinstance(state, dict):
+            raise pickle.UnpicklingError("Unexpected estimator state")
+        self.__dict__.update(state)
+
+
+class _RestrictedUnpickler(pickle.Unpickler):
+    """Unpickler for legacy ``model.pkl`` entries that only resolves allowed globals."""
+
+    def find_class(self, module, name):
+        if (module, name) in _LEGACY_ESTIMATORS:
+            return _LegacyEstimator
+        if (module, name) in _LEGACY_NUMPY_GLOBALS:
+            return super().find_class(module, name)
+        raise LegacyPickleError(f"Refusing to unpickle {module}.{name}")
+
+
+def _load_legacy_pickle(raw: bytes, path: str):
+    try:
+        model = _RestrictedUnpickler(io.BytesIO(raw)).load()
+    except LegacyPickleError as e:
+        raise LegacyPickleError(
+            f"{path} holds a pickled model this reader cannot load safely ({e}). If you trust the file, convert it "
+            f"once with 'python -m house_price_prediction.core.artifact upgrade --allow-pickle {path}' "
+            f"or load it with allow_pickle=True.") from e
+    except (pickle.UnpicklingError, EOFError, AttributeError, TypeError, ValueError) as e:
+        raise ArtifactError(f"Corrupt {LEGACY_PICKLE_ENTRY} in {path}: {e}") from e
+    if not isinstance(model, _LegacyEstimator) or not hasattr(model, 'coef_') or not hasattr(model, 'intercept_'):
+        raise ArtifactError(f"{LEGACY_PICKLE_ENTRY} in {path} is not a fitted LinearRegression")
+    return model
+
+
+def _sha256(raw: bytes) -> str:
+    return hashlib.sha256(raw).hexdigest()
+
+
+def _write_aligned(zf: zipfile.ZipFile, name: str, data: bytes):
+    """Write ``data`` stored, padding the local header so the data starts aligned."""
+    info = zipfile.ZipInfo(name, date_time=(1980, 1, 1, 0, 0, 0))
+    info.compress_type = zipfile.ZIP_STORED
+    start = zf.fp.tell() + _LOCAL_HEADER.size + len(name.encode('utf-8'))
+    pad = (-(start + 4)) % ARRAY_ALIGNMENT
+    info.extra = struct.pack('<HH', _PADDING_ID, pad) + b'\0' * pad
+    zf.writestr(info, data)
+
+
+def _array_spec(entry: str, raw: bytes, shape) -> dict:
+    return {'entry': entry, 'dtype': COEF_DTYPE.str, 'shape': list(shape), 'sha256': _sha256(raw)}
+
+
+def save_artifact(out_path: str, coef, intercept: float, feature_names: List[str],
+                  metadata: Optional[dict] = None, pipeline: Optional[FeaturePipeline] = None) -> dict:
+    """Write a linear model artifact to ``out_path`` and return its manifest.
+
+    With a fitted ``pipeline``, ``coef`` matches its ``output_names`` and
+    ``feature_names`` its ``input_columns``. The file is written next to
+    ``out_path`` and moved into place, so a registry watching the directory
+    never sees a half-written zip and readers that mapped the previous
+    version keep a valid file.
+    """
+    coef = np.ravel(np.asarray(coef, dtype=np.float64))
+    feature_names = [str(f) for f in feature_names]
+    coef_names = feature_names if pipeline is None else pipeline.output_names
+    if pipeline is not None and feature_names != pipeline.input_columns:
+        raise ValueError(f"Feature names {feature_names} do not match the pipeline inputs {pipeline.input_columns}")
+    if coef.shape[0] != len(coef_names):
+        raise ValueError(f"{coef.shape[0]} coefficients for {len(coef_names)} feature names")
+    raw = coefficients_to_bytes(coef, intercept)
+    arrays = {COEF_ENTRY: raw}
+    manifest = {
+        'format': FORMAT_NAME,
+        'format_version': PLAIN_FORMAT_VERSION if pipeline is None else FORMAT_VERSION,
+        'created_at': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'model': 'LinearRegression',
+        'feature_names': feature_names,
+        'arrays': {
+            'coefficients': dict(_array_spec(COEF_ENTRY, raw, [coef.shape[0] + 1]),
+                                 layout=['intercept', *coef_names]),
+        },
+        'training': dict(metadata or {}),
+    }
+    if pipeline is not None:
+        spec, values = pipeline.to_manifest()
+        manifest['pipeline'] = spec
+        for name, value in values.items():
+            entry = f'pipeline_{name}.f64'
+            arrays[entry] = value.astype(COEF_DTYPE).tobytes()
+            manifest['arrays'][f'pipeline.{name}'] = _array_spec(entry, arrays[entry], value.shape)
+    out_dir = os.path.dirname(os.path.abspath(out_path))
+    os.makedirs(out_dir, exist_ok=True)
+    tmp = f'{out_path}.tmp{os.getpid()}'
+    try:
+        with zipfile.ZipFile(tmp, mode='w', compression=zipfile.ZIP_STORED) as zf:
+            zf.writestr(MANIFEST_ENTRY, json.dumps(manifest, indent=2))
+            for entry, data in arrays.items():
+                _write_aligned(zf, entry, data)
+            if pipeline is None:
+                zf.writestr(FEATURE_NAMES_ENTRY, json.dumps(feature_names))
+        os.replace(tmp, out_path)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
+    return manifest
+
+
+def _data_offset(path: str, info: zipfile.ZipInfo) -> int:
+    with open(path, 'rb') as fh:
+        fh.seek(info.header_offset)
+        fields = _LOCAL_HEADER.unpack(fh.read(_LOCAL_HEADER.size))
+    if fields[0] != 0x04034B50:
+        raise ArtifactError(f"Corrupt local header for {info.filename}")
+    return info.header_offset + _LOCAL_HEADER.size + fields[9] + fields[10]
+
+
+def read_manifest(path: str) -> Optional[dict]:
+    """The artifact's manifest, or ``None`` for a zip written before the format."""
+    with zipfile.ZipFile(path, mode='r') as zf:
+        if MANIFEST_ENTRY not in zf.namelist():
+            return None
+        return json.loads(zf.read(MANIFEST_ENTRY).decode('utf-8'))
+
+
+def read_array(path: str, manifest: dict, name: str, mmap: bool = False, verify: bool = True) -> np.ndarray:
+    """Return array ``name`` from the manifest, copied or memory-mapped in place."""
+    spec = manifest['arrays'][name]
+    dtype = np.dtype(spec['dtype'])
+    shape = tuple(spec['shape'])
+    with zipfile.ZipFile(path, mode='r') as zf:
+        info = zf.getinfo(spec['entry'])
+        if info.compress_type != zipfile.ZIP_STORED:
+            raise ArtifactError(f"{spec['entry']} must be stored uncompressed")
+        if info.file_size != dtype.itemsize * int(np.prod(shape)):
+            raise ArtifactError(f"{spec['entry']} has {info.file_size} bytes, expected shape {shape} of {dtype}")
+        try:
+            raw = None if mmap and not verify else zf.read(info)
+        except zipfile.BadZipFile as e:
+            raise ArtifactError(f"Corrupt {spec['entry']} in {path}: {e}") from e
+    if raw is not None and verify and _sha256(raw) != spec['sha256']:
+        raise ArtifactError(f"Checksum mismatch for {spec['entry']} in {path}")
+    if mmap:
+        return np.memmap(path, dtype=dtype, mode='r', offset=_data_offset(path, info), shape=shape)
+    return np.frombuffer(raw, dtype=dtype).reshape(shape)
+
+
+def _check_manifest(manifest: dict, path: str):
+    if manifest.get('format') != FORMAT_NAME:
+        raise ArtifactError(f"Not a {FORMAT_NAME} artifact: {path}")
+    version = manifest.get('format_version')
+    if not isinstance(version, int) or version > FORMAT_VERSION:
+        raise ArtifactError(f"Unsupported artifact version {version!r} in {path} (this reader supports {FORMAT_VERSION})")
+
+
+def _read_pipeline(path: str, manifest: dict) -> Optional[FeaturePipeline]:
+    spec = manifest.get('pipeline')
+    if spec is None:
+        return None
+    prefix = 'pipeline.'
+    arrays = {name[len(prefix):]: read_array(path, manifest, name)
+              for name in manifest['arrays'] if name.startswith(prefix)}
+    try:
+        pipeline = FeaturePipeline.from_manifest(spec, arrays)
+    except (KeyError, TypeError, ValueError) as e:
+        raise ArtifactError(f"Invalid feature pipeline in {path}: {e}") from e
+    if pipeline.input_columns != manifest['feature_names']:
+        raise ArtifactError(f"Pipeline inputs do not match feature names in {path}")
+    return pipeline
+
+
+def load_artifact(path: str, allow_pickle: bool = False) -> LinearScorer:
+    """Load ``path`` as a ``LinearScorer`` without executing any pickled code.
+
+    Reads the manifest format (applying a stored feature pipeline), then
+    legacy zips carrying ``coefficients.f64``, then legacy zips with only
+    ``model.pkl`` through the restricted unpickler. A pickle referencing
+    anything besides ``LinearRegression`` and NumPy arrays raises
+    ``LegacyPickleError`` unless ``allow_pickle`` is set.
+    """
+    with timed('load_model_zip') as t:
+        t.bytes_read = os.path.getsize(path)
+        manifest = read_manifest(path)
+        if manifest is not None:
+            _check_manifest(manifest, path)
+            values = read_array(path, manifest, 'coefficients')
+            feature_names = manifest['feature_names']
+            pipeline = _read_pipeline(path, manifest)
+            coef_names = feature_names if pipeline is None else pipeline.output_names
+            if values.shape[0] != len(coef_names) + 1:
+                raise ArtifactError(f"Coefficient count does not match feature names in {path}")
+            scorer = LinearScorer(values[1:], values[0], feature_names, pipeline=pipeline)
+            scorer.manifest = manifest
+            return scorer
+        with zipfile.ZipFile(path, mode='r') as zf:
+            names = zf.namelist()
+            feature_names = json.loads(zf.read(FEATURE_NAMES_ENTRY).decode('utf-8'))
+            if COEF_ENTRY in names:
+                return LinearScorer.from_bytes(zf.read(COEF_ENTRY), feature_names)
+            if LEGACY_PICKLE_ENTRY not in names:
+                raise ArtifactError(f"No coefficients in {path}")
+            raw = zf.read(LEGACY_PICKLE_ENTRY)
+        if allow_pickle:
+            model = pickle.loads(raw)
+        else:
+            model = _load_legacy_pickle(raw, path)
+        return LinearScorer.from_model(model, feature_names)
+
+
+def upgrade_artifact(path: str, out_path: Optional[str] = None, allow_pickle: bool = False) -> dict:
+    """Rewrite a legacy zip in the manifest format.
+
+    Pickles the restricted reader refuses are only unpickled with ``allow_pickle``.
+    """
+    scorer = load_artifact(path, allow_pickle=allow_pickle)
+    metadata = {'upgraded_from': os.path.basename(path)}
+    return save_artifact(out_path or path, scorer.coef_, scorer.intercept_, scorer.feature_names, metadata)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Inspect or upgrade house price model artifacts')
+    sub = parser.add_subparsers(dest='command', required=True)
+    show = sub.add_parser('show', help='Print the manifest of an artifact')
+    show.add_argument('paths', nargs='+')
+    up = sub.add_parser('upgrade', help='Rewrite legacy zips in the manifest format (in place)')
+    up.add_argument('paths', nargs='+')
+    up.add_argument('--allow-pickle', action='store_true',
+                    help='Fully unpickle zips the restricted reader refuses (only for trusted files)')
+    args = parser.parse_args()
+
+    for path in args.paths:
+        if args.command == 'show':
+            manifest = read_manifest(path)
+            print(json.dumps(manifest, indent=2) if manifest else f"{path}: legacy zip (no manifest)")
+        else:
+            manifest = upgrade_artifact(path, allow_pickle=args.allow_pickle)
+            print(f"Upgraded {path} ({len(manifest['feature_names'])} features)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,130 @@
+"""Coalesce concurrent single-row predictions into one vectorized call."""
+import os
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Callable, Optional, Sequence
+
+import numpy as np
+
+from house_price_prediction.core.metrics import timed
+
+
+class MicroBatcher:
+    """Queue single rows from many request threads and score them together.
+
+    A background thread takes whatever rows are queued (up to ``max_batch``),
+    waits at most ``max_wait_ms`` for more to arrive, then stacks them into one
+    matrix and calls ``model.predict`` once. ``model_getter`` is called per
+    batch, so a model swapped in by a ``ModelRegistry`` is picked up without
+    restarting. The thread is started lazily and restarted after ``fork``, so
+    a batcher created before forking workers is safe to use in each of them.
+    """
+
+    def __init__(self, model_getter: Callable[[], object], max_batch: int = 256,
+                 max_wait_ms: float = 2.0, n_features: Optional[int] = None):
+        if max_batch < 1:
+            raise ValueError("max_batch must be at least 1")
+        self.model_getter = model_getter
+        self.max_batch = max_batch
+        self.max_wait = max_wait_ms / 1000.0
+        self.n_features = n_features
+        self._lock = threading.Lock()
+        self._queue: Optional[queue.SimpleQueue] = None
+        self._thread: Optional[threading.Thread] = None
+        self._pid = None
+        self.batches = 0
+        self.rows = 0
+
+    def _ensure_started(self) -> queue.SimpleQueue:
+        if self._pid == os.getpid():
+            return self._queue
+        with self._lock:
+            if self._pid != os.getpid():
+                # First use, or first use in a forked child: threads do not survive fork.
+                self._queue = queue.SimpleQueue()
+                self._thread = threading.Thread(target=self._run, args=(self._queue,),
+                                                name='predict-micro-batcher', daemon=True)
+                self._thread.start()
+                self.batches = self.rows = 0
+                self._pid = os.getpid()
+        return self._queue
+
+    def submit(self, row: Sequence[float]) -> Future:
+        """Queue one feature row; the future resolves to its prediction (a float).
+
+        The row is validated here, in the caller's thread, so one bad request
+        cannot fail the batch it would have joined.
+        """
+        row = [float(v) for v in row]
+        if self.n_features is not None and len(row) != self.n_features:
+            raise ValueError(f"Expected {self.n_features} feature values, got {len(row)}")
+        future = Future()
+        self._ensure_started().put((row, future))
+        return future
+
+    def predict_one(self, row: Sequence[float], timeout: Optional[float] = 10.0) -> float:
+        return self.submit(row).result(timeout)
+
+    def close(self):
+        if self._pid == os.getpid():
+            self._queue.put(None)
+            self._thread.join()
+            self._pid = None
+
+    def stats(self) -> dict:
+        return {
+            'batches': self.batches,
+            'rows': self.rows,
+            'mean_batch': self.rows / self.batches if self.batches else 0.0,
+        }
+
+    def _run(self, q: queue.SimpleQueue):
+        while True:
+            item = q.get()
+            if item is None:
+                return
+            batch = [item]
+            stop = False
+            deadline = time.monotonic() + self.max_wait
+            while len(batch) < self.max_batch:
+                try:
+                    # Take what is already queued without waiting, then wait out the window.
+                    item = q.get_nowait()
+                except queue.Empty:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    try:
+                        item = q.get(timeout=remaining)
+                    except queue.Empty:
+                        break
+                if item is None:
+                    stop = True
+                    break
+                batch.append(item)
+            self._score(batch)
+            if stop:
+                return
+
+    def _score(self, batch):
+        live = [(r, f) for r, f in batch if f.set_running_or_notify_cancel()]
+        if not live:
+            return
+        try:
+            model = self.model_getter()
+            if model is None:
+                raise RuntimeError("Model not loaded. Train the model first.")
+            X = np.asarray([r for r, _ in live], dtype=np.float64)
+            with timed('predict') as t:
+                t.rows = X.shape[0]
+                preds = np.asarray(model.predict(X), dtype=np.float64).ravel().tolist()
+        except Exception as e:
+            for _, f in live:
+                f.set_exception(e)
+            return
+        self.batches += 1
+        self.rows += len(live)
+        for (_, f), p in zip(live, preds):
+            f.set_result(p)
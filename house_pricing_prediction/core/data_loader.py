@@ -1,6 +1,11 @@
 import os
+from typing import Iterator, List, Optional
+
+import numpy as np
 import pandas as pd
 
+from house_price_prediction.core.metrics import timed
+
 EXPECTED_COLUMNS = [
     'Avg Area Income',
     'Avg Area House Age',
@@ -10,41 +15,122 @@ EXPECTED_COLUMNS = [
     'Price',
 ]
 
+FEATURE_COLUMNS = EXPECTED_COLUMNS[:-1]
+TARGET_COLUMN = 'Price'
+
+# Support official USA_Housing.csv headers that include dots after 'Avg.'
+HEADER_ALIASES = {
+    'Avg. Area Income': 'Avg Area Income',
+    'Avg. Area House Age': 'Avg Area House Age',
+    'Avg. Area Number of Rooms': 'Avg Area Number of Rooms',
+    'Avg. Area Number of Bedrooms': 'Avg Area Number of Bedrooms',
+    'Area Population': 'Area Population',
+    'Price': 'Price',
+}
+
+# Rows per chunk when streaming a CSV.
+DEFAULT_CHUNKSIZE = 100_000
+
 
-def load_dataset(path: str) -> pd.DataFrame:
+def load_dataset(path: str, chunksize: Optional[int] = None, dtype=None, use_cache: bool = False,
+                 cache_dir: Optional[str] = None, progress=None):
+    """Read the whole CSV, or stream it when ``chunksize`` is given.
+
+    With ``chunksize`` this returns ``iter_dataset(path, chunksize, dtype)``
+    instead of a DataFrame. With ``use_cache``, a CSV whose columns are
+    exactly the ``EXPECTED_COLUMNS`` (in any order, dotted headers allowed)
+    is parsed once into the memory-mapped columnar cache (see
+    ``core.dataset_cache``) and returned as a zero-copy, read-only float64
+    DataFrame with the file's own headers and column order; ``progress`` is
+    then called with the rows parsed so far while the cache is being built.
+    Other files (extra text columns such as ``Address``, missing columns) are
+    read with ``pd.read_csv`` as without the cache, so both paths return the
+    same columns.
+    """
+    if chunksize is not None:
+        return iter_dataset(path, chunksize=chunksize, dtype=dtype or np.float64)
     if not os.path.exists(path):
         raise FileNotFoundError(f"Dataset not found: {path}")
-    df = pd.read_csv(path)
+    with timed('load_dataset') as t:
+        header = list(pd.read_csv(path, nrows=0).columns) if use_cache else []
+        canonical = [HEADER_ALIASES.get(c, c) for c in header]
+        if use_cache and sorted(canonical) == sorted(EXPECTED_COLUMNS):
+            from house_price_prediction.core.dataset_cache import load_cached_columns
+            columns = load_cached_columns(path, cache_dir=cache_dir, progress=progress)
+            df = pd.DataFrame({raw: columns[name] for raw, name in zip(header, canonical)}, copy=False)
+        else:
+            df = pd.read_csv(path)
+            t.bytes_read = os.path.getsize(path)
+        t.rows = len(df)
     return df
 
 
-def ensure_columns(df: pd.DataFrame):
-    # Support official USA_Housing.csv headers that include dots after 'Avg.'
-    rename_map = {
-        'Avg. Area Income': 'Avg Area Income',
-        'Avg. Area House Age': 'Avg Area House Age',
-        'Avg. Area Number of Rooms': 'Avg Area Number of Rooms',
-        'Avg. Area Number of Bedrooms': 'Avg Area Number of Bedrooms',
-        'Area Population': 'Area Population',
-        'Price': 'Price',
-    }
-    existing = {k: v for k, v in rename_map.items() if k in df.columns}
+def resolve_header(path: str, columns: List[str]):
+    """Map each wanted column to its raw header in ``path``, reading only the header row."""
+    header = pd.read_csv(path, nrows=0).columns
+    source = {}
+    for raw in header:
+        name = HEADER_ALIASES.get(raw, raw)
+        if name in columns and name not in source:
+            source[name] = raw
+    missing = [c for c in columns if c not in source]
+    if missing:
+        raise ValueError(f"Missing columns in dataset: {missing}")
+    return source
+
+
+def iter_dataset(path: str, chunksize: int = DEFAULT_CHUNKSIZE, dtype=np.float64,
+                 columns: Optional[List[str]] = None,
+                 passthrough: Optional[List[str]] = None) -> Iterator[pd.DataFrame]:
+    """Stream ``path`` as DataFrames of at most ``chunksize`` rows.
+
+    Only ``columns`` (default ``EXPECTED_COLUMNS``) are parsed, each pinned to
+    ``dtype`` (float32 or float64), and headers are normalized once from the
+    header row, so every chunk already has the canonical column names.
+    ``passthrough`` columns (e.g. an ``Address`` or listing id) follow them in
+    every chunk with the types pandas infers.
+    """
+    if not os.path.exists(path):
+        raise FileNotFoundError(f"Dataset not found: {path}")
+    numeric = list(EXPECTED_COLUMNS if columns is None else columns)
+    columns = numeric + [c for c in passthrough or [] if c not in numeric]
+    source = resolve_header(path, columns)
+    usecols = [source[c] for c in columns]
+    names = {raw: name for name, raw in source.items()}
+    reader = pd.read_csv(path, usecols=usecols, dtype={source[c]: dtype for c in numeric}, chunksize=chunksize)
+    with reader:
+        while True:
+            # Time only the parsing, not whatever the consumer does between chunks.
+            with timed('read_csv_chunk') as t:
+                chunk = next(reader, None)
+                t.rows = 0 if chunk is None else len(chunk)
+            if chunk is None:
+                return
+            chunk.columns = [names[c] for c in chunk.columns]
+            if list(chunk.columns) != columns:
+                chunk = chunk[columns]
+            yield chunk
+
+
+def ensure_columns(df: pd.DataFrame, required=None):
+    required = EXPECTED_COLUMNS if required is None else required
+    existing = {k: v for k, v in HEADER_ALIASES.items() if k in df.columns}
     if existing:
         df.rename(columns=existing, inplace=True)
 
-    missing = [c for c in EXPECTED_COLUMNS if c not in df.columns]
+    missing = [c for c in required if c not in df.columns]
     if missing:
         raise ValueError(f"Missing columns in dataset: {missing}")
 
 
 def split_features_target(df: pd.DataFrame):
     ensure_columns(df)
-    X = df[[
-        'Avg Area Income',
-        'Avg Area House Age',
-        'Avg Area Number of Rooms',
-        'Avg Area Number of Bedrooms',
-        'Area Population',
-    ]]
-    y = df['Price']
-    return X, y
\ No newline at end of file
+    X = df[FEATURE_COLUMNS]
+    y = df[TARGET_COLUMN]
+    return X, y
+
+
+def iter_features_target(chunks):
+    """Apply ``split_features_target`` to each chunk from ``iter_dataset``."""
+    for chunk in chunks:
+        yield split_features_target(chunk)
@@ -0,0 +1,153 @@
+"""Memory-mapped columnar cache for parsed housing CSVs.
+
+A CSV is parsed once into one raw little-endian float64 file per column plus
+a ``manifest.json``, stored under a directory named after the CSV's content
+hash. Later loads map those files with ``np.memmap`` and wrap them in a
+DataFrame without copying, so repeated runs skip CSV tokenizing entirely.
+"""
+import hashlib
+import json
+import os
+import shutil
+import threading
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from house_price_prediction.core.data_loader import DEFAULT_CHUNKSIZE, EXPECTED_COLUMNS, iter_dataset
+
+CACHE_VERSION = 1
+CACHE_DTYPE = np.dtype('<f8')
+DEFAULT_CACHE_DIR = os.environ.get(
+    'HOUSE_PRICE_CACHE_DIR', os.path.join(os.path.expanduser('~'), '.cache', 'house_price_prediction'))
+
+_DIGEST_INDEX = 'digests.json'
+_digest_lock = threading.Lock()
+
+
+def _cache_dir(cache_dir: Optional[str]) -> Path:
+    path = Path(cache_dir or DEFAULT_CACHE_DIR)
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+def file_digest(path: str, cache_dir: Optional[str] = None) -> str:
+    """BLAKE2b of the file contents, memoized by (path, size, mtime).
+
+    Hashing a multi-GB file takes seconds, so the digest is remembered in the
+    cache directory and only recomputed when the file's size or mtime change.
+    """
+    root = _cache_dir(cache_dir)
+    st = os.stat(path)
+    stamp = [st.st_size, st.st_mtime_ns]
+    key = os.path.abspath(path)
+    index_path = root / _DIGEST_INDEX
+    with _digest_lock:
+        try:
+            index = json.loads(index_path.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            index = {}
+        entry = index.get(key)
+        if entry and entry.get('stamp') == stamp:
+            return entry['digest']
+    h = hashlib.blake2b(digest_size=20)
+    with open(path, 'rb') as fh:
+        for block in iter(lambda: fh.read(1 << 20), b''):
+            h.update(block)
+    digest = h.hexdigest()
+    with _digest_lock:
+        try:
+            index = json.loads(index_path.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            index = {}
+        index[key] = {'stamp': stamp, 'digest': digest}
+        tmp = index_path.with_suffix('.tmp')
+        tmp.write_text(json.dumps(index), encoding='utf-8')
+        os.replace(tmp, index_path)
+    return digest
+
+
+def _column_file(i: int) -> str:
+    return f'col{i}.f64'
+
+
+def build_cache(path: str, cache_dir: Optional[str] = None, columns: Optional[List[str]] = None,
+                chunksize: int = DEFAULT_CHUNKSIZE, progress: Optional[Callable[[int], None]] = None) -> Path:
+    """Parse ``path`` once into the columnar cache and return its directory.
+
+    ``progress`` is called with the number of rows parsed so far after each
+    chunk; an exception raised from it aborts the build and removes the
+    partial entry.
+    """
+    columns = list(EXPECTED_COLUMNS if columns is None else columns)
+    root = _cache_dir(cache_dir)
+    digest = file_digest(path, cache_dir)
+    target = root / digest
+    if columns != EXPECTED_COLUMNS:
+        # Custom column sets get their own entry so they never shadow the default one.
+        target = root / f"{digest}-{hashlib.blake2b('|'.join(columns).encode('utf-8'), digest_size=6).hexdigest()}"
+    if (target / 'manifest.json').exists():
+        return target
+    tmp = root / f'{target.name}.tmp{os.getpid()}'
+    shutil.rmtree(tmp, ignore_errors=True)
+    tmp.mkdir(parents=True)
+    try:
+        n_rows = 0
+        handles = [open(tmp / _column_file(i), 'wb') for i in range(len(columns))]
+        try:
+            for chunk in iter_dataset(path, chunksize=chunksize, dtype=np.float64, columns=columns):
+                for i, col in enumerate(columns):
+                    handles[i].write(chunk[col].to_numpy(dtype=CACHE_DTYPE).tobytes())
+                n_rows += len(chunk)
+                if progress is not None:
+                    progress(n_rows)
+        finally:
+            for fh in handles:
+                fh.close()
+        manifest = {
+            'version': CACHE_VERSION,
+            'source': os.path.abspath(path),
+            'digest': digest,
+            'rows': n_rows,
+            'dtype': CACHE_DTYPE.str,
+            'columns': [{'name': c, 'file': _column_file(i)} for i, c in enumerate(columns)],
+        }
+        (tmp / 'manifest.json').write_text(json.dumps(manifest, indent=2), encoding='utf-8')
+        try:
+            os.replace(tmp, target)
+        except OSError:
+            # Another process finished the same cache first.
+            shutil.rmtree(tmp, ignore_errors=True)
+    except Exception:
+        shutil.rmtree(tmp, ignore_errors=True)
+        raise
+    return target
+
+
+def load_cached_columns(path: str, cache_dir: Optional[str] = None, columns: Optional[List[str]] = None,
+                        progress: Optional[Callable[[int], None]] = None) -> Dict[str, np.ndarray]:
+    """Return ``{column: read-only memmap}`` for ``path``, building the cache if needed."""
+    target = build_cache(path, cache_dir=cache_dir, columns=columns, progress=progress)
+    manifest = json.loads((target / 'manifest.json').read_text(encoding='utf-8'))
+    wanted = [c['name'] for c in manifest['columns']] if columns is None else list(columns)
+    files = {c['name']: c['file'] for c in manifest['columns']}
+    missing = [c for c in wanted if c not in files]
+    if missing:
+        raise ValueError(f"Columns not in cache for {path}: {missing}")
+    n_rows = manifest['rows']
+    out = {}
+    for name in wanted:
+        if n_rows == 0:
+            out[name] = np.empty(0, dtype=manifest['dtype'])
+        else:
+            out[name] = np.memmap(target / files[name], dtype=manifest['dtype'], mode='r', shape=(n_rows,))
+    return out
+
+
+def load_cached_dataset(path: str, cache_dir: Optional[str] = None, columns: Optional[List[str]] = None,
+                        progress: Optional[Callable[[int], None]] = None) -> pd.DataFrame:
+    """DataFrame view over the cached memmaps; no column data is copied."""
+    columns_map = load_cached_columns(path, cache_dir=cache_dir, columns=columns, progress=progress)
+    return pd.DataFrame(columns_map, copy=False)
@@ -0,0 +1,383 @@
+"""Regularized and robust linear regression engines.
+
+Every engine fits ``coef`` and an unpenalized ``intercept``. Ridge, lasso
+and elastic net follow the scikit-learn objective of the same name, so
+results line up with ``sklearn.linear_model.Ridge``/``Lasso``/``ElasticNet``:
+
+* ``ridge``: ``||y - Xb||² + alpha·||b||²``
+* ``lasso`` / ``elasticnet``: ``1/(2n)·||y - Xb||² + alpha·l1_ratio·||b||₁
+  + alpha·(1 - l1_ratio)/2·||b||²`` (``lasso`` is ``l1_ratio=1``)
+* ``huber``: this module's own iteratively reweighted least squares with
+  Huber weights (``epsilon`` robust scales, the scale re-estimated from the
+  residual MAD each iteration) plus ``alpha·||b||²``. It is not
+  ``sklearn.linear_model.HuberRegressor``, which optimizes the coefficients
+  and the scale jointly in one objective, so coefficients differ from it.
+* ``cholesky`` / ``qr`` / ``svd``: plain least squares through the
+  closed-form solvers in ``core.solvers``.
+
+Ridge, lasso and elastic net only need the centered Gram matrix ``XᵀX`` and
+``Xᵀy`` (``GramStats``), built once from the data, or from the streaming
+``IncrementalLeastSquares`` accumulator. ``path`` then solves a whole list
+of alphas off that one matrix: ridge through a single eigendecomposition,
+coordinate descent warm-started from the previous alpha's coefficients.
+Huber needs the rows themselves, but its path is warm-started the same way.
+"""
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from house_price_prediction.core.solvers import blocked_gram, solve_cholesky, solve_qr, solve_svd
+
+
+class GramStats:
+    """Centered sufficient statistics of a least-squares problem.
+
+    ``gram = XcᵀXc`` and ``xty = Xcᵀyc`` with ``Xc``/``yc`` centered on the
+    column means, so the intercept stays out of every penalty.
+    """
+
+    def __init__(self, gram, xty, x_mean, y_mean: float, n: int):
+        self.gram = np.asarray(gram, dtype=np.float64)
+        self.xty = np.asarray(xty, dtype=np.float64)
+        self.x_mean = np.asarray(x_mean, dtype=np.float64)
+        self.y_mean = float(y_mean)
+        self.n = int(n)
+
+    @classmethod
+    def from_arrays(cls, X, y) -> 'GramStats':
+        gram, xty, x_mean, y_mean = blocked_gram(X, y)
+        return cls(gram, xty, x_mean, y_mean, np.shape(X)[0])
+
+    @property
+    def n_features(self) -> int:
+        return self.xty.shape[0]
+
+    def intercept(self, coef) -> float:
+        return self.y_mean - float(self.x_mean @ coef)
+
+
+class LinearEngine:
+    """Base class: ``fit`` one model, ``path`` a sequence of ``alphas``.
+
+    ``fit(X, y, coef_init=...)`` warm-starts iterative engines from earlier
+    coefficients; after it, ``coef_``, ``intercept_`` and ``n_iter_`` are set.
+    """
+
+    name = 'base'
+    uses_gram = True
+
+    def __init__(self, alpha: float = 1.0, max_iter: int = 1000, tol: float = 1e-4):
+        if alpha < 0:
+            raise ValueError("alpha must be non-negative")
+        self.alpha = float(alpha)
+        self.max_iter = int(max_iter)
+        self.tol = float(tol)
+        self.coef_: Optional[np.ndarray] = None
+        self.intercept_ = 0.0
+        self.n_iter_ = 0
+
+    def get_params(self) -> dict:
+        return {'alpha': self.alpha, 'max_iter': self.max_iter, 'tol': self.tol}
+
+    def fit(self, X, y, coef_init=None) -> 'LinearEngine':
+        return self.fit_gram(GramStats.from_arrays(X, y), coef_init)
+
+    def fit_gram(self, stats: GramStats, coef_init=None) -> 'LinearEngine':
+        coef, self.n_iter_ = self._solve(stats, self.alpha, coef_init)
+        self.coef_ = coef
+        self.intercept_ = stats.intercept(coef)
+        return self
+
+    def _solve(self, stats: GramStats, alpha: float, coef_init) -> Tuple[np.ndarray, int]:
+        raise NotImplementedError
+
+    def default_alphas(self, stats: GramStats, n_alphas: int = 20, eps: float = 1e-3) -> np.ndarray:
+        """Log-spaced alphas from one that (nearly) zeroes every coefficient down by ``eps``."""
+        alpha_max = self._alpha_max(stats)
+        return np.logspace(np.log10(alpha_max), np.log10(alpha_max * eps), n_alphas)
+
+    def _alpha_max(self, stats: GramStats) -> float:
+        return float(np.abs(np.diag(stats.gram)).max()) or 1.0
+
+    def path(self, X, y, alphas: Optional[Sequence[float]] = None, n_alphas: int = 20,
+             coef_init=None) -> List[dict]:
+        """Fit every alpha (largest first) off one Gram matrix, warm-starting each fit."""
+        return self.path_gram(GramStats.from_arrays(X, y), alphas, n_alphas, coef_init)
+
+    def path_gram(self, stats: GramStats, alphas: Optional[Sequence[float]] = None, n_alphas: int = 20,
+                  coef_init=None) -> List[dict]:
+        if alphas is None:
+            alphas = self.default_alphas(stats, n_alphas)
+        results = []
+        coef = coef_init
+        for alpha in sorted((float(a) for a in alphas), reverse=True):
+            coef, n_iter = self._solve(stats, alpha, coef)
+            results.append(_path_record(alpha, coef, stats.intercept(coef), n_iter))
+        return results
+
+    def __repr__(self):
+        params = ', '.join(f"{k}={v!r}" for k, v in self.get_params().items())
+        return f"{type(self).__name__}({params})"
+
+
+def _path_record(alpha: float, coef: np.ndarray, intercept: float, n_iter: int) -> dict:
+    return {'alpha': alpha, 'coef': coef, 'intercept': intercept, 'n_iter': n_iter,
+            'nonzero': int(np.count_nonzero(coef))}
+
+
+def _solve_gram(stats: GramStats, alpha: float) -> np.ndarray:
+    try:
+        return solve_cholesky(stats.gram, stats.xty, alpha, max_cond=None)
+    except np.linalg.LinAlgError:
+        # Singular Gram matrix (collinear columns): minimum-norm solution.
+        gram = stats.gram + alpha * np.eye(stats.n_features)
+        return np.linalg.lstsq(gram, stats.xty, rcond=None)[0]
+
+
+class RidgeEngine(LinearEngine):
+    """L2-penalized least squares, solved directly from the Gram matrix."""
+
+    name = 'ridge'
+
+    def _solve(self, stats, alpha, coef_init):
+        return _solve_gram(stats, alpha), 1
+
+    def path_gram(self, stats, alphas=None, n_alphas=20, coef_init=None):
+        # One eigendecomposition, then each alpha is a diagonal rescale.
+        if alphas is None:
+            alphas = self.default_alphas(stats, n_alphas)
+        w, V = np.linalg.eigh(stats.gram)
+        proj = V.T @ stats.xty
+        results = []
+        for alpha in sorted((float(a) for a in alphas), reverse=True):
+            with np.errstate(divide='ignore', invalid='ignore'):
+                coef = V @ np.where(w + alpha > 0, proj / (w + alpha), 0.0)
+            results.append(_path_record(alpha, coef, stats.intercept(coef), 1))
+        return results
+
+
+class ElasticNetEngine(LinearEngine):
+    """L1 + L2 penalties by cyclic coordinate descent on the Gram matrix.
+
+    Each coordinate update only touches one column of ``XᵀX`` (covariance
+    updates), so an iteration costs O(p²) however many rows were fitted.
+    """
+
+    name = 'elasticnet'
+
+    def __init__(self, alpha: float = 1.0, l1_ratio: float = 0.5, max_iter: int = 1000, tol: float = 1e-4):
+        super().__init__(alpha, max_iter, tol)
+        if not 0.0 <= l1_ratio <= 1.0:
+            raise ValueError("l1_ratio must be between 0 and 1")
+        self.l1_ratio = float(l1_ratio)
+
+    def get_params(self) -> dict:
+        return dict(super().get_params(), l1_ratio=self.l1_ratio)
+
+    def _alpha_max(self, stats):
+        # Smallest alpha whose solution is all zeros (for l1_ratio > 0).
+        top = float(np.abs(stats.xty).max()) / stats.n
+        return top / max(self.l1_ratio, 1e-3) or 1.0
+
+    def _solve(self, stats, alpha, coef_init):
+        G, xty = stats.gram, stats.xty
+        p = stats.n_features
+        l1 = stats.n * alpha * self.l1_ratio
+        l2 = stats.n * alpha * (1.0 - self.l1_ratio)
+        coef = np.zeros(p) if coef_init is None else np.array(coef_init, dtype=np.float64)
+        Gb = G @ coef
+        diag = np.diag(G) + l2
+        n_iter = 0
+        for n_iter in range(1, self.max_iter + 1):
+            max_delta = 0.0
+            for j in range(p):
+                if diag[j] == 0.0:
+                    continue
+                old = coef[j]
+                rho = xty[j] - Gb[j] + G[j, j] * old
+                new = np.sign(rho) * max(abs(rho) - l1, 0.0) / diag[j]
+                if new != old:
+                    Gb += G[:, j] * (new - old)
+                    coef[j] = new
+                    max_delta = max(max_delta, abs(new - old))
+            if max_delta <= self.tol * max(float(np.abs(coef).max()), 1e-12):
+                break
+        return coef, n_iter
+
+
+class LassoEngine(ElasticNetEngine):
+    """L1-penalized least squares (elastic net with ``l1_ratio=1``)."""
+
+    name = 'lasso'
+
+    def __init__(self, alpha: float = 1.0, max_iter: int = 1000, tol: float = 1e-4):
+        super().__init__(alpha, 1.0, max_iter, tol)
+
+    def get_params(self) -> dict:
+        return LinearEngine.get_params(self)
+
+
+class HuberEngine(LinearEngine):
+    """Outlier-robust regression by iteratively reweighted least squares.
+
+    Rows whose residual is within ``epsilon`` robust scales get weight 1,
+    the rest ``epsilon·scale/|r|``; the scale is the residual MAD / 0.6745,
+    re-estimated every iteration. Needs the rows, so it has no Gram path.
+    """
+
+    name = 'huber'
+    uses_gram = False
+
+    def __init__(self, alpha: float = 0.0, epsilon: float = 1.35, max_iter: int = 100, tol: float = 1e-5):
+        super().__init__(alpha, max_iter, tol)
+        if epsilon < 1.0:
+            raise ValueError("epsilon must be at least 1.0")
+        self.epsilon = float(epsilon)
+
+    def get_params(self) -> dict:
+        return dict(super().get_params(), epsilon=self.epsilon)
+
+    def fit(self, X, y, coef_init=None) -> 'HuberEngine':
+        X = np.asarray(X, dtype=np.float64)
+        y = np.asarray(y, dtype=np.float64).ravel()
+        self.coef_, self.intercept_, self.n_iter_ = self._irls(X, y, self.alpha, coef_init)
+        return self
+
+    def fit_gram(self, stats, coef_init=None):
+        raise ValueError("The huber engine reweights rows and cannot fit from a Gram matrix")
+
+    def path(self, X, y, alphas=None, n_alphas=20, coef_init=None):
+        X = np.asarray(X, dtype=np.float64)
+        y = np.asarray(y, dtype=np.float64).ravel()
+        if alphas is None:
+            alphas = self.default_alphas(GramStats.from_arrays(X, y), n_alphas)
+        results = []
+        coef, intercept = coef_init, None
+        for alpha in sorted((float(a) for a in alphas), reverse=True):
+            coef, intercept, n_iter = self._irls(X, y, alpha, coef, intercept)
+            results.append(_path_record(alpha, coef, intercept, n_iter))
+        return results
+
+    def _irls(self, X, y, alpha, coef_init=None, intercept_init=None):
+        p = X.shape[1]
+        if coef_init is None:
+            coef = RidgeEngine()._solve(GramStats.from_arrays(X, y), alpha, None)[0]
+            intercept = float(y.mean() - X.mean(axis=0) @ coef)
+        else:
+            coef = np.array(coef_init, dtype=np.float64)
+            intercept = float(np.median(y - X @ coef)) if intercept_init is None else float(intercept_init)
+        n_iter = 0
+        for n_iter in range(1, self.max_iter + 1):
+            resid = y - X @ coef - intercept
+            scale = float(np.median(np.abs(resid - np.median(resid)))) / 0.6745
+            if scale <= 0.0:
+                break
+            w = np.minimum(1.0, self.epsilon * scale / np.maximum(np.abs(resid), 1e-300))
+            sw = float(w.sum())
+            x_mean = (w @ X) / sw
+            y_mean = float(w @ y) / sw
+            Xc = X - x_mean
+            Xw = Xc * w[:, None]
+            gram = Xw.T @ Xc + alpha * np.eye(p)
+            new = np.linalg.solve(gram, Xw.T @ (y - y_mean))
+            delta = float(np.abs(new - coef).max())
+            coef = new
+            intercept = y_mean - float(x_mean @ coef)
+            if delta <= self.tol * max(float(np.abs(coef).max()), 1e-12):
+                break
+        return coef, intercept, n_iter
+
+
+class CholeskyEngine(LinearEngine):
+    """Ordinary least squares by Cholesky on the (blocked, centered) Gram matrix.
+
+    The fastest exact solver and the one usable in streaming training; an
+    ``alpha`` above 0 turns it into ridge.
+    """
+
+    name = 'cholesky'
+
+    def __init__(self, alpha: float = 0.0, max_iter: int = 1, tol: float = 0.0):
+        super().__init__(alpha, max_iter, tol)
+
+    def get_params(self) -> dict:
+        return {'alpha': self.alpha}
+
+    def _solve(self, stats, alpha, coef_init):
+        return _solve_gram(stats, alpha), 1
+
+
+class _RowSolverEngine(LinearEngine):
+    """Least squares solved on the rows themselves (no Gram matrix, no alpha)."""
+
+    uses_gram = False
+
+    def __init__(self, alpha: float = 0.0, max_iter: int = 1, tol: float = 0.0):
+        super().__init__(0.0, max_iter, tol)
+
+    def get_params(self) -> dict:
+        return {}
+
+    def fit(self, X, y, coef_init=None):
+        self.coef_, self.intercept_ = self._fit_rows(X, y)
+        self.n_iter_ = 1
+        return self
+
+    def fit_gram(self, stats, coef_init=None):
+        raise ValueError(f"The {self.name} engine factors X itself and cannot fit from a Gram matrix")
+
+    def path(self, X, y, alphas=None, n_alphas=20, coef_init=None):
+        raise ValueError(f"The {self.name} engine has no regularization path")
+
+    def _fit_rows(self, X, y):
+        raise NotImplementedError
+
+
+class QREngine(_RowSolverEngine):
+    """Ordinary least squares by QR of the centered rows (stable on ill-conditioned data)."""
+
+    name = 'qr'
+
+    def _fit_rows(self, X, y):
+        try:
+            return solve_qr(X, y)
+        except np.linalg.LinAlgError:
+            return solve_svd(X, y)
+
+
+class SVDEngine(_RowSolverEngine):
+    """Minimum-norm least squares by SVD (handles collinear / rank-deficient columns)."""
+
+    name = 'svd'
+
+    def _fit_rows(self, X, y):
+        return solve_svd(X, y)
+
+
+ENGINES: Dict[str, type] = {
+    RidgeEngine.name: RidgeEngine,
+    LassoEngine.name: LassoEngine,
+    ElasticNetEngine.name: ElasticNetEngine,
+    HuberEngine.name: HuberEngine,
+    CholeskyEngine.name: CholeskyEngine,
+    QREngine.name: QREngine,
+    SVDEngine.name: SVDEngine,
+}
+
+
+def make_engine(name: str, **params) -> LinearEngine:
+    """Engine ``name`` from ``ENGINES``; ``None`` params are left at their defaults.
+
+    Raises ``ValueError`` for a param the engine does not take, rather than
+    fitting something other than what was asked for.
+    """
+    try:
+        cls = ENGINES[name]
+    except KeyError:
+        raise ValueError(f"Unknown engine {name!r}; choose from {['ols', *ENGINES]}") from None
+    accepted = cls().get_params()
+    params = {k: v for k, v in params.items() if v is not None}
+    unused = [k for k in params if k not in accepted]
+    if unused:
+        raise ValueError(f"The {name} engine does not take {', '.join(unused)}")
+    return cls(**params)
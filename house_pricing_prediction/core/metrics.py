@@ -0,0 +1,227 @@
+"""Lightweight latency/throughput metrics with Prometheus text output.
+
+Instrumented code wraps a step in ``timed(operation)``; on exit the step's
+wall time, the rows it processed and the bytes it read are observed into
+histograms labelled with the operation name, and failures are counted.
+Everything lives in the module-level ``REGISTRY``, rendered by
+``render_prometheus()`` for the web app's ``/metrics`` and by
+``snapshot()`` for JSON reports. There is no dependency on
+``prometheus_client``; each process (e.g. each pre-forked web worker)
+keeps its own numbers.
+"""
+import bisect
+import functools
+import math
+import threading
+import time
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+LATENCY_BUCKETS = (0.0001, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5,
+                   1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+ROW_BUCKETS = tuple(float(10 ** i) for i in range(8))
+BYTE_BUCKETS = tuple(float(1 << s) for s in range(10, 36, 2))
+
+
+def _label_text(labels: Tuple[Tuple[str, str], ...]) -> str:
+    if not labels:
+        return ''
+    body = ','.join('{}="{}"'.format(k, str(v).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n'))
+                    for k, v in labels)
+    return '{' + body + '}'
+
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return '+Inf'
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class Counter:
+    def __init__(self, name: str, help: str):
+        self.name = name
+        self.help = help
+        self._lock = threading.Lock()
+        self._values: Dict[tuple, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels):
+        key = tuple(sorted(labels.items()))
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def clear(self):
+        with self._lock:
+            self._values.clear()
+
+    def value(self, **labels) -> float:
+        return self._values.get(tuple(sorted(labels.items())), 0.0)
+
+    def render(self) -> List[str]:
+        lines = [f'# HELP {self.name} {self.help}', f'# TYPE {self.name} counter']
+        with self._lock:
+            for key, value in sorted(self._values.items()):
+                lines.append(f'{self.name}{_label_text(key)} {_format_value(value)}')
+        return lines
+
+    def snapshot(self) -> list:
+        with self._lock:
+            return [{'labels': dict(k), 'value': v} for k, v in sorted(self._values.items())]
+
+
+class Histogram:
+    """Cumulative-bucket histogram, as Prometheus expects it."""
+
+    def __init__(self, name: str, help: str, buckets: Sequence[float] = LATENCY_BUCKETS):
+        self.name = name
+        self.help = help
+        self.buckets = tuple(sorted(buckets))
+        self._lock = threading.Lock()
+        # labels -> [per-bucket counts (last one is +Inf), sum, count]
+        self._series: Dict[tuple, list] = {}
+
+    def observe(self, value: float, **labels):
+        key = tuple(sorted(labels.items()))
+        i = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            series[0][i] += 1
+            series[1] += value
+            series[2] += 1
+
+    def clear(self):
+        with self._lock:
+            self._series.clear()
+
+    def render(self) -> List[str]:
+        lines = [f'# HELP {self.name} {self.help}', f'# TYPE {self.name} histogram']
+        with self._lock:
+            for key, (counts, total, count) in sorted(self._series.items()):
+                running = 0
+                for bound, n in zip(self.buckets + (math.inf,), counts):
+                    running += n
+                    lines.append(f'{self.name}_bucket{_label_text(key + (("le", _format_value(bound)),))} {running}')
+                lines.append(f'{self.name}_sum{_label_text(key)} {_format_value(total)}')
+                lines.append(f'{self.name}_count{_label_text(key)} {count}')
+        return lines
+
+    def snapshot(self) -> list:
+        out = []
+        with self._lock:
+            for key, (counts, total, count) in sorted(self._series.items()):
+                cumulative, running = {}, 0
+                for bound, n in zip(self.buckets + (math.inf,), counts):
+                    running += n
+                    cumulative[_format_value(bound)] = running
+                out.append({'labels': dict(key), 'count': count, 'sum': total,
+                            'mean': total / count if count else 0.0, 'buckets': cumulative})
+        return out
+
+
+class MetricsRegistry:
+    def __init__(self, prefix: str = 'house_price'):
+        self.prefix = prefix
+        self._lock = threading.Lock()
+        self._metrics: Dict[str, object] = {}
+
+    def _get(self, cls, name, help, **kwargs):
+        full = f'{self.prefix}_{name}'
+        with self._lock:
+            metric = self._metrics.get(full)
+            if metric is None:
+                metric = self._metrics[full] = cls(full, help, **kwargs)
+            return metric
+
+    def counter(self, name: str, help: str) -> Counter:
+        return self._get(Counter, name, help)
+
+    def histogram(self, name: str, help: str, buckets: Sequence[float] = LATENCY_BUCKETS) -> Histogram:
+        return self._get(Histogram, name, help, buckets=buckets)
+
+    def render_prometheus(self) -> str:
+        with self._lock:
+            metrics = list(self._metrics.values())
+        lines = []
+        for metric in metrics:
+            lines.extend(metric.render())
+        return '\n'.join(lines) + '\n'
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            metrics = dict(self._metrics)
+        return {name: {'type': type(m).__name__.lower(), 'help': m.help, 'series': m.snapshot()}
+                for name, m in metrics.items()}
+
+    def reset(self):
+        """Zero every metric; the metric objects themselves stay registered."""
+        with self._lock:
+            metrics = list(self._metrics.values())
+        for metric in metrics:
+            metric.clear()
+
+
+REGISTRY = MetricsRegistry()
+
+OPERATION_SECONDS = REGISTRY.histogram('operation_duration_seconds', 'Wall time of instrumented operations')
+OPERATION_ROWS = REGISTRY.histogram('operation_rows', 'Rows processed per operation', buckets=ROW_BUCKETS)
+OPERATION_BYTES = REGISTRY.histogram('operation_bytes_read', 'Bytes read per operation', buckets=BYTE_BUCKETS)
+OPERATION_ERRORS = REGISTRY.counter('operation_errors_total', 'Instrumented operations that raised')
+
+
+class timed:
+    """Time a block (``with timed('predict') as t: ...; t.rows = n``) or a function.
+
+    Set ``rows`` and ``bytes_read`` on the returned object inside the block to
+    record them too. As a decorator (``@timed('load_model_zip')``) only the
+    latency is recorded.
+    """
+
+    __slots__ = ('operation', 'rows', 'bytes_read', '_start')
+
+    def __init__(self, operation: str):
+        self.operation = operation
+        self.rows: Optional[int] = None
+        self.bytes_read: Optional[int] = None
+
+    def __enter__(self):
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        OPERATION_SECONDS.observe(time.perf_counter() - self._start, operation=self.operation)
+        if exc_type is not None:
+            OPERATION_ERRORS.inc(operation=self.operation)
+            return False
+        if self.rows is not None:
+            OPERATION_ROWS.observe(self.rows, operation=self.operation)
+        if self.bytes_read is not None:
+            OPERATION_BYTES.observe(self.bytes_read, operation=self.operation)
+        return False
+
+    def __call__(self, fn):
+        operation = self.operation
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            with timed(operation):
+                return fn(*args, **kwargs)
+        return wrapper
+
+
+def sample_lines(name: str, help: str, value: float, kind: str = 'gauge') -> List[str]:
+    """Exposition lines for a single unlabelled value computed elsewhere (e.g. cache stats)."""
+    full = f'{REGISTRY.prefix}_{name}'
+    return [f'# HELP {full} {help}', f'# TYPE {full} {kind}', f'{full} {_format_value(value)}']
+
+
+def render_prometheus(extra: Iterable[str] = ()) -> str:
+    """Prometheus text exposition of ``REGISTRY`` plus any ``extra`` lines."""
+    text = REGISTRY.render_prometheus()
+    extra = list(extra)
+    return text + ('\n'.join(extra) + '\n' if extra else '')
+
+
+def snapshot() -> dict:
+    return REGISTRY.snapshot()
@@ -1,27 +1,395 @@
 import io
-import json
-import zipfile
-from typing import List, Tuple
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import TYPE_CHECKING, Dict, List, Optional, Sequence, Tuple
 
 import numpy as np
-from sklearn.linear_model import LinearRegression
-from sklearn.model_selection import train_test_split
-from sklearn.metrics import mean_absolute_error, mean_squared_error
 
+if TYPE_CHECKING:
+    from sklearn.linear_model import LinearRegression
 
-def train_linear_regression(X, y, test_size: float = 0.2, random_state: int = 42):
-    X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=test_size, random_state=random_state)
-    model = LinearRegression()
-    model.fit(X_train, y_train)
-    y_pred = model.predict(X_test)
-    mae = mean_absolute_error(y_test, y_pred)
-    mse = mean_squared_error(y_test, y_pred)
-    rmse = np.sqrt(mse)
+from house_price_prediction.core.artifact import load_artifact, save_artifact
+from house_price_prediction.core.engines import GramStats, make_engine
+from house_price_prediction.core.data_loader import DEFAULT_CHUNKSIZE, FEATURE_COLUMNS, iter_dataset, iter_features_target
+from house_price_prediction.core.metrics import timed
+from house_price_prediction.core.pipeline import FeaturePipeline
+from house_price_prediction.core.scorer import LinearScorer
+
+
+def _fit_coef(X, y, engine: str, engine_params: Optional[dict]):
+    """``(coef, intercept)`` of ``engine`` (see ``core.engines``) fitted on ``X``, ``y``."""
+    fitted = make_engine(engine, **(engine_params or {})).fit(X, y)
+    return fitted.coef_, fitted.intercept_
+
+
+def train_linear_regression(X, y, test_size: float = 0.2, random_state: int = 42,
+                            pipeline: Optional[FeaturePipeline] = None, engine: str = 'ols',
+                            engine_params: Optional[dict] = None):
+    """Fit on a train split and score the test split.
+
+    With a ``pipeline`` it is fitted on the training rows only and the
+    returned model is a ``LinearScorer`` that applies it, so ``predict``
+    still takes raw feature rows. ``engine`` other than ``'ols'`` picks a
+    regularized or robust fit from ``core.engines`` (``engine_params`` are
+    its alpha, l1_ratio, epsilon, ...).
+    """
+    # scikit-learn is imported on first use so scoring-only processes never load it.
+    from sklearn.linear_model import LinearRegression
+    from sklearn.model_selection import train_test_split
+    from sklearn.metrics import mean_absolute_error, mean_squared_error
+
+    with timed('train_linear_regression') as t:
+        X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=test_size, random_state=random_state)
+        design = X_train if pipeline is None else pipeline.fit_transform(X_train)
+        if engine == 'ols':
+            model = LinearRegression()
+            model.fit(design, y_train)
+            coef, intercept = model.coef_, model.intercept_
+        else:
+            coef, intercept = _fit_coef(design, y_train, engine, engine_params)
+            if pipeline is None:
+                names = [str(c) for c in getattr(X, 'columns', range(np.shape(X)[1]))]
+                model = linear_regression_from_coef(coef, intercept, names)
+        if pipeline is not None:
+            model = LinearScorer(coef, intercept, pipeline=pipeline)
+        y_pred = model.predict(X_test)
+        mae = mean_absolute_error(y_test, y_pred)
+        mse = mean_squared_error(y_test, y_pred)
+        rmse = np.sqrt(mse)
+        t.rows = len(X)
     return model, (mae, mse, rmse), (X_train, X_test, y_train, y_test, y_pred)
 
 
-def model_summary(model: LinearRegression, feature_names: List[str]) -> str:
-    coefs = {fname: float(c) for fname, c in zip(feature_names, model.coef_)}
+def hash_split_mask(row_ids, test_size: float, seed: int = 42) -> np.ndarray:
+    """Deterministic per-row train/test assignment; True marks a test row.
+
+    Each row id is mixed with splitmix64, so a row lands in the same split on
+    every run and every chunking, without shuffling or holding indices.
+    """
+    z = np.asarray(row_ids, dtype=np.uint64) + np.uint64((seed * 0x9E3779B97F4A7C15) & 0xFFFFFFFFFFFFFFFF)
+    z = (z ^ (z >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+    z = (z ^ (z >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    z = z ^ (z >> np.uint64(31))
+    u = (z >> np.uint64(11)).astype(np.float64) * (1.0 / (1 << 53))
+    return u < test_size
+
+
+class IncrementalLeastSquares:
+    """Ordinary least squares from sufficient statistics accumulated chunk by chunk.
+
+    ``partial_fit`` adds each chunk to XᵀX, Xᵀy and the row count; ``solve``
+    runs once at the end. Data are shifted by the first chunk's means before
+    accumulating, which keeps XᵀX well conditioned for raw housing features.
+    """
+
+    def __init__(self):
+        self.n = 0
+        self.x_shift = None
+        self.y_shift = 0.0
+        self.xtx = None
+        self.xty = None
+        self.x_sum = None
+        self.y_sum = 0.0
+
+    def partial_fit(self, X, y):
+        X = np.asarray(X, dtype=np.float64)
+        y = np.asarray(y, dtype=np.float64).ravel()
+        if X.shape[0] == 0:
+            return self
+        if self.x_shift is None:
+            p = X.shape[1]
+            self.x_shift = X.mean(axis=0)
+            self.y_shift = float(y.mean())
+            self.xtx = np.zeros((p, p))
+            self.xty = np.zeros(p)
+            self.x_sum = np.zeros(p)
+        Z = X - self.x_shift
+        t = y - self.y_shift
+        self.xtx += Z.T @ Z
+        self.xty += Z.T @ t
+        self.x_sum += Z.sum(axis=0)
+        self.y_sum += float(t.sum())
+        self.n += X.shape[0]
+        return self
+
+    def gram_stats(self) -> GramStats:
+        """Centered XᵀX / Xᵀy of the rows seen so far, for the engines in ``core.engines``."""
+        if self.n == 0:
+            raise ValueError("No rows were accumulated.")
+        x_mean = self.x_sum / self.n
+        y_mean = self.y_sum / self.n
+        cov = self.xtx - self.n * np.outer(x_mean, x_mean)
+        cross = self.xty - self.n * x_mean * y_mean
+        return GramStats(cov, cross, self.x_shift + x_mean, self.y_shift + y_mean, self.n)
+
+    def solve(self) -> Tuple[np.ndarray, float]:
+        """Return ``(coef, intercept)`` for the rows seen so far."""
+        stats = self.gram_stats()
+        try:
+            coef = np.linalg.solve(stats.gram, stats.xty)
+        except np.linalg.LinAlgError:
+            coef = np.linalg.lstsq(stats.gram, stats.xty, rcond=None)[0]
+        return coef, stats.intercept(coef)
+
+
+def linear_regression_from_coef(coef, intercept: float, feature_names: List[str]) -> 'LinearRegression':
+    """Wrap solved coefficients in a fitted ``LinearRegression`` for saving and predicting."""
+    from sklearn.linear_model import LinearRegression
+
+    model = LinearRegression()
+    model.coef_ = np.asarray(coef, dtype=np.float64)
+    model.intercept_ = float(intercept)
+    model.n_features_in_ = len(feature_names)
+    model.feature_names_in_ = np.asarray(feature_names, dtype=object)
+    return model
+
+
+def train_linear_regression_streaming(path: str, test_size: float = 0.2, chunksize: int = DEFAULT_CHUNKSIZE,
+                                      seed: int = 42, pipeline: Optional[FeaturePipeline] = None,
+                                      engine: str = 'ols', engine_params: Optional[dict] = None):
+    """Fit OLS on a CSV larger than memory.
+
+    The fit is one pass over ``iter_dataset`` chunks, with rows assigned to
+    train/test by ``hash_split_mask`` on their position in the file. A second
+    streaming pass scores the held-out rows for MAE/MSE/RMSE. A ``pipeline``
+    costs one more pass up front to accumulate its statistics on the training
+    rows; the model is then a ``LinearScorer`` applying it. Ridge, lasso and
+    elastic net ``engine``s are solved from the accumulated XᵀX (huber needs
+    the rows in memory).
+    Returns ``(model, (mae, mse, rmse), (n_train, n_test))``.
+    """
+    def train_chunks():
+        offset = 0
+        for X, y in iter_features_target(iter_dataset(path, chunksize=chunksize)):
+            n = len(X)
+            test = hash_split_mask(np.arange(offset, offset + n), test_size, seed)
+            yield X.to_numpy()[~test], y.to_numpy()[~test]
+            offset += n
+
+    passes = 2
+    fitter = None if engine == 'ols' else make_engine(engine, **(engine_params or {}))
+    if fitter is not None and not fitter.uses_gram:
+        raise ValueError(f"The {engine} engine cannot be fitted in streaming mode")
+    with timed('train_linear_regression_streaming') as t:
+        if pipeline is not None:
+            pipeline = FeaturePipeline(**dict(pipeline.get_params(), input_columns=FEATURE_COLUMNS))
+            for X, _ in train_chunks():
+                pipeline.partial_fit(X)
+            passes += 1
+        solver = IncrementalLeastSquares()
+        for X, y in train_chunks():
+            solver.partial_fit(X if pipeline is None else pipeline.transform(X), y)
+        if fitter is None:
+            coef, intercept = solver.solve()
+        else:
+            fitter.fit_gram(solver.gram_stats())
+            coef, intercept = fitter.coef_, fitter.intercept_
+        if pipeline is None:
+            model = linear_regression_from_coef(coef, intercept, FEATURE_COLUMNS)
+            scorer = LinearScorer(coef, intercept, FEATURE_COLUMNS)
+        else:
+            model = scorer = LinearScorer(coef, intercept, pipeline=pipeline)
+
+        abs_err, sq_err, n_test, offset = 0.0, 0.0, 0, 0
+        for X, y in iter_features_target(iter_dataset(path, chunksize=chunksize)):
+            n = len(X)
+            test = hash_split_mask(np.arange(offset, offset + n), test_size, seed)
+            resid = y.to_numpy()[test] - scorer.predict(X.to_numpy()[test])
+            abs_err += float(np.abs(resid).sum())
+            sq_err += float(resid @ resid)
+            n_test += int(test.sum())
+            offset += n
+        if n_test == 0:
+            raise ValueError("No rows were assigned to the test split; increase test_size.")
+        t.rows = offset
+        t.bytes_read = passes * os.path.getsize(path)
+    mae = abs_err / n_test
+    mse = sq_err / n_test
+    return model, (mae, mse, float(np.sqrt(mse))), (solver.n, n_test)
+
+
+# Arrays shared with cross-validation workers, attached once per worker process.
+_CV_SHARED: Dict[str, np.ndarray] = {}
+_CV_HANDLES: List[shared_memory.SharedMemory] = []
+
+# Training rates offered by the Tk "Training Rate" field (50-95%).
+DEFAULT_TRAIN_RATES = (0.5, 0.6, 0.7, 0.8, 0.9, 0.95)
+
+
+def _to_shared(arr: np.ndarray):
+    shm = shared_memory.SharedMemory(create=True, size=max(arr.nbytes, 1))
+    view = np.ndarray(arr.shape, dtype=arr.dtype, buffer=shm.buf)
+    view[...] = arr
+    return shm, (shm.name, arr.shape, arr.dtype.str)
+
+
+def _cv_init(specs):
+    for key, (name, shape, dtype) in specs.items():
+        shm = shared_memory.SharedMemory(name=name)
+        _CV_HANDLES.append(shm)
+        _CV_SHARED[key] = np.ndarray(shape, dtype=np.dtype(dtype), buffer=shm.buf)
+
+
+def _cv_split(n: int, fold: int, n_splits: int, train_rate: Optional[float], seed: int):
+    if train_rate is None:
+        # K-fold: one shared permutation, fold ``fold`` held out.
+        order = np.random.default_rng(seed).permutation(n)
+        test = np.array_split(order, n_splits)[fold]
+        mask = np.ones(n, dtype=bool)
+        mask[test] = False
+        return np.flatnonzero(mask), test
+    order = np.random.default_rng(seed + fold).permutation(n)
+    n_train = int(round(train_rate * n))
+    return order[:n_train], order[n_train:]
+
+
+def _cv_fold(task):
+    from sklearn.linear_model import LinearRegression
+    from sklearn.metrics import mean_absolute_error, mean_squared_error
+
+    fold, n_splits, train_rate, seed, pipeline_params, engine, engine_params = task
+    X, y = _CV_SHARED['X'], _CV_SHARED['y']
+    train_idx, test_idx = _cv_split(X.shape[0], fold, n_splits, train_rate, seed)
+    X_train, X_test = X[train_idx], X[test_idx]
+    if pipeline_params is not None:
+        # Refit the preprocessing on each training fold, as train_linear_regression does.
+        pipeline = FeaturePipeline(**pipeline_params)
+        X_train = pipeline.fit_transform(X_train)
+        X_test = pipeline.transform(X_test)
+    if engine == 'ols':
+        model = LinearRegression()
+        model.fit(X_train, y[train_idx])
+        y_pred = model.predict(X_test)
+    else:
+        coef, intercept = _fit_coef(X_train, y[train_idx], engine, engine_params)
+        y_pred = X_test @ coef + intercept
+    mse = mean_squared_error(y[test_idx], y_pred)
+    return {
+        'train_rate': train_rate if train_rate is not None else 1.0 - 1.0 / n_splits,
+        'fold': fold,
+        'n_train': int(train_idx.size),
+        'n_test': int(test_idx.size),
+        'mae': float(mean_absolute_error(y[test_idx], y_pred)),
+        'mse': float(mse),
+        'rmse': float(np.sqrt(mse)),
+    }
+
+
+def cross_validate_linear_regression(X, y, n_splits: int = 5, train_rates: Optional[Sequence[float]] = None,
+                                     random_state: int = 42, n_jobs: Optional[int] = None,
+                                     pipeline: Optional[FeaturePipeline] = None, engine: str = 'ols',
+                                     engine_params: Optional[dict] = None) -> List[dict]:
+    """Evaluate LinearRegression over many splits on a process pool.
+
+    With ``train_rates=None`` this is K-fold cross-validation. Otherwise each
+    rate in the grid gets ``n_splits`` random train/test splits, giving a
+    learning curve. X and y are copied once into shared memory and every
+    worker maps them, so the data is never pickled per task. A ``pipeline``
+    (only its parameters are used) is refitted on every training fold, and
+    ``engine``/``engine_params`` select the fit as in ``train_linear_regression``.
+    Returns one record per split with its MAE, MSE and RMSE.
+    """
+    pipeline_params = None
+    if pipeline is not None:
+        pipeline_params = pipeline.get_params()
+        if hasattr(X, 'columns'):
+            pipeline_params['input_columns'] = [str(c) for c in X.columns]
+    X = np.ascontiguousarray(np.asarray(X, dtype=np.float64))
+    y = np.ascontiguousarray(np.asarray(y, dtype=np.float64).ravel())
+    if n_splits < 2 and train_rates is None:
+        raise ValueError("K-fold needs n_splits >= 2")
+    rates = [None] if train_rates is None else [float(r) for r in train_rates]
+    for r in rates:
+        if r is not None and not 0.0 < r < 1.0:
+            raise ValueError(f"Training rate must be between 0 and 1: {r}")
+    tasks = [(fold, n_splits, rate, random_state, pipeline_params, engine, engine_params)
+             for rate in rates for fold in range(n_splits)]
+    n_jobs = n_jobs or os.cpu_count() or 1
+    with timed('cross_validate') as t:
+        t.rows = X.shape[0]
+        return _run_cv(X, y, tasks, n_jobs)
+
+
+def _run_cv(X: np.ndarray, y: np.ndarray, tasks: list, n_jobs: int) -> List[dict]:
+    if n_jobs == 1:
+        _CV_SHARED.update(X=X, y=y)
+        try:
+            return [_cv_fold(t) for t in tasks]
+        finally:
+            _CV_SHARED.clear()
+
+    handles = []
+    try:
+        specs = {}
+        for key, arr in (('X', X), ('y', y)):
+            shm, spec = _to_shared(arr)
+            handles.append(shm)
+            specs[key] = spec
+        with ProcessPoolExecutor(max_workers=min(n_jobs, len(tasks)), initializer=_cv_init,
+                                 initargs=(specs,)) as pool:
+            return list(pool.map(_cv_fold, tasks))
+    finally:
+        for shm in handles:
+            shm.close()
+            shm.unlink()
+
+
+def regularization_sweep(X, y, engine: str, alphas: Optional[Sequence[float]] = None, n_alphas: int = 20,
+                         test_size: float = 0.2, random_state: int = 42,
+                         pipeline: Optional[FeaturePipeline] = None, engine_params: Optional[dict] = None) -> List[dict]:
+    """Score ``engine`` over a whole alpha path on one train/test split.
+
+    The path is solved off a single Gram matrix of the training rows with
+    warm starts (see ``LinearEngine.path``), so the sweep costs about one
+    fit. Returns one record per alpha (largest first) with its test MAE,
+    MSE, RMSE and number of non-zero coefficients.
+    """
+    from sklearn.model_selection import train_test_split
+
+    with timed('regularization_sweep') as t:
+        X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=test_size, random_state=random_state)
+        if pipeline is not None:
+            X_train = pipeline.fit_transform(X_train)
+            X_test = pipeline.transform(X_test)
+        X_test = np.asarray(X_test, dtype=np.float64)
+        y_test = np.asarray(y_test, dtype=np.float64)
+        path = make_engine(engine, **(engine_params or {})).path(X_train, y_train, alphas=alphas, n_alphas=n_alphas)
+        records = []
+        for step in path:
+            resid = y_test - (X_test @ step['coef'] + step['intercept'])
+            mse = float(resid @ resid) / resid.shape[0]
+            records.append({'alpha': step['alpha'], 'nonzero': step['nonzero'], 'n_iter': step['n_iter'],
+                            'mae': float(np.abs(resid).mean()), 'mse': mse, 'rmse': float(np.sqrt(mse))})
+        t.rows = len(X)
+    return records
+
+
+def summarize_cv(records: List[dict]) -> Dict[float, Dict[str, Dict[str, float]]]:
+    """Per training rate, the mean/std/min/max of each metric across folds."""
+    summary = {}
+    for rate in sorted({r['train_rate'] for r in records}):
+        rows = [r for r in records if r['train_rate'] == rate]
+        summary[rate] = {}
+        for metric in ('mae', 'mse', 'rmse'):
+            vals = np.array([r[metric] for r in rows])
+            summary[rate][metric] = {
+                'mean': float(vals.mean()),
+                'std': float(vals.std()),
+                'min': float(vals.min()),
+                'max': float(vals.max()),
+            }
+    return summary
+
+
+def coefficient_names(model, feature_names: List[str]) -> List[str]:
+    """Names matching ``model.coef_``: the pipeline's output terms when it has one."""
+    pipeline = getattr(model, 'pipeline', None)
+    return list(feature_names) if pipeline is None else pipeline.output_names
+
+
+def model_summary(model: 'LinearRegression', feature_names: List[str]) -> str:
+    coefs = {fname: float(c) for fname, c in zip(coefficient_names(model, feature_names), model.coef_)}
     lines = [
         f"Intercept: {model.intercept_}",
         "Coefficients:",
@@ -31,19 +399,24 @@ def model_summary(model: LinearRegression, feature_names: List[str]) -> str:
     return "\n".join(lines)
 
 
-def save_model_zip(model: LinearRegression, feature_names: List[str], out_zip_path: str):
-    with zipfile.ZipFile(out_zip_path, mode='w', compression=zipfile.ZIP_DEFLATED) as zf:
-        # model pickle
-        import pickle
-        model_bytes = pickle.dumps(model)
-        zf.writestr('model.pkl', model_bytes)
-        # feature names
-        zf.writestr('feature_names.json', json.dumps(feature_names))
+def save_model_zip(model: 'LinearRegression', feature_names: List[str], out_zip_path: str,
+                   metadata: Optional[dict] = None) -> dict:
+    """Save ``model`` as a versioned artifact (see ``core.artifact``); returns its manifest.
+
+    A model trained with a feature pipeline saves the pipeline along with it.
+    """
+    return save_artifact(out_zip_path, model.coef_, model.intercept_, list(feature_names), metadata,
+                         pipeline=getattr(model, 'pipeline', None))
+
 
+def load_model_zip(zip_path: str, allow_pickle: bool = False) -> Tuple['LinearRegression', List[str]]:
+    """Load an artifact as a fitted ``LinearRegression``, without unpickling by default.
 
-def load_model_zip(zip_path: str) -> Tuple[LinearRegression, List[str]]:
-    with zipfile.ZipFile(zip_path, mode='r') as zf:
-        import pickle
-        model = pickle.loads(zf.read('model.pkl'))
-        feature_names = json.loads(zf.read('feature_names.json').decode('utf-8'))
-        return model, feature_names
\ No newline at end of file
+    Artifacts with a feature pipeline come back as the ``LinearScorer``
+    (same ``predict``/``coef_``/``intercept_``), which applies it.
+    """
+    scorer = load_artifact(zip_path, allow_pickle=allow_pickle)
+    if scorer.pipeline is not None:
+        return scorer, scorer.feature_names
+    model = linear_regression_from_coef(scorer.coef_, scorer.intercept_, scorer.feature_names)
+    return model, scorer.feature_names
\ No newline at end of file
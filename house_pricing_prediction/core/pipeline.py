@@ -0,0 +1,328 @@
+"""Feature preprocessing fitted at training time and replayed at predict time.
+
+``FeaturePipeline`` selects input columns, fills missing values with the
+training mean (``fillna(data.mean())`` as in ``data_processing/filling.py``),
+standardizes, and adds polynomial terms. Its fitted parameters are plain
+NumPy arrays, saved in the model artifact next to the coefficients (see
+``core.artifact``), so the serving side rebuilds the exact same transform.
+
+At predict time the pipeline is compiled together with the linear model
+into a ``LinearKernel``. With ``degree=1`` the standardization is folded
+into the coefficients, so scoring is a NaN fill (only if a NaN is present)
+plus one matmul on the raw inputs. Squared and pairwise terms are summed as
+one quadratic form ``rowsum((Z @ A) * Z)``; higher-degree terms are built
+per degree with index arrays. Neither materializes a DataFrame or the full
+expanded matrix.
+"""
+from itertools import combinations, combinations_with_replacement
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+IMPUTE_STRATEGIES = (None, 'mean')
+
+
+class FeaturePipeline:
+    """Column selection -> mean imputation -> standardization -> polynomial terms.
+
+    ``input_columns`` are the columns callers pass, in order (taken from the
+    DataFrame given to ``fit`` when not set); ``columns`` picks the ones the
+    model uses (default: all). Statistics ignore NaNs and can be accumulated
+    chunk by chunk with ``partial_fit`` for datasets streamed from disk.
+    """
+
+    def __init__(self, columns: Optional[Sequence[str]] = None, impute: Optional[str] = None,
+                 standardize: bool = False, degree: int = 1, interaction_only: bool = False,
+                 input_columns: Optional[Sequence[str]] = None):
+        if impute not in IMPUTE_STRATEGIES:
+            raise ValueError(f"impute must be one of {IMPUTE_STRATEGIES}, got {impute!r}")
+        if degree < 1:
+            raise ValueError("degree must be at least 1")
+        self.columns = None if columns is None else [str(c) for c in columns]
+        self.impute = impute
+        self.standardize = bool(standardize)
+        self.degree = int(degree)
+        self.interaction_only = bool(interaction_only)
+        self.input_columns = None if input_columns is None else [str(c) for c in input_columns]
+        self._reset()
+
+    def _reset(self):
+        self.fill_: Optional[np.ndarray] = None
+        self.mean_: Optional[np.ndarray] = None
+        self.scale_: Optional[np.ndarray] = None
+        self._n = 0
+        self._count = self._sum = self._sumsq = self._shift = None
+
+    def get_params(self) -> dict:
+        return {
+            'columns': self.columns,
+            'impute': self.impute,
+            'standardize': self.standardize,
+            'degree': self.degree,
+            'interaction_only': self.interaction_only,
+            'input_columns': self.input_columns,
+        }
+
+    @property
+    def selected_columns(self) -> List[str]:
+        return list(self.input_columns if self.columns is None else self.columns)
+
+    @property
+    def selected_index(self) -> np.ndarray:
+        if self.input_columns is None:
+            raise ValueError("input_columns are unknown; fit on a DataFrame or pass input_columns")
+        missing = [c for c in self.selected_columns if c not in self.input_columns]
+        if missing:
+            raise ValueError(f"Missing columns in dataset: {missing}")
+        return np.array([self.input_columns.index(c) for c in self.selected_columns], dtype=np.intp)
+
+    @property
+    def terms(self) -> List[Tuple[int, ...]]:
+        """Index tuples (into the selected columns) of every degree >= 2 term, grouped by degree."""
+        p = len(self.selected_columns)
+        combo = combinations if self.interaction_only else combinations_with_replacement
+        return [t for d in range(2, self.degree + 1) for t in combo(range(p), d)]
+
+    @property
+    def output_names(self) -> List[str]:
+        """Names of the model's coefficients, in order."""
+        names = self.selected_columns
+        out = list(names)
+        for term in self.terms:
+            parts = []
+            for i in sorted(set(term)):
+                k = term.count(i)
+                parts.append(names[i] if k == 1 else f"{names[i]}^{k}")
+            out.append(' * '.join(parts))
+        return out
+
+    def _as_matrix(self, X) -> np.ndarray:
+        if hasattr(X, 'columns'):
+            cols = [str(c) for c in X.columns]
+            if self.input_columns is None:
+                self.input_columns = cols
+            elif cols != self.input_columns:
+                X = X[self.input_columns]
+            X = X.to_numpy(dtype=np.float64)
+        X = np.asarray(X, dtype=np.float64)
+        if X.ndim == 1:
+            X = X.reshape(1, -1)
+        if self.input_columns is None:
+            self.input_columns = [f"x{i}" for i in range(X.shape[1])]
+        if X.shape[1] != len(self.input_columns):
+            raise ValueError(f"Expected {len(self.input_columns)} feature values, got {X.shape[1]}")
+        return X
+
+    def partial_fit(self, X):
+        """Add a chunk of rows to the running (NaN-ignoring) column statistics."""
+        Z = self._as_matrix(X)[:, self.selected_index]
+        if Z.shape[0] == 0:
+            return self
+        if self._shift is None:
+            p = Z.shape[1]
+            # Shift by the first chunk's means so sums of squares stay well conditioned.
+            seen = (~np.isnan(Z)).sum(axis=0)
+            self._shift = np.where(seen > 0, np.nansum(Z, axis=0) / np.maximum(seen, 1), 0.0)
+            self._count = np.zeros(p)
+            self._sum = np.zeros(p)
+            self._sumsq = np.zeros(p)
+        D = Z - self._shift
+        present = ~np.isnan(D)
+        D[~present] = 0.0
+        self._n += Z.shape[0]
+        self._count += present.sum(axis=0)
+        self._sum += D.sum(axis=0)
+        self._sumsq += np.einsum('ij,ij->j', D, D)
+        self._finalize()
+        return self
+
+    def _finalize(self):
+        count = np.maximum(self._count, 1)
+        mean_shifted = self._sum / count
+        # Columns that were always missing are filled with 0.
+        observed = np.where(self._count > 0, self._shift + mean_shifted, 0.0)
+        if self.impute == 'mean':
+            self.fill_ = observed
+            # Filled cells sit exactly on the mean, so they add rows but no spread.
+            n = max(self._n, 1)
+        else:
+            self.fill_ = None
+            n = count
+        if self.standardize:
+            var = np.maximum((self._sumsq - self._sum ** 2 / count) / n, 0.0)
+            scale = np.sqrt(var)
+            self.mean_ = observed
+            self.scale_ = np.where(scale > 0, scale, 1.0)
+        else:
+            self.mean_ = self.scale_ = None
+
+    def fit(self, X):
+        self._reset()
+        return self.partial_fit(X)
+
+    def _prepare(self, X) -> np.ndarray:
+        """Selected, imputed and standardized columns as a new float64 matrix."""
+        Z = self._as_matrix(X)[:, self.selected_index]
+        if self.fill_ is not None:
+            mask = np.isnan(Z)
+            if mask.any():
+                Z = np.where(mask, self.fill_, Z)
+        if self.mean_ is not None:
+            Z -= self.mean_
+            Z /= self.scale_
+        return Z
+
+    def transform(self, X) -> np.ndarray:
+        """The model's design matrix (``output_names`` columns) for ``X``."""
+        self._check_fitted()
+        Z = self._prepare(X)
+        if self.degree == 1:
+            return Z
+        blocks = [Z]
+        for idx in _terms_by_degree(self.terms):
+            blocks.append(_products(Z, idx))
+        return np.hstack(blocks)
+
+    def fit_transform(self, X) -> np.ndarray:
+        return self.fit(X).transform(X)
+
+    def _check_fitted(self):
+        if (self.impute is not None and self.fill_ is None) or (self.standardize and self.mean_ is None):
+            raise ValueError("FeaturePipeline is not fitted yet")
+        if self.input_columns is None:
+            raise ValueError("input_columns are unknown; fit on a DataFrame or pass input_columns")
+
+    def compile(self, coef, intercept: float) -> 'LinearKernel':
+        """Fuse this pipeline with the linear model ``coef``/``intercept`` over ``output_names``."""
+        self._check_fitted()
+        return LinearKernel(self, coef, intercept)
+
+    def to_manifest(self) -> Tuple[dict, Dict[str, np.ndarray]]:
+        """``(spec, arrays)`` for the artifact manifest; ``arrays`` are saved as raw float64."""
+        self._check_fitted()
+        spec = dict(self.get_params(), output_names=self.output_names)
+        arrays = {}
+        for name, value in (('fill', self.fill_), ('mean', self.mean_), ('scale', self.scale_)):
+            if value is not None:
+                arrays[name] = np.asarray(value, dtype=np.float64)
+        return spec, arrays
+
+    @classmethod
+    def from_manifest(cls, spec: dict, arrays: Dict[str, np.ndarray]) -> 'FeaturePipeline':
+        pipeline = cls(spec.get('columns'), spec.get('impute'), spec.get('standardize', False),
+                       spec.get('degree', 1), spec.get('interaction_only', False), spec['input_columns'])
+        pipeline.fill_ = None if 'fill' not in arrays else np.array(arrays['fill'], dtype=np.float64)
+        pipeline.mean_ = None if 'mean' not in arrays else np.array(arrays['mean'], dtype=np.float64)
+        pipeline.scale_ = None if 'scale' not in arrays else np.array(arrays['scale'], dtype=np.float64)
+        if spec.get('output_names') not in (None, pipeline.output_names):
+            raise ValueError("Pipeline terms in the manifest do not match its parameters")
+        return pipeline
+
+    def __repr__(self):
+        params = ', '.join(f"{k}={v!r}" for k, v in self.get_params().items() if k != 'input_columns')
+        return f"FeaturePipeline({params})"
+
+
+def _terms_by_degree(terms: List[Tuple[int, ...]]) -> List[np.ndarray]:
+    """Group ``terms`` into one (n_terms, degree) index array per degree."""
+    groups: Dict[int, list] = {}
+    for term in terms:
+        groups.setdefault(len(term), []).append(term)
+    return [np.array(groups[d], dtype=np.intp) for d in sorted(groups)]
+
+
+def _products(Z: np.ndarray, idx: np.ndarray) -> np.ndarray:
+    out = Z[:, idx[:, 0]]
+    for j in range(1, idx.shape[1]):
+        out *= Z[:, idx[:, j]]
+    return out
+
+
+class LinearKernel:
+    """A fitted ``FeaturePipeline`` and linear coefficients compiled for scoring."""
+
+    def __init__(self, pipeline: FeaturePipeline, coef, intercept: float):
+        coef = np.ascontiguousarray(coef, dtype=np.float64).ravel()
+        names = pipeline.output_names
+        if coef.shape[0] != len(names):
+            raise ValueError(f"{coef.shape[0]} coefficients for {len(names)} pipeline outputs")
+        self.n_inputs = len(pipeline.input_columns)
+        self.select = pipeline.selected_index
+        self.all_selected = np.array_equal(self.select, np.arange(self.n_inputs))
+        self.fill = pipeline.fill_
+        p = self.select.shape[0]
+        if pipeline.degree == 1:
+            # (x - m) / s @ c + b  ==  x @ (c / s) + (b - m @ (c / s))
+            self.mean = self.scale = None
+            if pipeline.mean_ is not None:
+                folded = coef / pipeline.scale_
+                intercept = float(intercept) - float(pipeline.mean_ @ folded)
+                coef = folded
+            self.groups = []
+        else:
+            self.mean = pipeline.mean_
+            self.scale = pipeline.scale_
+            self.groups = []
+            start = p
+            for g in _terms_by_degree(pipeline.terms):
+                c = coef[start:start + g.shape[0]]
+                start += g.shape[0]
+                if g.shape[1] == 2:
+                    quad = np.zeros((p, p))
+                    np.add.at(quad, (g[:, 0], g[:, 1]), c)
+                    self.groups.append((None, quad))
+                else:
+                    self.groups.append((g, c))
+        self._terms = list(zip(map(tuple, pipeline.terms), coef[p:].tolist()))
+        self.coef = coef[:p]
+        self.intercept = float(intercept)
+        self._coef_list = self.coef.tolist()
+        self._select_list = self.select.tolist()
+        self._fill_list = None if self.fill is None else self.fill.tolist()
+        self._mean_list = None if self.mean is None else self.mean.tolist()
+        self._scale_list = None if self.scale is None else self.scale.tolist()
+
+    def predict(self, X: np.ndarray) -> np.ndarray:
+        X = np.asarray(X, dtype=np.float64)
+        if X.ndim == 1:
+            X = X.reshape(1, -1)
+        if X.shape[1] != self.n_inputs:
+            raise ValueError(f"Expected {self.n_inputs} features, got {X.shape[1]}")
+        Z = X if self.all_selected else X[:, self.select]
+        if self.fill is not None:
+            mask = np.isnan(Z)
+            if mask.any():
+                Z = np.where(mask, self.fill, Z)
+        if self.mean is not None:
+            Z = (Z - self.mean) / self.scale
+        out = Z @ self.coef
+        out += self.intercept
+        for idx, coef in self.groups:
+            if idx is None:
+                out += np.einsum('ij,ij->i', Z @ coef, Z)
+            else:
+                out += _products(Z, idx) @ coef
+        return out
+
+    def predict_one(self, values) -> float:
+        if len(values) != self.n_inputs:
+            raise ValueError(f"Expected {self.n_inputs} features, got {len(values)}")
+        fill = self._fill_list
+        z = []
+        for k, i in enumerate(self._select_list):
+            v = float(values[i])
+            if v != v and fill is not None:
+                v = fill[k]
+            z.append(v)
+        if self.mean is not None:
+            z = [(v - m) / s for v, m, s in zip(z, self._mean_list, self._scale_list)]
+        total = self.intercept
+        for v, c in zip(z, self._coef_list):
+            total += v * c
+        if self.groups:
+            for term, c in self._terms:
+                prod = c
+                for i in term:
+                    prod *= z[i]
+                total += prod
+        return total
@@ -0,0 +1,128 @@
+"""Bounded cache of single-row predictions keyed by rounded features."""
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Optional, Sequence, Union
+
+# Entries of the optional cache in the Tk and Qt front-ends (unset or 0: no cache).
+CACHE_SIZE_ENV = 'HOUSE_PRICE_PREDICTION_CACHE'
+
+
+class PredictionCache:
+    """LRU + TTL cache in front of a model's single-row predictions.
+
+    Rows are rounded to ``decimals`` (one int for every feature, or one per
+    feature) and the *rounded* row is what gets scored, so a key always maps
+    to the same price no matter which raw row filled it. Entries older than
+    ``ttl`` seconds (``None``: never) are dropped on lookup, and the least
+    recently used entry is evicted past ``maxsize``.
+
+    The cache belongs to one model at a time: passing a different model
+    object clears it. ``ModelRegistry`` returns a new object whenever a zip
+    is (re)loaded, so replacing the active zip invalidates the cache without
+    any extra wiring.
+    """
+
+    def __init__(self, maxsize: int = 4096, ttl: Optional[float] = 300.0,
+                 decimals: Union[int, Sequence[int]] = 2, clock: Callable[[], float] = time.monotonic):
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.decimals = decimals
+        self.clock = clock
+        self._lock = threading.Lock()
+        self._entries: 'OrderedDict[tuple, tuple]' = OrderedDict()
+        self._model = None
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+    def key(self, row: Sequence[float]) -> tuple:
+        if isinstance(self.decimals, int):
+            return tuple(round(float(v), self.decimals) for v in row)
+        if len(self.decimals) != len(row):
+            raise ValueError(f"Expected {len(self.decimals)} feature values, got {len(row)}")
+        return tuple(round(float(v), d) for v, d in zip(row, self.decimals))
+
+    def _bind(self, model):
+        # Caller holds the lock.
+        if model is not self._model:
+            if self._entries:
+                self.invalidations += 1
+            self._entries.clear()
+            self._model = model
+
+    def predict_one(self, model, row: Sequence[float],
+                    compute: Optional[Callable[[list], float]] = None) -> float:
+        """Return the cached prediction for ``row``, scoring it on a miss.
+
+        ``compute(rounded_row)`` defaults to ``model.predict_one`` (or
+        ``model.predict`` for sklearn estimators); pass e.g. a
+        ``MicroBatcher.predict_one`` to batch the misses.
+        """
+        key = self.key(row)
+        now = self.clock()
+        with self._lock:
+            self._bind(model)
+            entry = self._entries.get(key)
+            if entry is not None:
+                value, expires = entry
+                if expires is None or expires > now:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self._entries[key]
+                self.expirations += 1
+            self.misses += 1
+        if compute is None:
+            compute = getattr(model, 'predict_one', None) or (lambda r: float(model.predict([r])[0]))
+        value = float(compute(list(key)))
+        with self._lock:
+            # Skip the store if the model was swapped while this row was scored.
+            if model is self._model:
+                self._entries[key] = (value, None if self.ttl is None else now + self.ttl)
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.maxsize:
+                    self._entries.popitem(last=False)
+                    self.evictions += 1
+        return value
+
+    def invalidate(self):
+        with self._lock:
+            self._entries.clear()
+            self._model = None
+            self.invalidations += 1
+
+    def __len__(self):
+        return len(self._entries)
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'size': len(self._entries),
+                'maxsize': self.maxsize,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+                'evictions': self.evictions,
+                'expirations': self.expirations,
+                'invalidations': self.invalidations,
+            }
+
+
+def cache_from_env(ttl: Optional[float] = None, decimals: Union[int, Sequence[int]] = 2) -> Optional[PredictionCache]:
+    """The desktop front-ends' cache, or ``None`` unless ``HOUSE_PRICE_PREDICTION_CACHE`` sets a size.
+
+    Off by default: a cache scores the rounded row, so enabling it changes
+    predictions by up to the rounding.
+    """
+    try:
+        maxsize = int(os.environ.get(CACHE_SIZE_ENV, '0'))
+    except ValueError:
+        return None
+    return PredictionCache(maxsize=maxsize, ttl=ttl, decimals=decimals) if maxsize > 0 else None
@@ -0,0 +1,178 @@
+"""In-memory registry of the model zips in a models directory."""
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+from house_price_prediction.core.scorer import LinearScorer
+
+LATEST = 'latest'
+
+
+class ModelRegistry:
+    """Index a directory of model zips and keep recently used models in memory.
+
+    Loaded models are cached in a bounded LRU keyed by ``(path, mtime_ns)``, so
+    a zip that is overwritten in place is reloaded instead of served stale.
+    ``refresh()`` rescans the directory (``start_watching`` does it on a
+    background thread) and atomically swaps the active model when a newer zip
+    appears. ``get()`` and ``active`` only touch memory once a model is cached.
+    Until a model is active, ``refresh()`` activates the newest zip (or the one
+    last passed to ``activate()``) as soon as it appears, so a registry started
+    on an empty directory becomes ready once a model is trained.
+    """
+
+    def __init__(self, model_dir, loader: Callable[[str], object] = LinearScorer.from_zip,
+                 cache_size: int = 4, pattern: str = '*.zip'):
+        if cache_size < 1:
+            raise ValueError("cache_size must be at least 1")
+        self.model_dir = Path(model_dir)
+        self.loader = loader
+        self.cache_size = cache_size
+        self.pattern = pattern
+        self._lock = threading.RLock()
+        self._cache: 'OrderedDict[Tuple[str, int], object]' = OrderedDict()
+        # (name, key, model) swapped as one tuple so readers never see a mix.
+        self._active: Optional[Tuple[str, Tuple[str, int], object]] = None
+        self._follow_latest = True
+        # Zip name ``activate(name)`` asked for, kept even if it is missing for now.
+        self._pinned: Optional[str] = None
+        self._stop = threading.Event()
+        self._watcher: Optional[threading.Thread] = None
+        self._index: Dict[str, Tuple[str, int]] = self._scan()
+
+    # Index
+    def _scan(self) -> Dict[str, Tuple[str, int]]:
+        index = {}
+        if self.model_dir.is_dir():
+            for p in self.model_dir.glob(self.pattern):
+                try:
+                    index[p.name] = (str(p), p.stat().st_mtime_ns)
+                except OSError:
+                    # Removed between glob and stat.
+                    continue
+        return index
+
+    def names(self) -> List[str]:
+        with self._lock:
+            return sorted(self._index)
+
+    def latest_name(self) -> Optional[str]:
+        with self._lock:
+            if not self._index:
+                return None
+            return max(self._index, key=lambda n: (self._index[n][1], n))
+
+    def refresh(self) -> bool:
+        """Rescan the directory; return True if the active model changed.
+
+        A pinned model (``activate(name)``) is reloaded when its zip is
+        rewritten, or loaded once it appears; otherwise the newest zip by
+        mtime becomes active.
+        """
+        index = self._scan()
+        with self._lock:
+            self._index = index
+            live = set(index.values())
+            for key in [k for k in self._cache if k not in live]:
+                del self._cache[key]
+            name = self.latest_name() if self._follow_latest else self._pinned
+            if name is None or name not in index:
+                changed = self._active is not None
+                self._active = None
+                return changed
+            if self._active is not None and self._active[:2] == (name, index[name]):
+                return False
+            key = index[name]
+        # Load outside the lock so readers keep using the previous model meanwhile.
+        model = self._load(key)
+        with self._lock:
+            self._active = (name, key, model)
+        return True
+
+    # Loading
+    def _resolve(self, name: Optional[str]) -> Tuple[str, Tuple[str, int]]:
+        with self._lock:
+            if name in (None, LATEST):
+                name = self.latest_name()
+                if name is None:
+                    raise FileNotFoundError(f"No models found in {self.model_dir}")
+            name = os.path.basename(name)
+            if name not in self._index:
+                raise FileNotFoundError(f"Model not found: {self.model_dir / name}")
+            return name, self._index[name]
+
+    def _load(self, key: Tuple[str, int]):
+        with self._lock:
+            model = self._cache.get(key)
+            if model is not None:
+                self._cache.move_to_end(key)
+                return model
+        model = self.loader(key[0])
+        with self._lock:
+            self._cache[key] = model
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return model
+
+    def get(self, name: Optional[str] = LATEST):
+        """Return the model for ``name`` (a zip file name or ``'latest'``)."""
+        _, key = self._resolve(name)
+        return self._load(key)
+
+    def activate(self, name: Optional[str] = LATEST):
+        """Make ``name`` the active model; ``'latest'`` follows new zips again.
+
+        Raises ``FileNotFoundError`` if the zip does not exist yet; ``refresh()``
+        still activates it once it appears.
+        """
+        with self._lock:
+            self._follow_latest = name in (None, LATEST)
+            self._pinned = None if self._follow_latest else os.path.basename(name)
+        resolved, key = self._resolve(name)
+        model = self._load(key)
+        with self._lock:
+            self._active = (resolved, key, model)
+        return model
+
+    @property
+    def active(self):
+        current = self._active
+        return current[2] if current else None
+
+    @property
+    def active_name(self) -> Optional[str]:
+        current = self._active
+        return current[0] if current else None
+
+    @property
+    def active_key(self) -> Optional[Tuple[str, int]]:
+        """``(path, mtime_ns)`` of the active model, for cache invalidation."""
+        current = self._active
+        return current[1] if current else None
+
+    # Watching
+    def start_watching(self, interval: float = 2.0):
+        """Poll the directory every ``interval`` seconds on a daemon thread."""
+        if self._watcher is not None and self._watcher.is_alive():
+            return
+        self._stop.clear()
+
+        def _run():
+            while not self._stop.wait(interval):
+                try:
+                    self.refresh()
+                except Exception:
+                    # A half-written zip fails to load; the next poll retries.
+                    continue
+
+        self._watcher = threading.Thread(target=_run, name='model-registry-watcher', daemon=True)
+        self._watcher.start()
+
+    def stop_watching(self):
+        self._stop.set()
+        if self._watcher is not None:
+            self._watcher.join()
+            self._watcher = None
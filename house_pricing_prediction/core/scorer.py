@@ -0,0 +1,118 @@
+"""Lightweight NumPy scorer for linear house price models.
+
+Serving code only needs ``X @ coef + intercept``; loading the raw coefficient
+array from a model zip avoids unpickling (and importing) scikit-learn. Models
+trained with a ``FeaturePipeline`` carry it along, compiled into the same
+NumPy expression (see ``core.pipeline``).
+"""
+from typing import TYPE_CHECKING, List, Optional
+
+import numpy as np
+
+from house_price_prediction.core.metrics import timed
+
+if TYPE_CHECKING:
+    from house_price_prediction.core.pipeline import FeaturePipeline
+
+# Zip entry holding ``[intercept, coef_0, ..., coef_n-1]`` as little-endian float64.
+COEF_ENTRY = 'coefficients.f64'
+COEF_DTYPE = np.dtype('<f8')
+
+# Rows scored per ``model.predict`` call when streaming batch predictions.
+PREDICT_CHUNK_SIZE = 65536
+
+
+def coefficients_to_bytes(coef, intercept) -> bytes:
+    values = np.concatenate([[float(intercept)], np.ravel(np.asarray(coef, dtype=np.float64))])
+    return values.astype(COEF_DTYPE).tobytes()
+
+
+class LinearScorer:
+    """Drop-in replacement for a fitted ``LinearRegression`` at predict time.
+
+    With a fitted ``pipeline``, ``coef_`` are the coefficients of its
+    ``output_names`` and ``feature_names`` are its ``input_columns``: callers
+    pass raw feature rows and the preprocessing is applied here.
+    """
+
+    def __init__(self, coef, intercept: float, feature_names: Optional[List[str]] = None,
+                 pipeline: Optional['FeaturePipeline'] = None):
+        self.coef_ = np.ascontiguousarray(coef, dtype=np.float64).ravel()
+        self.intercept_ = float(intercept)
+        self.pipeline = pipeline
+        self._kernel = None
+        if pipeline is not None:
+            self._kernel = pipeline.compile(self.coef_, self.intercept_)
+            feature_names = pipeline.input_columns
+        self.feature_names = list(feature_names or [])
+        # Artifact manifest (format version, training metadata) when loaded from one.
+        self.manifest: Optional[dict] = None
+        # Plain floats for the single-row path, which is faster than a 1x5 matmul.
+        self._coef_list = self.coef_.tolist()
+
+    @property
+    def n_features_in_(self) -> int:
+        if self._kernel is not None:
+            return self._kernel.n_inputs
+        return self.coef_.shape[0]
+
+    @classmethod
+    def from_model(cls, model, feature_names: Optional[List[str]] = None) -> 'LinearScorer':
+        return cls(model.coef_, model.intercept_, feature_names)
+
+    @classmethod
+    def from_bytes(cls, raw: bytes, feature_names: Optional[List[str]] = None) -> 'LinearScorer':
+        values = np.frombuffer(raw, dtype=COEF_DTYPE).astype(np.float64)
+        return cls(values[1:], values[0], feature_names)
+
+    @classmethod
+    def from_zip(cls, zip_path: str, allow_pickle: bool = False) -> 'LinearScorer':
+        """Load a scorer from a model artifact; see ``core.artifact.load_artifact``.
+
+        Only the coefficient array is read. Zips holding nothing but a pickled
+        estimator go through a restricted unpickler; ``allow_pickle`` lifts it.
+        """
+        from house_price_prediction.core.artifact import load_artifact
+        return load_artifact(zip_path, allow_pickle=allow_pickle)
+
+    def predict(self, X) -> np.ndarray:
+        # Not instrumented: timing every call would triple single-row latency.
+        # ``predict_in_chunks`` and ``MicroBatcher`` record 'predict' per batch.
+        X = np.asarray(X, dtype=np.float64)
+        if X.ndim == 1:
+            X = X.reshape(1, -1)
+        if self._kernel is not None:
+            return self._kernel.predict(X)
+        if X.shape[1] != self.coef_.shape[0]:
+            raise ValueError(f"Expected {self.coef_.shape[0]} features, got {X.shape[1]}")
+        return X @ self.coef_ + self.intercept_
+
+    def predict_one(self, values) -> float:
+        """Score a single row given as a sequence of floats."""
+        if self._kernel is not None:
+            return self._kernel.predict_one(values)
+        if len(values) != len(self._coef_list):
+            raise ValueError(f"Expected {len(self._coef_list)} features, got {len(values)}")
+        total = self.intercept_
+        for v, c in zip(values, self._coef_list):
+            total += float(v) * c
+        return total
+
+
+def load_scorer_zip(zip_path: str):
+    """Return ``(scorer, feature_names)`` like ``load_model_zip`` without sklearn."""
+    scorer = LinearScorer.from_zip(zip_path)
+    return scorer, scorer.feature_names
+
+
+def predict_in_chunks(model, X, chunk_size: int = PREDICT_CHUNK_SIZE):
+    """Yield predictions for ``X`` one fixed-size float64 block at a time."""
+    X = np.asarray(X, dtype=np.float64)
+    if X.ndim == 1:
+        X = X.reshape(1, -1)
+    for start in range(0, X.shape[0], chunk_size):
+        block = X[start:start + chunk_size]
+        with timed('predict') as t:
+            t.rows = block.shape[0]
+            preds = np.asarray(model.predict(block), dtype=np.float64)
+        yield preds
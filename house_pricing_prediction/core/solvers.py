@@ -0,0 +1,154 @@
+"""Closed-form ordinary least squares without forming ``inv(XᵀX)``.
+
+Three ways to solve ``min ||y - Xb - b0||²`` (intercept unpenalized, data
+centered on the column means first):
+
+* ``solve_cholesky``: factor the p x p Gram matrix ``XᵀX = LLᵀ`` and do two
+  triangular solves. Cheapest, and the Gram matrix can be accumulated block
+  by block (``blocked_gram``) so tall data never needs a centered copy; but
+  it squares the condition number of ``X``.
+* ``solve_qr``: ``X = QR`` and ``R b = Qᵀy``; works on ``X`` itself, so it
+  stays accurate on ill-conditioned data at a few times the cost.
+* ``solve_svd``: minimum-norm solution with small singular values cut off,
+  for rank-deficient data (duplicated or collinear columns), like
+  ``np.linalg.lstsq`` and scikit-learn's ``LinearRegression``.
+
+All three first scale every centered column to unit norm (and undo it on
+the coefficients). Raw housing features span ten orders of magnitude once
+squared, and without that equilibration the cut-offs and condition checks
+below would treat well-determined but small-scaled columns as noise.
+
+``least_squares(method='auto')`` tries them in that order, moving on when
+the Cholesky factor is (nearly) singular or ``R`` is rank deficient.
+"""
+from typing import Optional, Tuple
+
+import numpy as np
+
+SOLVERS = ('cholesky', 'qr', 'svd')
+
+# Rows per block when accumulating XᵀX, so temporaries stay around 8 MB per 16 columns.
+DEFAULT_BLOCK_ROWS = 65536
+
+# Largest Gram-matrix condition number trusted to Cholesky (about 1e5 for X itself).
+CHOLESKY_MAX_COND = 1e10
+
+
+def _as_xy(X, y) -> Tuple[np.ndarray, np.ndarray]:
+    X = np.asarray(X, dtype=np.float64)
+    if X.ndim == 1:
+        X = X.reshape(-1, 1)
+    y = np.asarray(y, dtype=np.float64).ravel()
+    if X.shape[0] != y.shape[0]:
+        raise ValueError(f"X has {X.shape[0]} rows but y has {y.shape[0]}")
+    if X.shape[0] == 0:
+        raise ValueError("No rows to fit.")
+    return X, y
+
+
+def blocked_gram(X, y, block_rows: int = DEFAULT_BLOCK_ROWS):
+    """Centered ``(XᵀX, Xᵀy, x_mean, y_mean)`` accumulated ``block_rows`` rows at a time.
+
+    Only one centered block exists at a time, so memory stays at
+    ``block_rows x p`` however tall ``X`` is.
+    """
+    X, y = _as_xy(X, y)
+    n, p = X.shape
+    x_mean = np.zeros(p)
+    for start in range(0, n, block_rows):
+        x_mean += X[start:start + block_rows].sum(axis=0)
+    x_mean /= n
+    y_mean = float(y.mean())
+    gram = np.zeros((p, p))
+    xty = np.zeros(p)
+    for start in range(0, n, block_rows):
+        block = X[start:start + block_rows] - x_mean
+        gram += block.T @ block
+        xty += block.T @ (y[start:start + block_rows] - y_mean)
+    return gram, xty, x_mean, y_mean
+
+
+def _column_scale(norms: np.ndarray) -> np.ndarray:
+    """1 / column norm, leaving all-zero (constant) columns at 1."""
+    return 1.0 / np.where(norms > 0, norms, 1.0)
+
+
+def solve_cholesky(gram, rhs, alpha: float = 0.0,
+                   max_cond: Optional[float] = CHOLESKY_MAX_COND) -> np.ndarray:
+    """Solve ``(gram + alpha·I) b = rhs`` with a Cholesky factorization.
+
+    The system is symmetrically scaled to a unit diagonal before factoring.
+    Raises ``np.linalg.LinAlgError`` when the matrix is not positive definite
+    or, with ``max_cond``, when the factor shows it is too ill-conditioned.
+    """
+    gram = np.asarray(gram, dtype=np.float64)
+    if alpha:
+        gram = gram + alpha * np.eye(gram.shape[0])
+    d = _column_scale(np.sqrt(np.abs(np.diag(gram))))
+    L = np.linalg.cholesky(gram * np.outer(d, d))
+    if max_cond is not None:
+        diag = np.abs(np.diag(L))
+        if diag.min() == 0.0 or (diag.max() / diag.min()) ** 2 > max_cond:
+            raise np.linalg.LinAlgError("Gram matrix is too ill-conditioned for Cholesky")
+    z = np.linalg.solve(L, d * np.asarray(rhs, dtype=np.float64))
+    return d * np.linalg.solve(L.T, z)
+
+
+def solve_qr(X, y, rtol: float = 1e-10) -> Tuple[np.ndarray, float]:
+    """``(coef, intercept)`` from a reduced QR of the centered ``X``.
+
+    Raises ``np.linalg.LinAlgError`` if ``R`` has a (relatively) zero pivot.
+    """
+    X, y = _as_xy(X, y)
+    x_mean = X.mean(axis=0)
+    y_mean = float(y.mean())
+    Xc = X - x_mean
+    scale = _column_scale(np.linalg.norm(Xc, axis=0))
+    Xc *= scale
+    Q, R = np.linalg.qr(Xc, mode='reduced')
+    d = np.abs(np.diag(R))
+    if d.size and d.min() <= rtol * d.max():
+        raise np.linalg.LinAlgError("X is rank deficient; use the SVD solver")
+    coef = scale * np.linalg.solve(R, Q.T @ (y - y_mean))
+    return coef, y_mean - float(x_mean @ coef)
+
+
+def solve_svd(X, y, rcond: Optional[float] = None) -> Tuple[np.ndarray, float]:
+    """Minimum-norm ``(coef, intercept)``; singular values below ``rcond·s_max`` are dropped."""
+    X, y = _as_xy(X, y)
+    x_mean = X.mean(axis=0)
+    y_mean = float(y.mean())
+    Xc = X - x_mean
+    scale = _column_scale(np.linalg.norm(Xc, axis=0))
+    Xc *= scale
+    U, s, Vt = np.linalg.svd(Xc, full_matrices=False)
+    if rcond is None:
+        rcond = np.finfo(np.float64).eps * max(X.shape)
+    keep = s > rcond * (s[0] if s.size else 0.0)
+    coef = scale * (Vt[keep].T @ ((U[:, keep].T @ (y - y_mean)) / s[keep]))
+    return coef, y_mean - float(x_mean @ coef)
+
+
+def least_squares(X, y, method: str = 'auto', block_rows: int = DEFAULT_BLOCK_ROWS) -> Tuple[np.ndarray, float]:
+    """OLS ``(coef, intercept)`` with ``method`` in ``SOLVERS`` or ``'auto'``.
+
+    ``'auto'`` uses Cholesky on the blocked Gram matrix and falls back to QR,
+    then SVD, when the data are too ill-conditioned for the faster path.
+    """
+    if method not in ('auto', *SOLVERS):
+        raise ValueError(f"Unknown solver {method!r}; choose from {('auto', *SOLVERS)}")
+    if method == 'qr':
+        return solve_qr(X, y)
+    if method == 'svd':
+        return solve_svd(X, y)
+    gram, xty, x_mean, y_mean = blocked_gram(X, y, block_rows)
+    try:
+        coef = solve_cholesky(gram, xty, max_cond=CHOLESKY_MAX_COND if method == 'auto' else None)
+        return coef, y_mean - float(x_mean @ coef)
+    except np.linalg.LinAlgError:
+        if method == 'cholesky':
+            raise
+    try:
+        return solve_qr(X, y)
+    except np.linalg.LinAlgError:
+        return solve_svd(X, y)
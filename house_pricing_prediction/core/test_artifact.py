@@ -0,0 +1,137 @@
+"""Model artifact round trip, array alignment and legacy zip handling."""
+import json
+import os
+import pickle
+import zipfile
+
+import numpy as np
+import pytest
+
+from house_price_prediction.benchmarks.synthetic import make_housing_frame
+from house_price_prediction.core.artifact import (
+    ARRAY_ALIGNMENT,
+    COEF_ENTRY,
+    FEATURE_NAMES_ENTRY,
+    FORMAT_VERSION,
+    LEGACY_PICKLE_ENTRY,
+    MANIFEST_ENTRY,
+    ArtifactError,
+    LegacyPickleError,
+    load_artifact,
+    read_array,
+    read_manifest,
+    save_artifact,
+    upgrade_artifact,
+)
+from house_price_prediction.core.data_loader import FEATURE_COLUMNS
+from house_price_prediction.core.scorer import coefficients_to_bytes
+
+COEF = np.array([21.6, 165_637.0, 120_660.0, 1_651.0, 15.2])
+INTERCEPT = -2_637_299.0
+
+
+def _legacy_zip(path, payload, feature_names=FEATURE_COLUMNS):
+    with zipfile.ZipFile(path, mode='w') as zf:
+        zf.writestr(LEGACY_PICKLE_ENTRY, payload)
+        zf.writestr(FEATURE_NAMES_ENTRY, json.dumps(feature_names))
+    return str(path)
+
+
+def _fitted_linear_regression():
+    from sklearn.linear_model import LinearRegression
+
+    X = make_housing_frame(50)[FEATURE_COLUMNS].to_numpy()
+    return LinearRegression().fit(X, X @ COEF + INTERCEPT)
+
+
+class _NotAModel:
+    def __reduce__(self):
+        return (os.remove, ('this-file-must-not-be-removed',))
+
+
+def test_round_trip(tmp_path):
+    path = str(tmp_path / 'model.zip')
+    manifest = save_artifact(path, COEF, INTERCEPT, FEATURE_COLUMNS, metadata={'rows': 5000})
+    scorer = load_artifact(path)
+    np.testing.assert_array_equal(scorer.coef_, COEF)
+    assert scorer.intercept_ == INTERCEPT
+    assert scorer.feature_names == FEATURE_COLUMNS
+    assert scorer.manifest == manifest == read_manifest(path)
+    assert manifest['training'] == {'rows': 5000}
+    X = make_housing_frame(3, seed=1)[FEATURE_COLUMNS].to_numpy()
+    np.testing.assert_allclose(scorer.predict(X), X @ COEF + INTERCEPT)
+
+
+def test_arrays_are_stored_aligned(tmp_path):
+    path = str(tmp_path / 'model.zip')
+    manifest = save_artifact(path, COEF, INTERCEPT, FEATURE_COLUMNS)
+    with zipfile.ZipFile(path) as zf:
+        info = zf.getinfo(COEF_ENTRY)
+    assert info.compress_type == zipfile.ZIP_STORED
+    view = read_array(path, manifest, 'coefficients', mmap=True)
+    assert isinstance(view, np.memmap)
+    assert view.offset % ARRAY_ALIGNMENT == 0
+    np.testing.assert_array_equal(view, np.concatenate([[INTERCEPT], COEF]))
+
+
+def test_checksum_mismatch_is_refused(tmp_path):
+    path = str(tmp_path / 'model.zip')
+    save_artifact(path, COEF, INTERCEPT, FEATURE_COLUMNS)
+    manifest = read_manifest(path)
+    with open(path, 'r+b') as fh:
+        data = fh.read()
+        offset = data.index(coefficients_to_bytes(COEF, INTERCEPT))
+        fh.seek(offset)
+        fh.write(b'\x01')
+    with pytest.raises(ArtifactError):
+        read_array(path, manifest, 'coefficients')
+
+
+def test_newer_format_version_is_refused(tmp_path):
+    path = str(tmp_path / 'model.zip')
+    manifest = save_artifact(path, COEF, INTERCEPT, FEATURE_COLUMNS)
+    manifest['format_version'] = FORMAT_VERSION + 1
+    newer = str(tmp_path / 'newer.zip')
+    with zipfile.ZipFile(path) as src, zipfile.ZipFile(newer, mode='w') as dst:
+        for name in src.namelist():
+            data = json.dumps(manifest) if name == MANIFEST_ENTRY else src.read(name)
+            dst.writestr(src.getinfo(name), data)
+    with pytest.raises(ArtifactError, match='Unsupported artifact version'):
+        load_artifact(newer)
+
+
+def test_legacy_coefficient_zip_loads(tmp_path):
+    path = str(tmp_path / 'legacy.zip')
+    with zipfile.ZipFile(path, mode='w') as zf:
+        zf.writestr(COEF_ENTRY, coefficients_to_bytes(COEF, INTERCEPT))
+        zf.writestr(FEATURE_NAMES_ENTRY, json.dumps(FEATURE_COLUMNS))
+    scorer = load_artifact(path)
+    np.testing.assert_array_equal(scorer.coef_, COEF)
+    assert scorer.intercept_ == INTERCEPT
+
+
+def test_legacy_pickled_linear_regression_loads_without_full_pickle(tmp_path):
+    model = _fitted_linear_regression()
+    path = _legacy_zip(tmp_path / 'legacy.zip', pickle.dumps(model))
+    scorer = load_artifact(path)
+    np.testing.assert_array_equal(scorer.coef_, model.coef_)
+    assert scorer.intercept_ == model.intercept_
+    assert scorer.feature_names == FEATURE_COLUMNS
+
+
+def test_legacy_pickle_with_other_globals_is_refused(tmp_path):
+    path = _legacy_zip(tmp_path / 'legacy.zip', pickle.dumps(_NotAModel()))
+    with pytest.raises(LegacyPickleError, match='allow_pickle'):
+        load_artifact(path)
+    with pytest.raises(LegacyPickleError):
+        upgrade_artifact(path)
+
+
+def test_upgrade_rewrites_legacy_zip(tmp_path):
+    model = _fitted_linear_regression()
+    path = _legacy_zip(tmp_path / 'legacy.zip', pickle.dumps(model))
+    manifest = upgrade_artifact(path)
+    assert read_manifest(path) == manifest
+    with zipfile.ZipFile(path) as zf:
+        assert LEGACY_PICKLE_ENTRY not in zf.namelist()
+    np.testing.assert_array_equal(load_artifact(path).coef_, model.coef_)
@@ -0,0 +1,43 @@
+"""load_dataset(use_cache=True) returns the same frame as the uncached read."""
+import numpy as np
+import pandas as pd
+import pytest
+
+from house_price_prediction.core.data_loader import HEADER_ALIASES, load_dataset
+
+DOTTED = [raw for raw in HEADER_ALIASES]
+
+
+def _write(path, frame):
+    frame.to_csv(path, index=False)
+    return str(path)
+
+
+@pytest.fixture
+def frame():
+    rng = np.random.default_rng(0)
+    return pd.DataFrame(rng.normal(size=(50, len(DOTTED))), columns=DOTTED)
+
+
+@pytest.mark.parametrize('variant', ['expected', 'reordered', 'with_address', 'missing_price'])
+def test_cached_and_uncached_reads_agree(tmp_path, frame, variant):
+    if variant == 'reordered':
+        frame = frame[frame.columns[::-1]]
+    elif variant == 'with_address':
+        frame = frame.assign(Address=[f"{i} Main St" for i in range(len(frame))])
+    elif variant == 'missing_price':
+        frame = frame.drop(columns='Price')
+    path = _write(tmp_path / 'housing.csv', frame)
+    cache_dir = str(tmp_path / 'cache')
+
+    plain = load_dataset(path)
+    for _ in range(2):
+        cached = load_dataset(path, use_cache=True, cache_dir=cache_dir)
+        pd.testing.assert_frame_equal(cached, plain, check_dtype=False)
+
+
+def test_expected_columns_are_memory_mapped(tmp_path, frame):
+    path = _write(tmp_path / 'housing.csv', frame)
+    cached = load_dataset(path, use_cache=True, cache_dir=str(tmp_path / 'cache'))
+    assert isinstance(cached['Price'].values, np.memmap)
+    assert any((tmp_path / 'cache').iterdir())
@@ -0,0 +1,102 @@
+"""Ridge, lasso and elastic-net engines against the sklearn estimators they follow."""
+import numpy as np
+import pytest
+from sklearn.linear_model import ElasticNet, Lasso, LinearRegression, Ridge
+
+from house_price_prediction.core.engines import ENGINES, GramStats, make_engine
+from house_price_prediction.core.model_utils import IncrementalLeastSquares
+
+
+def _data(n_rows=400, seed=0):
+    rng = np.random.default_rng(seed)
+    X = rng.normal(size=(n_rows, 6)) * [1.0, 2.0, 0.5, 1.0, 3.0, 1.0] + [5.0, -1.0, 0.0, 2.0, 10.0, 0.0]
+    X[:, 5] = X[:, 0] + 0.1 * rng.normal(size=n_rows)
+    y = X @ np.array([3.0, -2.0, 0.0, 0.5, 0.0, 1.0]) + 7.0 + rng.normal(size=n_rows)
+    return X, y
+
+
+def _sklearn(name, alpha, l1_ratio=0.5):
+    if name == 'ridge':
+        return Ridge(alpha=alpha)
+    if name == 'lasso':
+        return Lasso(alpha=alpha, tol=1e-12, max_iter=100_000)
+    return ElasticNet(alpha=alpha, l1_ratio=l1_ratio, tol=1e-12, max_iter=100_000)
+
+
+def _engine(name, alpha, l1_ratio=0.5):
+    return make_engine(name, alpha=alpha, l1_ratio=l1_ratio if name == 'elasticnet' else None,
+                       tol=1e-12, max_iter=100_000)
+
+
+@pytest.mark.parametrize('name', ['ridge', 'lasso', 'elasticnet'])
+@pytest.mark.parametrize('alpha', [0.01, 0.3, 5.0])
+def test_matches_sklearn(name, alpha):
+    X, y = _data()
+    ours = _engine(name, alpha).fit(X, y)
+    reference = _sklearn(name, alpha).fit(X, y)
+    np.testing.assert_allclose(ours.coef_, reference.coef_, rtol=1e-6, atol=1e-8)
+    assert ours.intercept_ == pytest.approx(reference.intercept_, rel=1e-6)
+
+
+@pytest.mark.parametrize('l1_ratio', [0.1, 0.9])
+def test_elasticnet_l1_ratio_matches_sklearn(l1_ratio):
+    X, y = _data(seed=1)
+    ours = _engine('elasticnet', 0.2, l1_ratio).fit(X, y)
+    reference = _sklearn('elasticnet', 0.2, l1_ratio).fit(X, y)
+    np.testing.assert_allclose(ours.coef_, reference.coef_, rtol=1e-6, atol=1e-8)
+
+
+def test_lasso_zeroes_coefficients_from_alpha_max():
+    X, y = _data()
+    engine = _engine('lasso', 1.0)
+    alpha_max = engine.default_alphas(GramStats.from_arrays(X, y))[0]
+    assert not np.any(engine.path(X, y, alphas=[alpha_max * 1.001])[0]['coef'])
+    assert np.any(engine.path(X, y, alphas=[alpha_max * 0.9])[0]['coef'])
+
+
+@pytest.mark.parametrize('name', ['ridge', 'lasso', 'elasticnet'])
+def test_path_matches_single_fits(name):
+    X, y = _data(seed=2)
+    alphas = [0.01, 0.1, 1.0]
+    path = _engine(name, 1.0).path(X, y, alphas=alphas)
+    assert [r['alpha'] for r in path] == sorted(alphas, reverse=True)
+    for record in path:
+        reference = _sklearn(name, record['alpha']).fit(X, y)
+        np.testing.assert_allclose(record['coef'], reference.coef_, rtol=1e-6, atol=1e-8)
+        assert record['intercept'] == pytest.approx(reference.intercept_, rel=1e-6)
+
+
+@pytest.mark.parametrize('name', ['ridge', 'lasso', 'elasticnet'])
+def test_fit_from_streamed_gram_matches_in_memory_fit(name):
+    X, y = _data(seed=3)
+    solver = IncrementalLeastSquares()
+    for start in range(0, len(X), 64):
+        solver.partial_fit(X[start:start + 64], y[start:start + 64])
+    streamed = _engine(name, 0.3).fit_gram(solver.gram_stats())
+    in_memory = _engine(name, 0.3).fit(X, y)
+    np.testing.assert_allclose(streamed.coef_, in_memory.coef_, rtol=1e-8, atol=1e-10)
+    assert streamed.intercept_ == pytest.approx(in_memory.intercept_, rel=1e-8)
+
+
+@pytest.mark.parametrize('name', ['cholesky', 'qr', 'svd'])
+def test_least_squares_solvers_match_linear_regression(name):
+    X, y = _data(seed=4)
+    ours = make_engine(name).fit(X, y)
+    reference = LinearRegression().fit(X, y)
+    np.testing.assert_allclose(ours.coef_, reference.coef_, rtol=1e-7)
+    assert ours.intercept_ == pytest.approx(reference.intercept_, rel=1e-7)
+
+
+def test_unknown_engine_is_rejected():
+    with pytest.raises(ValueError, match='Unknown engine'):
+        make_engine('sgd')
+    assert 'sgd' not in ENGINES
+
+
+@pytest.mark.parametrize('name, params', [('qr', {'alpha': 5.0}), ('ridge', {'l1_ratio': 0.5}),
+                                          ('lasso', {'epsilon': 1.35})])
+def test_params_the_engine_does_not_take_are_rejected(name, params):
+    with pytest.raises(ValueError, match='does not take'):
+        make_engine(name, **params)
+    # Unset (None) params fall back to the defaults
+    assert make_engine(name, **{k: None for k in params}).get_params() == ENGINES[name]().get_params()
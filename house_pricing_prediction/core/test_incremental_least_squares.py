@@ -0,0 +1,78 @@
+"""IncrementalLeastSquares and the streaming trainer against a batch fit."""
+import numpy as np
+import pytest
+
+from house_price_prediction.benchmarks.synthetic import make_housing_frame
+from house_price_prediction.core.data_loader import FEATURE_COLUMNS, TARGET_COLUMN
+from house_price_prediction.core.model_utils import (
+    IncrementalLeastSquares,
+    hash_split_mask,
+    train_linear_regression_streaming,
+)
+
+
+def _housing(n_rows, seed=0):
+    """Rows on the scale of the USA housing data, where XᵀX is badly conditioned."""
+    df = make_housing_frame(n_rows, seed=seed)
+    return df[FEATURE_COLUMNS].to_numpy(), df[TARGET_COLUMN].to_numpy()
+
+
+def _batch_fit(X, y):
+    A = np.column_stack([np.ones(len(X)), X])
+    values = np.linalg.lstsq(A, y, rcond=None)[0]
+    return values[1:], values[0]
+
+
+@pytest.mark.parametrize('chunksize', [1, 7, 250, 5_000])
+def test_matches_batch_fit_for_any_chunking(chunksize):
+    X, y = _housing(1_000)
+    solver = IncrementalLeastSquares()
+    for start in range(0, len(X), chunksize):
+        solver.partial_fit(X[start:start + chunksize], y[start:start + chunksize])
+    coef, intercept = solver.solve()
+    expected_coef, expected_intercept = _batch_fit(X, y)
+    assert solver.n == len(X)
+    np.testing.assert_allclose(coef, expected_coef, rtol=1e-8)
+    assert intercept == pytest.approx(expected_intercept, rel=1e-8)
+
+
+def test_empty_chunks_are_skipped():
+    X, y = _housing(200)
+    solver = IncrementalLeastSquares()
+    solver.partial_fit(X[:0], y[:0])
+    solver.partial_fit(X, y)
+    solver.partial_fit(X[:0], y[:0])
+    np.testing.assert_allclose(solver.solve()[0], _batch_fit(X, y)[0], rtol=1e-8)
+
+
+def test_solve_without_rows_raises():
+    with pytest.raises(ValueError):
+        IncrementalLeastSquares().solve()
+
+
+def test_gram_stats_are_centered():
+    X, y = _housing(300)
+    stats = IncrementalLeastSquares().partial_fit(X[:100], y[:100]).partial_fit(X[100:], y[100:]).gram_stats()
+    Xc = X - X.mean(axis=0)
+    np.testing.assert_allclose(stats.gram, Xc.T @ Xc, rtol=1e-9)
+    np.testing.assert_allclose(stats.xty, Xc.T @ (y - y.mean()), rtol=1e-9)
+    np.testing.assert_allclose(stats.x_mean, X.mean(axis=0), rtol=1e-12)
+    assert stats.n == len(X)
+
+
+def test_streaming_trainer_matches_batch_fit_on_train_rows(tmp_path):
+    X, y = _housing(2_000, seed=1)
+    path = tmp_path / 'housing.csv'
+    make_housing_frame(2_000, seed=1).to_csv(path, index=False)
+
+    model, (mae, mse, rmse), (n_train, n_test) = train_linear_regression_streaming(
+        str(path), test_size=0.2, chunksize=333, seed=7)
+
+    test = hash_split_mask(np.arange(len(X)), 0.2, seed=7)
+    expected_coef, expected_intercept = _batch_fit(X[~test], y[~test])
+    assert (n_train, n_test) == (int((~test).sum()), int(test.sum()))
+    np.testing.assert_allclose(model.coef_, expected_coef, rtol=1e-6)
+    assert model.intercept_ == pytest.approx(expected_intercept, rel=1e-6)
+    resid = y[test] - (X[test] @ expected_coef + expected_intercept)
+    assert mae == pytest.approx(np.abs(resid).mean(), rel=1e-6)
+    assert rmse == pytest.approx(np.sqrt(mse))
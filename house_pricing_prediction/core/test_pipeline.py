@@ -0,0 +1,111 @@
+"""FeaturePipeline and its compiled kernel against the equivalent sklearn Pipeline."""
+import numpy as np
+import pytest
+from sklearn.impute import SimpleImputer
+from sklearn.linear_model import LinearRegression
+from sklearn.pipeline import make_pipeline
+from sklearn.preprocessing import PolynomialFeatures, StandardScaler
+
+from house_price_prediction.benchmarks.synthetic import make_housing_frame
+from house_price_prediction.core.artifact import load_artifact, save_artifact
+from house_price_prediction.core.data_loader import FEATURE_COLUMNS, TARGET_COLUMN
+from house_price_prediction.core.pipeline import FeaturePipeline
+from house_price_prediction.core.scorer import LinearScorer
+
+CONFIGS = [
+    dict(),
+    dict(standardize=True),
+    dict(impute='mean', standardize=True),
+    dict(impute='mean', standardize=True, degree=2),
+    dict(standardize=True, degree=3, interaction_only=True),
+    dict(columns=['Avg Area Income', 'Avg Area Number of Rooms'], standardize=True, degree=2),
+]
+
+
+def _housing(n_rows, seed=0, missing=0.0):
+    """Feature frame (with ``missing`` of the cells blanked) and the price target."""
+    df = make_housing_frame(n_rows, seed=seed)
+    X = df[FEATURE_COLUMNS]
+    if missing:
+        X = X.mask(np.random.default_rng(seed).random(X.shape) < missing)
+    return X, df[TARGET_COLUMN].to_numpy()
+
+
+def _frame(n_rows, seed=0, missing=0.0):
+    return _housing(n_rows, seed, missing)[0]
+
+
+def _sklearn_steps(columns=None, impute=None, standardize=False, degree=1, interaction_only=False):
+    steps = []
+    if impute == 'mean':
+        steps.append(SimpleImputer(strategy='mean'))
+    if standardize:
+        steps.append(StandardScaler())
+    if degree > 1:
+        steps.append(PolynomialFeatures(degree, interaction_only=interaction_only, include_bias=False))
+    return steps
+
+
+def _select(df, config):
+    return df[config.get('columns') or FEATURE_COLUMNS].to_numpy()
+
+
+@pytest.mark.parametrize('config', CONFIGS)
+def test_transform_matches_sklearn(config):
+    df = _frame(500, missing=0.05 if config.get('impute') else 0.0)
+    ours = FeaturePipeline(**config).fit_transform(df)
+    steps = _sklearn_steps(**config)
+    expected = make_pipeline(*steps).fit_transform(_select(df, config)) if steps else _select(df, config)
+    np.testing.assert_allclose(ours, expected, rtol=1e-9, atol=1e-9)
+
+
+@pytest.mark.parametrize('config', CONFIGS)
+def test_output_names_match_sklearn_terms(config):
+    pipeline = FeaturePipeline(**config).fit(_frame(20))
+    n_outputs = pipeline.transform(_frame(3, seed=1)).shape[1]
+    assert len(pipeline.output_names) == n_outputs
+    if config.get('degree', 1) > 1:
+        poly = PolynomialFeatures(config['degree'], interaction_only=config.get('interaction_only', False),
+                                  include_bias=False).fit(_select(_frame(3), config))
+        assert n_outputs == poly.n_output_features_
+
+
+def test_partial_fit_matches_fit():
+    df = _frame(1_000, missing=0.05)
+    whole = FeaturePipeline(impute='mean', standardize=True).fit(df)
+    chunked = FeaturePipeline(impute='mean', standardize=True)
+    for start in range(0, len(df), 137):
+        chunked.partial_fit(df.iloc[start:start + 137])
+    np.testing.assert_allclose(chunked.fill_, whole.fill_, rtol=1e-12)
+    np.testing.assert_allclose(chunked.mean_, whole.mean_, rtol=1e-12)
+    np.testing.assert_allclose(chunked.scale_, whole.scale_, rtol=1e-10)
+
+
+@pytest.mark.parametrize('config', CONFIGS)
+def test_compiled_predictions_match_sklearn_pipeline(config):
+    train, y = _housing(800, missing=0.05 if config.get('impute') else 0.0)
+    test = _frame(50, seed=2, missing=0.1 if config.get('impute') else 0.0)
+
+    reference = make_pipeline(*_sklearn_steps(**config), LinearRegression()).fit(_select(train, config), y)
+    pipeline = FeaturePipeline(**config)
+    model = LinearRegression().fit(pipeline.fit_transform(train), y)
+    scorer = LinearScorer(model.coef_, model.intercept_, pipeline=pipeline)
+
+    expected = reference.predict(_select(test, config))
+    np.testing.assert_allclose(scorer.predict(test.to_numpy()), expected, rtol=1e-7)
+    for row, value in zip(test.to_numpy()[:5], expected[:5]):
+        assert scorer.predict_one(list(row)) == pytest.approx(value, rel=1e-7)
+
+
+def test_pipeline_survives_the_artifact(tmp_path):
+    train, y = _housing(300, missing=0.05)
+    pipeline = FeaturePipeline(impute='mean', standardize=True, degree=2)
+    model = LinearRegression().fit(pipeline.fit_transform(train), y)
+    path = str(tmp_path / 'model.zip')
+    save_artifact(path, model.coef_, model.intercept_, FEATURE_COLUMNS, pipeline=pipeline)
+
+    loaded = load_artifact(path)
+    test = _frame(20, seed=3, missing=0.1).to_numpy()
+    expected = LinearScorer(model.coef_, model.intercept_, pipeline=pipeline).predict(test)
+    assert loaded.pipeline.get_params() == pipeline.get_params()
+    np.testing.assert_array_equal(loaded.predict(test), expected)
@@ -0,0 +1,46 @@
+"""PredictionCache keys, invalidation and the front-ends' opt-in."""
+import numpy as np
+
+from house_price_prediction.core.prediction_cache import CACHE_SIZE_ENV, PredictionCache, cache_from_env
+from house_price_prediction.core.scorer import LinearScorer
+
+
+def _scorer(intercept=0.0):
+    return LinearScorer(np.ones(2), intercept, ['a', 'b'])
+
+
+def test_front_end_cache_is_off_unless_configured(monkeypatch):
+    monkeypatch.delenv(CACHE_SIZE_ENV, raising=False)
+    assert cache_from_env() is None
+    monkeypatch.setenv(CACHE_SIZE_ENV, '0')
+    assert cache_from_env() is None
+    monkeypatch.setenv(CACHE_SIZE_ENV, 'lots')
+    assert cache_from_env() is None
+    monkeypatch.setenv(CACHE_SIZE_ENV, '16')
+    cache = cache_from_env()
+    assert cache.maxsize == 16 and cache.ttl is None
+
+
+def test_rows_rounding_to_one_key_share_an_entry():
+    cache = PredictionCache(decimals=1)
+    model = _scorer()
+    assert cache.predict_one(model, [1.04, 2.0]) == 3.0
+    assert cache.predict_one(model, [0.96, 2.01]) == 3.0
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_new_model_object_clears_the_cache():
+    cache = PredictionCache()
+    assert cache.predict_one(_scorer(0.0), [1.0, 1.0]) == 2.0
+    assert cache.predict_one(_scorer(10.0), [1.0, 1.0]) == 12.0
+    assert cache.invalidations == 1
+
+
+def test_entries_expire_after_ttl():
+    now = [0.0]
+    cache = PredictionCache(ttl=5.0, clock=lambda: now[0])
+    model = _scorer()
+    cache.predict_one(model, [1.0, 1.0])
+    now[0] = 6.0
+    cache.predict_one(model, [1.0, 1.0])
+    assert (cache.hits, cache.expirations) == (0, 1)
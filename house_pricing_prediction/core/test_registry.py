@@ -0,0 +1,79 @@
+"""ModelRegistry activation, reloads and cold starts on an empty models directory."""
+import os
+
+import numpy as np
+import pytest
+
+from house_price_prediction.core.artifact import save_artifact
+from house_price_prediction.core.data_loader import FEATURE_COLUMNS
+from house_price_prediction.core.registry import ModelRegistry
+
+
+def _save(path, intercept, mtime_ns=None):
+    save_artifact(str(path), np.ones(len(FEATURE_COLUMNS)), intercept, FEATURE_COLUMNS)
+    if mtime_ns is not None:
+        os.utime(path, ns=(mtime_ns, mtime_ns))
+    return path
+
+
+def test_empty_dir_activates_first_zip_on_refresh(tmp_path):
+    registry = ModelRegistry(tmp_path)
+    with pytest.raises(FileNotFoundError):
+        registry.activate()
+    assert not registry.refresh()
+    assert registry.active is None
+
+    _save(tmp_path / 'house_price_model.zip', 10.0)
+    assert registry.refresh()
+    assert registry.active_name == 'house_price_model.zip'
+    assert registry.active.intercept_ == 10.0
+
+
+def test_registry_that_never_activated_follows_latest(tmp_path):
+    _save(tmp_path / 'a.zip', 1.0, mtime_ns=1_000_000_000)
+    _save(tmp_path / 'b.zip', 2.0, mtime_ns=2_000_000_000)
+    registry = ModelRegistry(tmp_path)
+    assert registry.refresh()
+    assert registry.active_name == 'b.zip'
+    _save(tmp_path / 'c.zip', 3.0, mtime_ns=3_000_000_000)
+    assert registry.refresh()
+    assert registry.active_name == 'c.zip'
+    assert not registry.refresh()
+
+
+def test_missing_pinned_zip_is_activated_once_it_appears(tmp_path):
+    _save(tmp_path / 'other.zip', 1.0)
+    registry = ModelRegistry(tmp_path)
+    with pytest.raises(FileNotFoundError):
+        registry.activate('house_price_model.zip')
+    assert not registry.refresh()
+    assert registry.active is None
+
+    _save(tmp_path / 'house_price_model.zip', 5.0)
+    assert registry.refresh()
+    assert registry.active_name == 'house_price_model.zip'
+
+
+def test_deleted_pinned_zip_comes_back(tmp_path):
+    path = _save(tmp_path / 'house_price_model.zip', 1.0, mtime_ns=1_000_000_000)
+    _save(tmp_path / 'newer.zip', 9.0, mtime_ns=2_000_000_000)
+    registry = ModelRegistry(tmp_path)
+    registry.activate('house_price_model.zip')
+
+    os.remove(path)
+    assert registry.refresh()
+    assert registry.active is None
+    _save(path, 2.0)
+    assert registry.refresh()
+    assert registry.active_name == 'house_price_model.zip'
+    assert registry.active.intercept_ == 2.0
+
+
+def test_rewritten_zip_is_reloaded(tmp_path):
+    path = _save(tmp_path / 'house_price_model.zip', 1.0, mtime_ns=1_000_000_000)
+    registry = ModelRegistry(tmp_path)
+    registry.activate('house_price_model.zip')
+    _save(path, 4.0, mtime_ns=2_000_000_000)
+    assert registry.refresh()
+    assert registry.active.intercept_ == 4.0
+    assert registry.active_key == (str(path), 2_000_000_000)
@@ -0,0 +1,230 @@
+import argparse
+import glob
+import json
+import os
+import sys
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Sequence
+
+from house_price_prediction.core.data_loader import DEFAULT_CHUNKSIZE, FEATURE_COLUMNS, iter_dataset
+from house_price_prediction.core.metrics import REGISTRY, timed
+from house_price_prediction.core.scorer import LinearScorer
+
+PREDICTION_COLUMN = 'Predicted Price'
+
+
+class EmptyInputError(ValueError):
+    """An input file has no rows to score."""
+
+
+def parquet_available() -> bool:
+    try:
+        import pyarrow.parquet  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def expand_inputs(patterns):
+    """Expand globs in ``patterns``, keeping order and dropping duplicates."""
+    paths, seen = [], set()
+    for pattern in patterns:
+        matches = sorted(glob.glob(pattern)) if glob.has_magic(pattern) else [pattern]
+        if not matches:
+            raise FileNotFoundError(f"No input matches: {pattern}")
+        for path in matches:
+            key = os.path.abspath(path)
+            if key not in seen:
+                seen.add(key)
+                paths.append(path)
+    return paths
+
+
+def output_path(in_path: str, out: str, fmt: str, single: bool) -> str:
+    """``out`` itself for one input scored into a file, else ``out/<name>.predictions.<fmt>``."""
+    if single and not os.path.isdir(out) and os.path.splitext(out)[1]:
+        return out
+    stem = os.path.splitext(os.path.basename(in_path))[0]
+    return os.path.join(out, f"{stem}.predictions.{fmt}")
+
+
+def output_paths(paths, out: str, fmt: str):
+    """Output path of each input; inputs sharing a name keep their parent dirs under ``out``.
+
+    Raises ``ValueError`` if two inputs would still write the same file.
+    """
+    single = len(paths) == 1
+    outs = [output_path(p, out, fmt, single) for p in paths]
+    counts = Counter(outs)
+    if len(counts) < len(outs):
+        root = os.path.commonpath([os.path.dirname(os.path.abspath(p)) for p in paths])
+        for i, p in enumerate(paths):
+            if counts[outs[i]] > 1:
+                rel = os.path.relpath(os.path.splitext(os.path.abspath(p))[0], root)
+                outs[i] = os.path.join(out, f"{rel}.predictions.{fmt}")
+    seen = {}
+    for p, o in zip(paths, outs):
+        if o in seen:
+            raise ValueError(f"{seen[o]} and {p} would both be written to {o}")
+        seen[o] = p
+    return outs
+
+
+class _CsvSink:
+    def __init__(self, path):
+        self.fh = open(path, 'w', encoding='utf-8', newline='')
+        self.header = True
+
+    def write(self, frame):
+        frame.to_csv(self.fh, index=False, header=self.header)
+        self.header = False
+
+    def close(self):
+        self.fh.close()
+
+
+class _ParquetSink:
+    def __init__(self, path):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+        self.pa = pa
+        self.pq = pq
+        self.path = path
+        self.writer = None
+        self.closed = False
+
+    def write(self, frame):
+        table = self.pa.Table.from_pandas(frame, preserve_index=False)
+        if self.writer is None:
+            self.writer = self.pq.ParquetWriter(self.path, table.schema)
+        self.writer.write_table(table)
+
+    def close(self):
+        if not self.closed and self.writer is not None:
+            self.writer.close()
+        self.closed = True
+
+
+def score_file(model_zip: str, in_path: str, out_path: str, fmt: str = 'csv',
+               chunksize: int = DEFAULT_CHUNKSIZE, predictions_only: bool = False,
+               keep: Sequence[str] = ()) -> dict:
+    """Stream ``in_path`` through the model chunk by chunk and write the predictions.
+
+    Only the model's feature columns and the ``keep`` columns (ids such as
+    ``Address``, copied in front of each output row) are parsed. The output
+    is written next to ``out_path`` and moved into place when complete.
+    Raises ``EmptyInputError`` for a file without rows, writing nothing.
+    Runs in pool workers too, so it loads the model itself (the NumPy
+    scorer, no sklearn).
+    """
+    start = time.perf_counter()
+    if os.path.getsize(in_path) == 0:
+        raise EmptyInputError(f"No rows to score in {in_path}")
+    scorer = LinearScorer.from_zip(model_zip)
+    columns = scorer.feature_names or list(FEATURE_COLUMNS)
+    keep = [c for c in keep if c not in columns]
+    os.makedirs(os.path.dirname(os.path.abspath(out_path)), exist_ok=True)
+    tmp = f'{out_path}.tmp{os.getpid()}'
+    sink = _ParquetSink(tmp) if fmt == 'parquet' else _CsvSink(tmp)
+    rows = 0
+    try:
+        with timed('score_file') as t:
+            t.bytes_read = os.path.getsize(in_path)
+            for chunk in iter_dataset(in_path, chunksize=chunksize, columns=columns, passthrough=keep):
+                preds = scorer.predict(chunk[columns].to_numpy())
+                frame = chunk[keep if predictions_only else [*keep, *columns]]
+                frame = frame.assign(**{PREDICTION_COLUMN: preds})
+                sink.write(frame)
+                rows += len(frame)
+            t.rows = rows
+        sink.close()
+        if not rows:
+            raise EmptyInputError(f"No rows to score in {in_path}")
+        os.replace(tmp, out_path)
+    except BaseException:
+        sink.close()
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
+    seconds = time.perf_counter() - start
+    return {'input': in_path, 'output': out_path, 'rows': rows, 'seconds': seconds,
+            'rows_per_sec': rows / seconds if seconds else 0.0}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Score CSV files with a trained house price model")
+    parser.add_argument("inputs", nargs="+", help="Input CSV files or glob patterns (quote globs)")
+    parser.add_argument("--model", default="house_price_prediction/models/house_price_model.zip", help="Model zip to score with")
+    parser.add_argument("--out", default="house_price_prediction/predictions",
+                        help="Output directory, or an output file when scoring a single input")
+    parser.add_argument("--format", choices=["csv", "parquet"], default=None,
+                        help="Output format (default: from --out's extension, else csv)")
+    parser.add_argument("--chunksize", type=int, default=DEFAULT_CHUNKSIZE, help="Rows per chunk")
+    parser.add_argument("--jobs", type=int, default=1, help="Worker processes, one input file each")
+    parser.add_argument("--predictions_only", action="store_true",
+                        help="Write only the prediction column (and --keep columns) instead of features + prediction")
+    parser.add_argument("--keep", default="",
+                        help="Comma-separated id columns copied to the output, e.g. Address")
+    parser.add_argument("--metrics_out", default=None,
+                        help="Write latency/rows/bytes histograms of each step to this JSON file")
+    args = parser.parse_args()
+
+    paths = expand_inputs(args.inputs)
+    fmt = args.format or ('parquet' if args.out.endswith('.parquet') else 'csv')
+    if fmt == 'parquet' and not parquet_available():
+        parser.error("--format parquet needs pyarrow (pip install pyarrow)")
+    # Fail on a bad model before any worker starts.
+    scorer = LinearScorer.from_zip(args.model)
+    print(f"Model: {os.path.abspath(args.model)} ({len(scorer.feature_names)} features)")
+
+    try:
+        jobs = list(zip(paths, output_paths(paths, args.out, fmt)))
+    except ValueError as e:
+        parser.error(str(e))
+    keep = [c.strip() for c in args.keep.split(',') if c.strip()]
+    start = time.perf_counter()
+    results, skipped = [], []
+
+    def collect(path, run):
+        try:
+            result = run()
+        except EmptyInputError as e:
+            # One empty export must not abort the other files of the run.
+            print(f"Warning: {e}; skipped.", file=sys.stderr)
+            skipped.append(path)
+            return
+        results.append(result)
+        print(f"{path}: {result['rows']} rows, {result['rows_per_sec']:,.0f} rows/s")
+
+    if args.jobs > 1 and len(jobs) > 1:
+        with ProcessPoolExecutor(max_workers=min(args.jobs, len(jobs))) as pool:
+            futures = {pool.submit(score_file, args.model, p, o, fmt, args.chunksize, args.predictions_only, keep): p
+                       for p, o in jobs}
+            for future in as_completed(futures):
+                collect(futures[future], future.result)
+    else:
+        for p, o in jobs:
+            collect(p, lambda: score_file(args.model, p, o, fmt, args.chunksize, args.predictions_only, keep))
+
+    elapsed = time.perf_counter() - start
+    total = sum(r['rows'] for r in results)
+    print(f"\nScored {total} rows from {len(results)} file(s) in {elapsed:.2f}s "
+          f"({total / elapsed if elapsed else 0.0:,.0f} rows/s)")
+    if skipped:
+        print(f"Skipped {len(skipped)} empty file(s): {', '.join(skipped)}")
+    for r in results:
+        print(f"Predictions saved to: {os.path.abspath(r['output'])}")
+
+    if args.metrics_out:
+        # Pool workers keep their own registries; their per-file totals are in 'files'.
+        report = {'args': vars(args), 'files': results, 'skipped': skipped, 'metrics': REGISTRY.snapshot()}
+        os.makedirs(os.path.dirname(os.path.abspath(args.metrics_out)), exist_ok=True)
+        with open(args.metrics_out, 'w', encoding='utf-8') as fh:
+            json.dump(report, fh, indent=2)
+        print(f"Metrics report saved to: {os.path.abspath(args.metrics_out)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""score_console: id passthrough, empty inputs and output naming."""
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from house_price_prediction.core.artifact import save_artifact
+from house_price_prediction.core.data_loader import FEATURE_COLUMNS
+from house_price_prediction.score_console import PREDICTION_COLUMN, EmptyInputError, output_paths, score_file
+
+
+@pytest.fixture
+def model_zip(tmp_path):
+    path = str(tmp_path / 'model.zip')
+    save_artifact(path, np.arange(1.0, len(FEATURE_COLUMNS) + 1), 10.0, FEATURE_COLUMNS)
+    return path
+
+
+def _inputs(tmp_path, n_rows=25):
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame(rng.normal(size=(n_rows, len(FEATURE_COLUMNS))), columns=FEATURE_COLUMNS)
+    df.insert(0, 'Address', [f"{i} Main St" for i in range(n_rows)])
+    path = tmp_path / 'houses.csv'
+    df.to_csv(path, index=False)
+    return str(path), df
+
+
+@pytest.mark.parametrize('predictions_only', [False, True])
+def test_keep_columns_are_copied_in_front(tmp_path, model_zip, predictions_only):
+    in_path, df = _inputs(tmp_path)
+    out_path = str(tmp_path / 'out.csv')
+    result = score_file(model_zip, in_path, out_path, chunksize=7, predictions_only=predictions_only,
+                        keep=['Address'])
+    out = pd.read_csv(out_path)
+    expected_columns = ['Address', PREDICTION_COLUMN] if predictions_only else ['Address', *FEATURE_COLUMNS,
+                                                                              PREDICTION_COLUMN]
+    assert list(out.columns) == expected_columns
+    assert result['rows'] == len(df)
+    assert out['Address'].tolist() == df['Address'].tolist()
+    expected = df[FEATURE_COLUMNS].to_numpy() @ np.arange(1.0, len(FEATURE_COLUMNS) + 1) + 10.0
+    np.testing.assert_allclose(out[PREDICTION_COLUMN], expected)
+
+
+@pytest.mark.parametrize('content', ['', ','.join(FEATURE_COLUMNS) + '\n'])
+def test_empty_input_raises_and_writes_nothing(tmp_path, model_zip, content):
+    in_path = tmp_path / 'empty.csv'
+    in_path.write_text(content)
+    out_path = tmp_path / 'out' / 'empty.predictions.csv'
+    with pytest.raises(EmptyInputError):
+        score_file(model_zip, str(in_path), str(out_path))
+    assert not out_path.exists()
+
+
+def test_output_paths_keep_colliding_inputs_apart(tmp_path):
+    paths = [str(tmp_path / 'east' / 'houses.csv'), str(tmp_path / 'west' / 'houses.csv'), str(tmp_path / 'x.csv')]
+    outs = output_paths(paths, 'out', 'csv')
+    assert len(set(outs)) == 3
+    assert outs[2] == os.path.join('out', 'x.predictions.csv')
+    with pytest.raises(ValueError):
+        output_paths([str(tmp_path / 'a.csv'), str(tmp_path / 'a.txt')], 'out', 'csv')
@@ -1,12 +1,39 @@
 import argparse
+import json
 import os
 
 import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
 
-from house_price_prediction.core.data_loader import load_dataset, split_features_target
-from house_price_prediction.core.model_utils import train_linear_regression, model_summary, save_model_zip
+from house_price_prediction.core.engines import ENGINES, make_engine
+from house_price_prediction.core.data_loader import DEFAULT_CHUNKSIZE, FEATURE_COLUMNS, load_dataset, split_features_target
+from house_price_prediction.core.metrics import REGISTRY
+from house_price_prediction.core.model_utils import (
+    coefficient_names,
+    cross_validate_linear_regression,
+    model_summary,
+    regularization_sweep,
+    save_model_zip,
+    summarize_cv,
+    train_linear_regression,
+    train_linear_regression_streaming,
+)
+from house_price_prediction.core.pipeline import FeaturePipeline
+
+
+def save_correlation_heatmap(df: pd.DataFrame, out_path: str) -> str:
+    # matplotlib/seaborn are only imported when a plot is actually drawn.
+    import matplotlib
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+
+    os.makedirs(os.path.dirname(out_path), exist_ok=True)
+    plt.figure(figsize=(6,5))
+    sns.heatmap(df.corr(numeric_only=True), annot=True, cmap="magma")
+    plt.tight_layout()
+    plt.savefig(out_path)
+    plt.close()
+    return out_path
 
 
 def main():
@@ -14,32 +41,89 @@ def main():
     parser.add_argument("--data", required=True, help="Path to dataset CSV (USA Housing style)")
     parser.add_argument("--out", default="house_price_prediction/models/house_price_model.zip", help="Output zip path for saved model")
     parser.add_argument("--test_size", type=float, default=0.2, help="Test size fraction")
+    parser.add_argument("--streaming", action="store_true", help="Fit out-of-core from CSV chunks (for datasets larger than memory)")
+    parser.add_argument("--chunksize", type=int, default=DEFAULT_CHUNKSIZE, help="Rows per chunk in --streaming mode")
+    parser.add_argument("--no-plots", dest="no_plots", action="store_true",
+                        help="Skip the correlation heatmap (and the matplotlib/seaborn imports)")
+    parser.add_argument("--cache", action="store_true",
+                        help="Load through the memory-mapped dataset cache (parsed once per file content)")
+    parser.add_argument("--cv", type=int, default=0, help="Run K-fold cross-validation with this many folds")
+    parser.add_argument("--train_rates", default=None,
+                        help="Comma-separated training rates in percent (e.g. 50,60,70,80,90,95) for a learning curve; "
+                             "uses --cv splits per rate (5 if --cv is not given)")
+    parser.add_argument("--jobs", type=int, default=None, help="Worker processes for --cv (default: all cores)")
+    parser.add_argument("--metrics_out", default=None,
+                        help="Write latency/rows/bytes histograms of each step to this JSON file")
+    parser.add_argument("--features", default=None,
+                        help="Comma-separated feature columns the model uses (default: all five)")
+    parser.add_argument("--impute", choices=["mean"], default=None,
+                        help="Fill missing feature values with the training mean")
+    parser.add_argument("--standardize", action="store_true", help="Scale features to zero mean, unit variance")
+    parser.add_argument("--degree", type=int, default=1, help="Add polynomial terms up to this degree")
+    parser.add_argument("--interaction_only", action="store_true",
+                        help="With --degree > 1, only add products of different features")
+    parser.add_argument("--engine", choices=["ols", *ENGINES], default="ols",
+                        help="Fit: ordinary least squares, ridge, lasso, elasticnet, huber (robust), "
+                             "or plain least squares through the cholesky, qr or svd solver")
+    parser.add_argument("--alpha", type=float, default=None, help="Regularization strength for --engine")
+    parser.add_argument("--l1_ratio", type=float, default=None, help="L1 share of the elasticnet penalty")
+    parser.add_argument("--epsilon", type=float, default=None, help="Huber threshold in robust scales")
+    parser.add_argument("--alphas", default=None,
+                        help="Comma-separated alphas to sweep for --engine ('auto': 20 log-spaced); "
+                             "the whole path is solved off one Gram matrix")
     args = parser.parse_args()
+    if args.train_rates and not args.cv:
+        args.cv = 5
 
-    df = load_dataset(args.data)
+    engine_params = {'alpha': args.alpha, 'l1_ratio': args.l1_ratio, 'epsilon': args.epsilon}
+    given = [k for k, v in engine_params.items() if v is not None]
+    if args.engine == "ols" and given:
+        parser.error(f"--engine ols does not take {', '.join('--' + k for k in given)}")
+    if args.engine != "ols":
+        try:
+            make_engine(args.engine, **engine_params)
+        except ValueError as e:
+            parser.error(str(e))
+    if args.streaming and args.engine != "ols" and not ENGINES[args.engine].uses_gram:
+        parser.error(f"--engine {args.engine} needs the rows in memory; it cannot be used with --streaming")
+    pipeline = None
+    if args.features or args.impute or args.standardize or args.degree > 1:
+        columns = [c.strip() for c in args.features.split(',')] if args.features else None
+        pipeline = FeaturePipeline(columns, impute=args.impute, standardize=args.standardize,
+                                   degree=args.degree, interaction_only=args.interaction_only)
+        print(f"Feature pipeline: {pipeline}")
 
-    # In ra head và describe theo đúng hướng dẫn
-    print("\n=== Head (5 dòng đầu) ===")
-    print(df.head())
-    print("\n=== Describe ===")
-    print(df.describe())
+    if args.streaming:
+        # Head/describe/heatmap need the whole frame, so streaming mode skips them.
+        model, (mae, mse, rmse), (n_train, n_test) = train_linear_regression_streaming(
+            args.data, test_size=args.test_size, chunksize=args.chunksize, pipeline=pipeline,
+            engine=args.engine, engine_params=engine_params)
+        feature_names = list(FEATURE_COLUMNS)
+        n_rows = n_train + n_test
+        print(f"\nStreamed {n_train} training rows and {n_test} test rows")
+    else:
+        df = load_dataset(args.data, use_cache=args.cache)
 
-    # Vẽ heatmap tương quan và lưu ảnh
-    os.makedirs("house_price_prediction/images", exist_ok=True)
-    plt.figure(figsize=(6,5))
-    sns.heatmap(df.corr(numeric_only=True), annot=True, cmap="magma")
-    plt.tight_layout()
-    corr_path = "house_price_prediction/images/correlation.png"
-    plt.savefig(corr_path)
-    plt.close()
-    print(f"\nHeatmap correlation saved: {os.path.abspath(corr_path)}")
-    X, y = split_features_target(df)
-    model, (mae, mse, rmse), (X_train, X_test, y_train, y_test, y_pred) = train_linear_regression(X, y, test_size=args.test_size)
+        # In ra head và describe theo đúng hướng dẫn
+        print("\n=== Head (5 dòng đầu) ===")
+        print(df.head())
+        print("\n=== Describe ===")
+        print(df.describe())
+
+        # Vẽ heatmap tương quan và lưu ảnh
+        if not args.no_plots:
+            corr_path = save_correlation_heatmap(df, "house_price_prediction/images/correlation.png")
+            print(f"\nHeatmap correlation saved: {os.path.abspath(corr_path)}")
+        X, y = split_features_target(df)
+        model, (mae, mse, rmse), (X_train, X_test, y_train, y_test, y_pred) = train_linear_regression(
+            X, y, test_size=args.test_size, pipeline=pipeline, engine=args.engine, engine_params=engine_params)
+        feature_names = list(X.columns)
+        n_rows = len(X)
 
     print("\n=== Model Summary ===")
-    print(model_summary(model, list(X.columns)))
+    print(model_summary(model, feature_names))
     # In coefficients dạng DataFrame giống tài liệu
-    coef_df = pd.DataFrame(model.coef_, list(X.columns), columns=['Coefficient'])
+    coef_df = pd.DataFrame(model.coef_, coefficient_names(model, feature_names), columns=['Coefficient'])
     print("\nCoefficients DataFrame:")
     print(coef_df)
     print("\n=== Evaluation ===")
@@ -47,11 +131,55 @@ def main():
     print(f"MSE: {mse}")
     print(f"RMSE: {rmse}")
 
+    if args.cv and args.streaming:
+        print("\n--cv needs the data in memory; skipped in --streaming mode")
+    elif args.cv:
+        rates = None
+        if args.train_rates:
+            rates = [float(r) / 100.0 for r in args.train_rates.split(',')]
+        records = cross_validate_linear_regression(X, y, n_splits=args.cv, train_rates=rates, n_jobs=args.jobs,
+                                                   pipeline=pipeline, engine=args.engine,
+                                                   engine_params=engine_params)
+        print("\n=== Cross-validation ===")
+        print(pd.DataFrame(records).to_string(index=False))
+        for rate, metrics in summarize_cv(records).items():
+            parts = [f"{m.upper()} {v['mean']:.4f} ± {v['std']:.4f}" for m, v in metrics.items()]
+            print(f"Training Rate {rate:.0%}: " + ", ".join(parts))
+
+    if args.alphas and (args.streaming or args.engine == "ols"):
+        print("\n--alphas needs --engine other than ols and the data in memory; skipped")
+    elif args.alphas:
+        alphas = None if args.alphas == "auto" else [float(a) for a in args.alphas.split(',')]
+        sweep = regularization_sweep(X, y, args.engine, alphas=alphas, test_size=args.test_size,
+                                     pipeline=pipeline, engine_params=engine_params)
+        print(f"\n=== {args.engine} regularization path ===")
+        print(pd.DataFrame(sweep).to_string(index=False))
+        best = min(sweep, key=lambda r: r['rmse'])
+        print(f"Best alpha by test RMSE: {best['alpha']:.6g} (RMSE {best['rmse']:.4f})")
+
     # ensure output dir exists
     os.makedirs(os.path.dirname(args.out), exist_ok=True)
-    save_model_zip(model, list(X.columns), args.out)
+    metadata = {
+        'data': os.path.abspath(args.data),
+        'rows': int(n_rows),
+        'test_size': args.test_size,
+        'streaming': bool(args.streaming),
+        'engine': args.engine,
+        'engine_params': {k: v for k, v in engine_params.items() if v is not None},
+        'mae': float(mae),
+        'mse': float(mse),
+        'rmse': float(rmse),
+    }
+    save_model_zip(model, feature_names, args.out, metadata)
     print(f"\nModel saved to: {os.path.abspath(args.out)}")
 
+    if args.metrics_out:
+        report = {'args': vars(args), 'metrics': REGISTRY.snapshot()}
+        os.makedirs(os.path.dirname(os.path.abspath(args.metrics_out)), exist_ok=True)
+        with open(args.metrics_out, 'w', encoding='utf-8') as fh:
+            json.dump(report, fh, indent=2)
+        print(f"Metrics report saved to: {os.path.abspath(args.metrics_out)}")
+
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
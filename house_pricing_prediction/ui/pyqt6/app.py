@@ -2,7 +2,8 @@ import os
 from pathlib import Path
 import sys
 from PyQt6 import QtWidgets
-from house_price_prediction.core.model_utils import load_model_zip
+from house_price_prediction.core.prediction_cache import cache_from_env
+from house_price_prediction.core.registry import ModelRegistry
 
 
 BASE_DIR = Path(__file__).resolve().parents[2]
@@ -13,10 +14,22 @@ class HousePriceWindow(QtWidgets.QWidget):
     def __init__(self):
         super().__init__()
         self.setWindowTitle("House Price Predictor — PyQt6")
-        self.model = None
-        self.feature_names = []
+        self.registry = ModelRegistry(os.path.dirname(MODEL_ZIP))
+        # Optional; a reloaded zip is a new model object, which clears the cache
+        self.cache = cache_from_env()
         self._build_ui()
         self._load_model()
+        # Pick up new or rewritten zips while the window is open
+        self.registry.start_watching()
+
+    @property
+    def model(self):
+        # Resolved on every use so a model swapped in by the watcher is served at once
+        return self.registry.active
+
+    @property
+    def feature_names(self):
+        return getattr(self.model, 'feature_names', [])
 
     def _build_ui(self):
         layout = QtWidgets.QFormLayout(self)
@@ -47,25 +60,26 @@ class HousePriceWindow(QtWidgets.QWidget):
 
     def _load_model(self):
         try:
-            self.model, self.feature_names = load_model_zip(MODEL_ZIP)
+            self.registry.refresh()
+            self.registry.activate(os.path.basename(MODEL_ZIP))
             self.result_label.setText(f"Loaded model: {os.path.basename(MODEL_ZIP)}")
         except Exception:
-            self.model, self.feature_names = None, []
             self.result_label.setText("Model not found. Train first.")
 
     def predict(self):
-        if not self.model:
+        model = self.model
+        if model is None:
             QtWidgets.QMessageBox.critical(self, "Error", "Model not loaded.")
             return
         try:
-            x = [[
+            x = [
                 float(self.inputs['Avg Area Income'].text()),
                 float(self.inputs['Avg Area House Age'].text()),
                 float(self.inputs['Avg Area Number of Rooms'].text()),
                 float(self.inputs['Avg Area Number of Bedrooms'].text()),
                 float(self.inputs['Area Population'].text()),
-            ]]
-            pred = float(self.model.predict(x)[0])
+            ]
+            pred = self.cache.predict_one(model, x) if self.cache is not None else model.predict_one(x)
             self.result_label.setText(f"Predicted Price: {pred:,.2f}")
         except Exception as e:
             QtWidgets.QMessageBox.critical(self, "Error", f"Invalid input: {e}")
@@ -0,0 +1,86 @@
+import queue
+import threading
+
+
+class TaskCancelled(Exception):
+    """Raised inside a worker when the user cancelled the task."""
+
+
+class BackgroundTask:
+    """Run ``fn(task)`` on a worker thread and marshal results back to Tk.
+
+    The worker reports through ``task.progress(fraction, message)`` and should
+    call ``task.check_cancelled()`` between steps. Callbacks (``on_progress``,
+    ``on_done``, ``on_error``, ``on_cancel``) always run on the Tk main loop,
+    polled with ``widget.after``, because Tk is not thread-safe.
+    """
+
+    def __init__(self, widget, fn, on_done=None, on_error=None, on_progress=None, on_cancel=None,
+                 poll_ms: int = 50):
+        self.widget = widget
+        self.fn = fn
+        self.on_done = on_done
+        self.on_error = on_error
+        self.on_progress = on_progress
+        self.on_cancel = on_cancel
+        self.poll_ms = poll_ms
+        self._events = queue.Queue()
+        self._cancel = threading.Event()
+        self._thread = None
+        self.finished = False
+
+    # Worker side
+    def progress(self, fraction=None, message=''):
+        self._events.put(('progress', (fraction, message)))
+
+    def check_cancelled(self):
+        if self._cancel.is_set():
+            raise TaskCancelled()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancel.is_set()
+
+    def _run(self):
+        try:
+            result = self.fn(self)
+            self.check_cancelled()
+            self._events.put(('done', result))
+        except TaskCancelled:
+            self._events.put(('cancelled', None))
+        except Exception as e:
+            self._events.put(('error', e))
+
+    # Tk side
+    def start(self):
+        self._thread = threading.Thread(target=self._run, name='tk-background-task', daemon=True)
+        self._thread.start()
+        self.widget.after(self.poll_ms, self._poll)
+        return self
+
+    def cancel(self):
+        self._cancel.set()
+
+    @property
+    def running(self) -> bool:
+        return not self.finished
+
+    def _poll(self):
+        while True:
+            try:
+                kind, payload = self._events.get_nowait()
+            except queue.Empty:
+                break
+            if kind == 'progress':
+                if self.on_progress:
+                    self.on_progress(*payload)
+                continue
+            self.finished = True
+            if kind == 'done' and self.on_done:
+                self.on_done(payload)
+            elif kind == 'error' and self.on_error:
+                self.on_error(payload)
+            elif kind == 'cancelled' and self.on_cancel:
+                self.on_cancel()
+            return
+        self.widget.after(self.poll_ms, self._poll)
@@ -1,25 +1,205 @@
 import tkinter as tk
 from tkinter import ttk
 
+import numpy as np
+
+
+def sort_order(keys, descending=False):
+    """Stable argsort of ``keys``; equal keys keep their order in both directions.
+
+    Object columns holding values that do not compare (e.g. text and NaN) are
+    sorted by their string form.
+    """
+    if descending:
+        # Sort the reversed keys so ties come out last-first, then flip back.
+        return keys.size - 1 - sort_order(keys[::-1])[::-1]
+    try:
+        return np.argsort(keys, kind='stable')
+    except TypeError:
+        return np.argsort(keys.astype(str), kind='stable')
+
 
 class DatasetViewer(ttk.Frame):
-    def __init__(self, master):
+    """Virtual-scrolling table over a DataFrame (or a dict of column arrays).
+
+    Only the rows that fit on screen exist as ``Treeview`` items; scrolling
+    rewrites their values from slices of the underlying NumPy arrays, so
+    showing 1M rows costs the same as showing 30. Sorting (click a heading)
+    and filtering work on an index array over the columns, never on Tk items.
+    """
+
+    def __init__(self, master, show_filter=True):
         super().__init__(master)
-        self.tree = ttk.Treeview(self, show='headings')
-        self.tree.pack(fill=tk.BOTH, expand=True)
-        sbx = ttk.Scrollbar(self, orient='horizontal', command=self.tree.xview)
-        sby = ttk.Scrollbar(self, orient='vertical', command=self.tree.yview)
-        self.tree.configure(xscrollcommand=sbx.set, yscrollcommand=sby.set)
+        self._columns = []
+        self._arrays = {}
+        self._n_total = 0
+        self._order = np.arange(0)     # rows passing the filter, in display order
+        self._filter_mask = None
+        self._sort = None              # (column, descending)
+        self._top = 0
+        self._pool = []                # Treeview item ids reused for the visible window
+
+        if show_filter:
+            self._build_filter_bar()
+        body = ttk.Frame(self)
+        body.pack(fill=tk.BOTH, expand=True)
+        self.tree = ttk.Treeview(body, show='headings', selectmode='browse')
+        sbx = ttk.Scrollbar(body, orient='horizontal', command=self.tree.xview)
+        self.sby = ttk.Scrollbar(body, orient='vertical', command=self._on_scrollbar)
+        self.tree.configure(xscrollcommand=sbx.set)
         sbx.pack(fill=tk.X, side=tk.BOTTOM)
-        sby.pack(fill=tk.Y, side=tk.RIGHT)
+        self.sby.pack(fill=tk.Y, side=tk.RIGHT)
+        self.tree.pack(fill=tk.BOTH, expand=True)
+
+        self.tree.bind('<Configure>', lambda e: self._resize_pool())
+        self.tree.bind('<MouseWheel>', self._on_wheel)
+        self.tree.bind('<Button-4>', lambda e: self.scroll_rows(-3))
+        self.tree.bind('<Button-5>', lambda e: self.scroll_rows(3))
+        self.tree.bind('<Prior>', lambda e: self.scroll_rows(-len(self._pool)))
+        self.tree.bind('<Next>', lambda e: self.scroll_rows(len(self._pool)))
+
+    def _build_filter_bar(self):
+        bar = ttk.Frame(self)
+        bar.pack(fill=tk.X, pady=(0, 4))
+        ttk.Label(bar, text='Filter').pack(side=tk.LEFT, padx=(0, 4))
+        self.filter_col = ttk.Combobox(bar, state='readonly', width=24)
+        self.filter_col.pack(side=tk.LEFT)
+        ttk.Label(bar, text='min').pack(side=tk.LEFT, padx=(6, 2))
+        self.filter_min = tk.StringVar()
+        ttk.Entry(bar, textvariable=self.filter_min, width=10).pack(side=tk.LEFT)
+        ttk.Label(bar, text='max / contains').pack(side=tk.LEFT, padx=(6, 2))
+        self.filter_max = tk.StringVar()
+        ttk.Entry(bar, textvariable=self.filter_max, width=10).pack(side=tk.LEFT)
+        ttk.Button(bar, text='Apply', command=self._apply_filter_bar).pack(side=tk.LEFT, padx=4)
+        ttk.Button(bar, text='Clear', command=self.clear_filter).pack(side=tk.LEFT)
+        self.count_var = tk.StringVar(value='')
+        ttk.Label(bar, textvariable=self.count_var).pack(side=tk.RIGHT)
 
+    # Data
     def load_dataframe(self, df):
-        # Clear
-        for c in self.tree.get_children():
-            self.tree.delete(c)
-        self.tree['columns'] = list(df.columns)
-        for col in df.columns:
-            self.tree.heading(col, text=col)
+        """Show ``df`` (a DataFrame or ``{column: array}``, e.g. cached memmaps).
+
+        No rows are copied into Tk, so this returns as soon as the first screen
+        is drawn.
+        """
+        columns = list(df.columns) if hasattr(df, 'columns') else list(df.keys())
+        self._columns = columns
+        self._arrays = {c: np.asarray(df[c]) for c in columns}
+        self._n_total = len(self._arrays[columns[0]]) if columns else 0
+        self._filter_mask = None
+        self._sort = None
+        self._top = 0
+
+        self.tree['columns'] = columns
+        for col in columns:
+            self.tree.heading(col, text=col, command=lambda c=col: self._on_heading(c))
             self.tree.column(col, width=140, stretch=True)
-        for _, row in df.iterrows():
-            self.tree.insert('', tk.END, values=list(row.values))
\ No newline at end of file
+        if hasattr(self, 'filter_col'):
+            self.filter_col['values'] = columns
+            if columns:
+                self.filter_col.set(columns[0])
+        self._rebuild_order()
+
+    def row_count(self) -> int:
+        """Rows currently passing the filter."""
+        return int(self._order.size)
+
+    def visible_rows(self):
+        """Original row indices currently on screen."""
+        return self._order[self._top:self._top + len(self._pool)]
+
+    # Sort and filter
+    def sort_by(self, column, descending=False):
+        self._sort = (column, descending)
+        self._rebuild_order()
+
+    def _on_heading(self, column):
+        descending = self._sort is not None and self._sort[0] == column and not self._sort[1]
+        self.sort_by(column, descending)
+
+    def set_filter(self, column, lo=None, hi=None, contains=None):
+        """Keep rows with ``lo <= column <= hi`` (numeric) or containing ``contains`` (text)."""
+        values = self._arrays[column]
+        mask = np.ones(self._n_total, dtype=bool)
+        if contains:
+            mask &= np.char.find(values.astype(str), str(contains)) >= 0
+        if lo is not None:
+            mask &= values >= lo
+        if hi is not None:
+            mask &= values <= hi
+        self._filter_mask = mask
+        self._top = 0
+        self._rebuild_order()
+
+    def clear_filter(self):
+        self._filter_mask = None
+        self._top = 0
+        self._rebuild_order()
+
+    def _apply_filter_bar(self):
+        column = self.filter_col.get()
+        if column not in self._arrays:
+            return
+        lo, hi = self.filter_min.get().strip(), self.filter_max.get().strip()
+        if np.issubdtype(self._arrays[column].dtype, np.number):
+            try:
+                self.set_filter(column, lo=float(lo) if lo else None, hi=float(hi) if hi else None)
+            except ValueError:
+                self.count_var.set('min/max must be numbers')
+        else:
+            self.set_filter(column, contains=hi or lo or None)
+
+    def _rebuild_order(self):
+        order = np.arange(self._n_total) if self._filter_mask is None else np.flatnonzero(self._filter_mask)
+        if self._sort is not None and order.size:
+            column, descending = self._sort
+            order = order[sort_order(self._arrays[column][order], descending)]
+        self._order = order
+        if hasattr(self, 'count_var'):
+            self.count_var.set(f'{order.size:,} of {self._n_total:,} rows')
+        self._render()
+
+    # Virtual scrolling
+    def _resize_pool(self):
+        rowheight = int(ttk.Style().lookup('Treeview', 'rowheight') or 20)
+        # Leave room for the heading row.
+        wanted = max(1, (self.tree.winfo_height() - 25) // rowheight)
+        while len(self._pool) < wanted:
+            self._pool.append(self.tree.insert('', tk.END, values=()))
+        while len(self._pool) > wanted:
+            self.tree.delete(self._pool.pop())
+        self._render()
+
+    def scroll_rows(self, delta):
+        self._scroll_to(self._top + delta)
+
+    def _scroll_to(self, top):
+        max_top = max(0, self._order.size - len(self._pool))
+        top = int(min(max(top, 0), max_top))
+        if top != self._top:
+            self._top = top
+            self._render()
+
+    def _on_wheel(self, event):
+        self.scroll_rows(-3 if event.delta > 0 else 3)
+
+    def _on_scrollbar(self, *args):
+        if args[0] == 'moveto':
+            self._scroll_to(round(float(args[1]) * self._order.size))
+        elif args[0] == 'scroll':
+            step = len(self._pool) if args[2] == 'pages' else 1
+            self.scroll_rows(int(args[1]) * step)
+
+    def _render(self):
+        rows = self.visible_rows()
+        cells = [self._arrays[c][rows].tolist() for c in self._columns]
+        for i, iid in enumerate(self._pool):
+            if i < rows.size:
+                self.tree.item(iid, values=[col[i] for col in cells])
+            else:
+                self.tree.item(iid, values=())
+        total = self._order.size
+        if total:
+            self.sby.set(self._top / total, min(1.0, (self._top + len(self._pool)) / total))
+        else:
+            self.sby.set(0.0, 1.0)
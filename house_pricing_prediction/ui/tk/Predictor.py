@@ -1,17 +1,10 @@
-import json
-import zipfile
+from house_price_prediction.core.model_utils import load_model_zip, save_model_zip
 
-import pickle
 
-
-def save_model(model, feature_names, zip_path):
-    with zipfile.ZipFile(zip_path, 'w', compression=zipfile.ZIP_DEFLATED) as zf:
-        zf.writestr('model.pkl', pickle.dumps(model))
-        zf.writestr('feature_names.json', json.dumps(list(feature_names)))
+def save_model(model, feature_names, zip_path, metadata=None):
+    # Same artifact format as train_console: JSON manifest + raw coefficients, no pickle.
+    return save_model_zip(model, list(feature_names), zip_path, metadata)
 
 
 def load_model(zip_path):
-    with zipfile.ZipFile(zip_path, 'r') as zf:
-        model = pickle.loads(zf.read('model.pkl'))
-        fns = json.loads(zf.read('feature_names.json').decode('utf-8'))
-        return model, fns
\ No newline at end of file
+    return load_model_zip(zip_path)
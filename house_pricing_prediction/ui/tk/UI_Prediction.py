@@ -5,13 +5,14 @@ from pathlib import Path
 from datetime import datetime
 
 import pandas as pd
-from sklearn.linear_model import LinearRegression
-from sklearn.model_selection import train_test_split
-from sklearn.metrics import mean_absolute_error, mean_squared_error
 import numpy as np
 
+from house_price_prediction.ui.tk.BackgroundTask import BackgroundTask
 from house_price_prediction.ui.tk.DatasetViewer import DatasetViewer
-from house_price_prediction.ui.tk.Predictor import save_model, load_model
+from house_price_prediction.ui.tk.Predictor import save_model
+from house_price_prediction.core.data_loader import load_dataset
+from house_price_prediction.core.prediction_cache import cache_from_env
+from house_price_prediction.core.registry import ModelRegistry
 
 
 FEATURES = [
@@ -36,6 +37,12 @@ class UIPrediction(tk.Tk):
         self.geometry('1200x700')
         self.df = None
         self.model = None
+        self.task = None
+        # Cache model zips in memory; the watcher picks up zips saved by other tools.
+        self.registry = ModelRegistry(MODEL_DIR)
+        self.registry.start_watching()
+        # Optional (HOUSE_PRICE_PREDICTION_CACHE); cleared whenever self.model is a different model.
+        self.cache = cache_from_env()
         self._build_ui()
 
     def _build_ui(self):
@@ -82,7 +89,7 @@ class UIPrediction(tk.Tk):
 
         # Coefficient viewer + metrics in right panel
         ttk.Label(right, text='Coefficient').pack(anchor='w', padx=6, pady=(6,0))
-        self.coeff_viewer = DatasetViewer(right)
+        self.coeff_viewer = DatasetViewer(right, show_filter=False)
         self.coeff_viewer.pack(fill=tk.BOTH, expand=True, padx=6, pady=6)
 
         self.lbl_intercept = ttk.Label(right, text='Intercept: -')
@@ -117,29 +124,91 @@ class UIPrediction(tk.Tk):
         self.pred_out_var = tk.StringVar(value='Prediction Price: -')
         ttk.Label(bottom, textvariable=self.pred_out_var).grid(row=len(fields)+1, column=1, sticky='w', padx=4, pady=6)
 
-        # Status
+        # Status: message, progress of the background task and a cancel button
+        status_bar = ttk.Frame(self)
+        status_bar.pack(fill=tk.X, padx=8, pady=6)
         self.status = tk.StringVar(value='Ready')
-        ttk.Label(self, textvariable=self.status).pack(fill=tk.X, padx=8, pady=6)
+        ttk.Label(status_bar, textvariable=self.status).pack(side=tk.LEFT, fill=tk.X, expand=True)
+        self.btn_cancel = ttk.Button(status_bar, text='Cancel', command=self.cancel_task, state=tk.DISABLED)
+        self.btn_cancel.pack(side=tk.RIGHT, padx=(4,0))
+        self.progress = ttk.Progressbar(status_bar, length=220, mode='determinate', maximum=1.0)
+        self.progress.pack(side=tk.RIGHT)
 
         # Initialize dropdown
         self._refresh_model_dropdown()
 
+    # Background tasks: heavy work runs on a worker thread so the window stays responsive
+    def _run_task(self, label, fn, on_done):
+        if self.task is not None and self.task.running:
+            messagebox.showinfo('Info', 'Another task is still running. Cancel it or wait.')
+            return
+        self.status.set(f'{label}...')
+        self.progress.configure(mode='indeterminate')
+        self.progress.start(15)
+        self.btn_cancel.configure(state=tk.NORMAL)
+
+        def _finish(message):
+            self.progress.stop()
+            self.progress.configure(mode='determinate', value=0)
+            self.btn_cancel.configure(state=tk.DISABLED)
+            self.status.set(message)
+
+        def _done(result):
+            _finish(f'{label}: done')
+            on_done(result)
+
+        def _error(e):
+            _finish(f'{label}: failed')
+            messagebox.showerror('Error', str(e))
+
+        def _progress(fraction, message):
+            if fraction is not None:
+                self.progress.stop()
+                self.progress.configure(mode='determinate', value=fraction)
+            if message:
+                self.status.set(f'{label}: {message}')
+
+        self.task = BackgroundTask(self, fn, on_done=_done, on_error=_error, on_progress=_progress,
+                                   on_cancel=lambda: _finish(f'{label}: cancelled')).start()
+
+    def cancel_task(self):
+        if self.task is not None and self.task.running:
+            self.task.cancel()
+        self.status.set('Cancelling...')
+
+    def _train_rate_percent(self):
+        try:
+            rate_percent = int(self.train_rate_var.get())
+            return max(50, min(rate_percent, 95))  # clamp 50..95
+        except Exception:
+            return 80
+
     # Actions
     def pick_dataset(self):
         path = filedialog.askopenfilename(title='Select dataset CSV', filetypes=[('CSV files', '*.csv')])
-        if path:
-            try:
-                self.df = pd.read_csv(path)
-                self.dataset_path_var.set(path)
-                self.status.set(f'Loaded dataset: {os.path.basename(path)}')
-            except Exception as e:
-                messagebox.showerror('Error', str(e))
+        if not path:
+            return
+
+        def work(task):
+            def on_rows(n_rows):
+                task.check_cancelled()
+                task.progress(None, f'parsed {n_rows:,} rows')
+            # Memory-mapped cache: re-picking the same file skips CSV parsing.
+            return load_dataset(path, use_cache=True, progress=on_rows)
+
+        def done(df):
+            self.df = df
+            self.dataset_path_var.set(path)
+            self.status.set(f'Loaded dataset: {os.path.basename(path)} ({len(df):,} rows)')
+
+        self._run_task(f'Loading {os.path.basename(path)}', work, done)
 
     def view_dataset(self):
         if self.df is None:
             messagebox.showinfo('Info', 'Pick dataset first.')
             return
         self.viewer.load_dataframe(self.df)
+        self.status.set(f'Showing {len(self.df):,} rows')
 
     def _get_X_y(self):
         X = self.df[FEATURES]
@@ -151,64 +220,90 @@ class UIPrediction(tk.Tk):
             messagebox.showinfo('Info', 'Pick dataset first.')
             return
         X, y = self._get_X_y()
-        try:
-            rate_percent = int(self.train_rate_var.get())
-            rate_percent = max(50, min(rate_percent, 95))  # clamp 50..95
-        except Exception:
-            rate_percent = 80
-        rate = rate_percent / 100.0
-        test_size = 1.0 - rate
-        X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=test_size, random_state=42)
-        lin = LinearRegression()
-        lin.fit(X_train, y_train)
-        save_model(lin, FEATURES, MODEL_ZIP)
-        self.model = lin
-        messagebox.showinfo('Train', f'Trained LinearRegression (Training Rate={rate_percent}%). Saved: {MODEL_ZIP}')
-        self._refresh_model_dropdown()
+        rate_percent = self._train_rate_percent()
+        test_size = 1.0 - rate_percent / 100.0
+
+        def work(task):
+            from sklearn.linear_model import LinearRegression
+            from sklearn.model_selection import train_test_split
+
+            task.progress(0.1, 'splitting')
+            X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=test_size, random_state=42)
+            task.check_cancelled()
+            task.progress(0.3, f'fitting on {len(X_train):,} rows')
+            lin = LinearRegression()
+            lin.fit(X_train, y_train)
+            # Last chance to cancel before the saved model is overwritten.
+            task.check_cancelled()
+            task.progress(0.9, 'saving')
+            save_model(lin, FEATURES, MODEL_ZIP, {'train_rate': rate_percent / 100.0, 'rows': len(X_train)})
+            return lin
+
+        def done(lin):
+            self.registry.refresh()
+            self.model = lin
+            messagebox.showinfo('Train', f'Trained LinearRegression (Training Rate={rate_percent}%). Saved: {MODEL_ZIP}')
+            self._refresh_model_dropdown()
+
+        self._run_task('Training', work, done)
 
     def evaluate_model(self):
         if self.df is None:
             messagebox.showinfo('Info', 'Pick dataset first.')
             return
         try:
-            self.model, _ = load_model(MODEL_ZIP)
+            self.model = self.registry.get(os.path.basename(MODEL_ZIP))
         except Exception:
             self.status.set('Model not found. Train first.')
             return
+        model, df = self.model, self.df
         X, y = self._get_X_y()
         # sử dụng cùng tỉ lệ test theo Training Rate
-        try:
-            rate_percent = int(self.train_rate_var.get())
-            rate_percent = max(50, min(rate_percent, 95))
-        except Exception:
-            rate_percent = 80
-        test_size = 1.0 - (rate_percent/100.0)
-        _, X_test, _, y_test = train_test_split(X, y, test_size=test_size, random_state=42)
-        predictions = self.model.predict(X_test)
-        mae = mean_absolute_error(y_test, predictions)
-        mse = mean_squared_error(y_test, predictions)
-        rmse = np.sqrt(mse)
-        # Cập nhật panel đánh giá và hiển thị coefficients
-        coeff_df = pd.DataFrame({'Feature': FEATURES, 'Coefficient': self.model.coef_})
-        self.coeff_viewer.load_dataframe(coeff_df)
-        self.lbl_intercept.config(text=f'Intercept: {self.model.intercept_:.6f}')
-        self.lbl_mae.config(text=f'Mean Absolute Error (MAE): {mae:.6f}')
-        self.lbl_mse.config(text=f'Mean Square Error (MSE): {mse:.6f}')
-        self.lbl_rmse.config(text=f'Root Mean Square Error (RMSE): {rmse:.6f}')
-
-        # Hiển thị bảng dự đoán bên trái theo đúng layout
-        df2 = self.df.copy()
-        df2['Prediction'] = self.model.predict(df2[FEATURES])
-        df_show = df2[[*FEATURES, 'Price', 'Prediction']].rename(columns={'Price': 'Original Price', 'Prediction': 'Prediction Price'})
-        self.viewer.load_dataframe(df_show)
+        test_size = 1.0 - (self._train_rate_percent()/100.0)
+
+        def work(task):
+            from sklearn.model_selection import train_test_split
+            from sklearn.metrics import mean_absolute_error, mean_squared_error
+
+            task.progress(0.1, 'splitting')
+            _, X_test, _, y_test = train_test_split(X, y, test_size=test_size, random_state=42)
+            task.check_cancelled()
+            task.progress(0.4, 'scoring test split')
+            predictions = model.predict(X_test)
+            mae = mean_absolute_error(y_test, predictions)
+            mse = mean_squared_error(y_test, predictions)
+            rmse = np.sqrt(mse)
+            task.check_cancelled()
+            # Hiển thị bảng dự đoán bên trái theo đúng layout
+            task.progress(0.7, 'scoring all rows')
+            df2 = df[[*FEATURES, 'Price']].copy()
+            df2['Prediction'] = model.predict(df2[FEATURES])
+            df_show = df2.rename(columns={'Price': 'Original Price', 'Prediction': 'Prediction Price'})
+            return mae, mse, rmse, df_show
+
+        def done(result):
+            mae, mse, rmse, df_show = result
+            # Cập nhật panel đánh giá và hiển thị coefficients
+            coeff_df = pd.DataFrame({'Feature': FEATURES, 'Coefficient': model.coef_})
+            self.coeff_viewer.load_dataframe(coeff_df)
+            self.lbl_intercept.config(text=f'Intercept: {model.intercept_:.6f}')
+            self.lbl_mae.config(text=f'Mean Absolute Error (MAE): {mae:.6f}')
+            self.lbl_mse.config(text=f'Mean Square Error (MSE): {mse:.6f}')
+            self.lbl_rmse.config(text=f'Root Mean Square Error (RMSE): {rmse:.6f}')
+            self.viewer.load_dataframe(df_show)
+
+        self._run_task('Evaluating', work, done)
 
     def predict_inline(self):
         try:
             # ưu tiên model đang nạp; nếu chưa có thì nạp mặc định
             if not self.model:
-                self.model, _ = load_model(MODEL_ZIP)
-            x = [[float(self.pred_inputs[f].get()) for f in FEATURES]]
-            pred = float(self.model.predict(x)[0])
+                self.model = self.registry.get(os.path.basename(MODEL_ZIP))
+            x = [float(self.pred_inputs[f].get()) for f in FEATURES]
+            if self.cache is not None:
+                pred = self.cache.predict_one(self.model, x)
+            else:
+                pred = float(self.model.predict([x])[0])
             self.pred_out_var.set(f'Prediction Price: {pred:,.2f}')
         except Exception as e:
             messagebox.showerror('Error', f'Invalid input: {e}')
@@ -218,7 +313,7 @@ class UIPrediction(tk.Tk):
             messagebox.showinfo('Info', 'Pick dataset first.')
             return
         try:
-            self.model, _ = load_model(MODEL_ZIP)
+            self.model = self.registry.get(os.path.basename(MODEL_ZIP))
         except Exception:
             self.status.set('Model not found. Train first.')
             return
@@ -231,7 +326,7 @@ class UIPrediction(tk.Tk):
         if not self.model:
             # Nếu chưa train, thử nạp mặc định
             try:
-                self.model, _ = load_model(MODEL_ZIP)
+                self.model = self.registry.get(os.path.basename(MODEL_ZIP))
             except Exception:
                 messagebox.showinfo('Info', 'Train model before saving.')
                 return
@@ -240,12 +335,14 @@ class UIPrediction(tk.Tk):
         ts = datetime.now().strftime('%Y%m%d_%H%M%S')
         out_zip = MODEL_DIR / f'house_price_model_{ts}.zip'
         save_model(self.model, FEATURES, str(out_zip))
+        self.registry.refresh()
         messagebox.showinfo('Saved', f'Lưu mô hình vào: {out_zip}')
         self._refresh_model_dropdown()
 
     def _refresh_model_dropdown(self):
         # Quét thư mục models để nạp danh sách zip
-        zips = sorted([p.name for p in MODEL_DIR.glob('*.zip')])
+        self.registry.refresh()
+        zips = self.registry.names()
         if not zips:
             zips = [os.path.basename(MODEL_ZIP)] if os.path.exists(MODEL_ZIP) else []
         self.model_choices = zips
@@ -264,7 +361,7 @@ class UIPrediction(tk.Tk):
             return
         zip_path = MODEL_DIR / name
         try:
-            self.model, _ = load_model(str(zip_path))
+            self.model = self.registry.get(zip_path.name)
             self.status.set(f'Loaded model: {name}')
         except Exception as e:
             messagebox.showerror('Error', f'Không thể nạp mô hình: {e}')
@@ -3,7 +3,8 @@ from pathlib import Path
 import tkinter as tk
 from tkinter import ttk, messagebox
 
-from house_price_prediction.core.model_utils import load_model_zip
+from house_price_prediction.core.prediction_cache import cache_from_env
+from house_price_prediction.core.registry import ModelRegistry
 
 
 BASE_DIR = Path(__file__).resolve().parents[2]
@@ -15,10 +16,22 @@ class HousePriceApp(tk.Tk):
         super().__init__()
         self.title("House Price Predictor — Tkinter")
         self.geometry("640x360")
-        self.model = None
-        self.feature_names = []
+        self.registry = ModelRegistry(os.path.dirname(MODEL_ZIP))
+        # Optional; a reloaded zip is a new model object, which clears the cache
+        self.cache = cache_from_env()
         self._build_ui()
         self._load_model()
+        # Pick up new or rewritten zips while the window is open
+        self.registry.start_watching()
+
+    @property
+    def model(self):
+        # Resolved on every use so a model swapped in by the watcher is served at once
+        return self.registry.active
+
+    @property
+    def feature_names(self):
+        return getattr(self.model, 'feature_names', [])
 
     def _build_ui(self):
         pad = {'padx': 8, 'pady': 6}
@@ -48,25 +61,26 @@ class HousePriceApp(tk.Tk):
 
     def _load_model(self):
         try:
-            self.model, self.feature_names = load_model_zip(MODEL_ZIP)
+            self.registry.refresh()
+            self.registry.activate(os.path.basename(MODEL_ZIP))
             self.result_var.set(f"Loaded model: {os.path.basename(MODEL_ZIP)}")
-        except Exception as e:
-            self.model, self.feature_names = None, []
+        except Exception:
             self.result_var.set("Model not found. Train first.")
 
     def predict(self):
-        if not self.model:
+        model = self.model
+        if model is None:
             messagebox.showerror("Error", "Model not loaded.")
             return
         try:
-            x = [[
+            x = [
                 float(self.inputs['Avg Area Income'].get()),
                 float(self.inputs['Avg Area House Age'].get()),
                 float(self.inputs['Avg Area Number of Rooms'].get()),
                 float(self.inputs['Avg Area Number of Bedrooms'].get()),
                 float(self.inputs['Area Population'].get()),
-            ]]
-            pred = float(self.model.predict(x)[0])
+            ]
+            pred = self.cache.predict_one(model, x) if self.cache is not None else model.predict_one(x)
             self.result_var.set(f"Predicted Price: {pred:,.2f}")
         except Exception as e:
             messagebox.showerror("Error", f"Invalid input: {e}")
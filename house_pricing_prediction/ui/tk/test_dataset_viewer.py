@@ -0,0 +1,23 @@
+"""Row order of DatasetViewer sorting (no Tk window needed)."""
+import numpy as np
+import pytest
+
+from house_price_prediction.ui.tk.DatasetViewer import sort_order
+
+
+@pytest.mark.parametrize('descending', [False, True])
+def test_ties_keep_their_order_in_both_directions(descending):
+    keys = np.array([2, 1, 2, 3, 1, 2])
+    expected = sorted(range(keys.size), key=lambda i: -keys[i] if descending else keys[i])
+    assert sort_order(keys, descending).tolist() == expected
+
+
+@pytest.mark.parametrize('descending', [False, True])
+def test_mixed_object_column_sorts_by_text(descending):
+    keys = np.array(['b', np.nan, 'a', 3, 'a'], dtype=object)
+    with pytest.raises(TypeError):
+        np.argsort(keys, kind='stable')
+    text = keys.astype(str)
+    # sorted(reverse=True) also keeps ties in their original order
+    expected = sorted(range(keys.size), key=lambda i: text[i], reverse=descending)
+    assert sort_order(keys, descending).tolist() == expected
@@ -1,7 +1,19 @@
-from flask import Flask, render_template_string, request, send_file
+from flask import Flask, Response, g, jsonify, render_template_string, request, send_file
 import os
+import shutil
+import tempfile
+import time
 from pathlib import Path
-from house_price_prediction.core.model_utils import load_model_zip
+
+import numpy as np
+import pandas as pd
+
+from house_price_prediction.core.batcher import MicroBatcher
+from house_price_prediction.core.data_loader import FEATURE_COLUMNS, HEADER_ALIASES, ensure_columns
+from house_price_prediction.core.metrics import REGISTRY, render_prometheus, sample_lines
+from house_price_prediction.core.prediction_cache import PredictionCache
+from house_price_prediction.core.registry import ModelRegistry
+from house_price_prediction.core.scorer import PREDICT_CHUNK_SIZE, predict_in_chunks
 
 TEMPLATE = """
 <!doctype html>
@@ -55,48 +67,253 @@ TEMPLATE = """
 
 BASE_DIR = Path(__file__).resolve().parents[2]
 DEFAULT_MODEL_ZIP = str(BASE_DIR / "models" / "house_price_model.zip")
+BATCH_CSV_COLUMNS = set(FEATURE_COLUMNS) | {k for k, v in HEADER_ALIASES.items() if v in FEATURE_COLUMNS}
+HTTP_SECONDS = REGISTRY.histogram('http_request_duration_seconds', 'Time to build each HTTP response')
 
+# Keys accepted for each feature in a JSON object: the canonical name first, then its aliases.
+ROW_KEYS = {c: [c] + [k for k, v in HEADER_ALIASES.items() if v == c and k != c] for c in FEATURE_COLUMNS}
 
-def create_app(model_zip: str | None = None):
-    app = Flask(__name__)
-    model, feature_names = None, []
 
-    def _load():
-        nonlocal model, feature_names
+def _json_row(payload) -> list:
+    """Convert one JSON feature object or 5-value list to a list of floats."""
+    if isinstance(payload, dict):
+        row = []
+        for col, keys in ROW_KEYS.items():
+            key = next((k for k in keys if k in payload), None)
+            if key is None:
+                raise ValueError(f"Missing columns in row: {[col]}")
+            row.append(float(payload[key]))
+        return row
+    if isinstance(payload, list) and len(payload) == len(FEATURE_COLUMNS):
+        return [float(v) for v in payload]
+    raise ValueError(f"Expected a JSON object or a list of {len(FEATURE_COLUMNS)} values: {FEATURE_COLUMNS}")
+
+
+def _json_rows_to_matrix(rows) -> np.ndarray:
+    """Convert a JSON array of feature objects or 5-value lists to a float64 matrix."""
+    if not isinstance(rows, list):
+        raise ValueError("Expected a JSON array of rows.")
+    if not rows:
+        return np.empty((0, len(FEATURE_COLUMNS)), dtype=np.float64)
+    if isinstance(rows[0], dict):
+        df = pd.DataFrame.from_records(rows)
+        ensure_columns(df, FEATURE_COLUMNS)
+        return df[FEATURE_COLUMNS].to_numpy(dtype=np.float64)
+    X = np.asarray(rows, dtype=np.float64)
+    if X.ndim != 2 or X.shape[1] != len(FEATURE_COLUMNS):
+        raise ValueError(f"Each row must have {len(FEATURE_COLUMNS)} values: {FEATURE_COLUMNS}")
+    return X
+
+
+def _csv_chunks_to_matrices(first, reader, spool):
+    try:
+        if first is not None:
+            yield first
+        for chunk in reader:
+            ensure_columns(chunk, FEATURE_COLUMNS)
+            yield chunk[FEATURE_COLUMNS].to_numpy(dtype=np.float64)
+    finally:
+        spool.close()
+
+
+def _stream_json(predictions):
+    yield '['
+    first = True
+    for block in predictions:
+        if block.size == 0:
+            continue
+        body = ','.join(map(repr, block.tolist()))
+        yield body if first else ',' + body
+        first = False
+    yield ']\n'
+
+
+def _stream_csv(predictions):
+    yield 'Predicted Price\n'
+    for block in predictions:
+        if block.size:
+            yield '\n'.join(map(repr, block.tolist())) + '\n'
+
+
+def create_app(model_zip: str | None = None, registry: ModelRegistry | None = None, watch: bool = False,
+               batcher: MicroBatcher | None = None, cache: PredictionCache | None = None):
+    """Build the Flask app; ``cache`` (optional) memoizes single-row predictions."""
+    app = Flask(__name__)
+    if registry is None:
         mz = model_zip or DEFAULT_MODEL_ZIP
-        if os.path.exists(mz):
-            model, feature_names = load_model_zip(mz)
-        else:
-            model, feature_names = None, []
+        registry = ModelRegistry(os.path.dirname(mz))
+        try:
+            registry.activate(os.path.basename(mz))
+        except FileNotFoundError:
+            # Configured zip missing: serve the newest zip in the directory, if any.
+            try:
+                registry.activate()
+            except FileNotFoundError:
+                pass
+    if watch:
+        registry.start_watching()
+    if batcher is None:
+        batcher = MicroBatcher(lambda: registry.active, n_features=len(FEATURE_COLUMNS))
+    app.config['MODEL_REGISTRY'] = registry
+    app.config['MICRO_BATCHER'] = batcher
+    app.config['PREDICTION_CACHE'] = cache
 
-    _load()
+    @app.before_request
+    def _start_timer():
+        g.request_start = time.perf_counter()
+
+    @app.after_request
+    def _observe_request(response):
+        start = g.get('request_start')
+        if start is not None:
+            HTTP_SECONDS.observe(time.perf_counter() - start, endpoint=request.endpoint or 'unknown',
+                                 method=request.method, status=str(response.status_code))
+        return response
+
+    def _active():
+        """The active model; while there is none, rescan for a zip trained since startup."""
+        model = registry.active
+        if model is None:
+            try:
+                registry.refresh()
+            except Exception:
+                # Half-written zip: the next request retries.
+                return None
+            model = registry.active
+        return model
+
+    def _model():
+        """Active model, or the version named by ``?model=`` (a zip name or 'latest')."""
+        name = request.args.get('model')
+        return registry.get(name) if name else _active()
 
     @app.route('/', methods=['GET', 'POST'])
     def index():
         values = {f: request.form.get(f, "") for f in ['Avg Area Income','Avg Area House Age','Avg Area Number of Rooms','Avg Area Number of Bedrooms','Area Population']}
         pred = None
+        model = _active()
         if request.method == 'POST' and model is not None:
             try:
-                x = [[float(values['Avg Area Income']),
-                      float(values['Avg Area House Age']),
-                      float(values['Avg Area Number of Rooms']),
-                      float(values['Avg Area Number of Bedrooms']),
-                      float(values['Area Population'])]]
-                pred = float(model.predict(x)[0])
+                x = [float(values['Avg Area Income']),
+                     float(values['Avg Area House Age']),
+                     float(values['Avg Area Number of Rooms']),
+                     float(values['Avg Area Number of Bedrooms']),
+                     float(values['Area Population'])]
+                pred = cache.predict_one(model, x) if cache is not None else model.predict_one(x)
             except Exception:
                 pred = None
         return render_template_string(TEMPLATE, values=values, prediction=pred)
 
+    @app.route('/predict', methods=['POST'])
+    def predict():
+        """Score one JSON row; concurrent requests share one vectorized predict."""
+        try:
+            x = _json_row(request.get_json(silent=True))
+        except (ValueError, TypeError) as e:
+            return jsonify(error=str(e)), 400
+        name = request.args.get('model')
+        if name:
+            try:
+                pred = registry.get(name).predict_one(x)
+            except FileNotFoundError as e:
+                return jsonify(error=str(e)), 404
+        else:
+            model = _active()
+            if model is None:
+                return jsonify(error="Model not loaded. Train the model first."), 503
+            if cache is not None:
+                pred = cache.predict_one(model, x, batcher.predict_one)
+            else:
+                pred = batcher.predict_one(x)
+        return jsonify(prediction=pred, model=name or registry.active_name)
+
+    @app.route('/predict/batch', methods=['POST'])
+    def predict_batch():
+        """Score a JSON array or an uploaded CSV and stream the predictions back."""
+        try:
+            current = _model()
+        except FileNotFoundError as e:
+            return jsonify(error=str(e)), 404
+        if current is None:
+            return jsonify(error="Model not loaded. Train the model first."), 503
+        upload = request.files.get('file')
+        try:
+            if upload is not None:
+                # The upload is closed with the request, so spool it to a file the stream owns.
+                spool = tempfile.TemporaryFile()
+                shutil.copyfileobj(upload.stream, spool)
+                spool.seek(0)
+                try:
+                    reader = pd.read_csv(spool, usecols=lambda c: c in BATCH_CSV_COLUMNS,
+                                         chunksize=PREDICT_CHUNK_SIZE)
+                    # Validate the header eagerly so a bad file fails with 400, not mid-stream.
+                    first = next(reader, None)
+                    if first is not None:
+                        ensure_columns(first, FEATURE_COLUMNS)
+                        first = first[FEATURE_COLUMNS].to_numpy(dtype=np.float64)
+                except Exception:
+                    spool.close()
+                    raise
+                matrices = _csv_chunks_to_matrices(first, reader, spool)
+                blocks = (pred for X in matrices for pred in predict_in_chunks(current, X))
+                return Response(_stream_csv(blocks), mimetype='text/csv')
+            X = _json_rows_to_matrix(request.get_json(silent=False))
+        except (ValueError, TypeError, KeyError) as e:
+            return jsonify(error=str(e)), 400
+        blocks = predict_in_chunks(current, X)
+        return Response(_stream_json(blocks), mimetype='application/json')
+
+    @app.route('/healthz')
+    def healthz():
+        """Liveness: the process is up and serving requests."""
+        return jsonify(status='ok', pid=os.getpid())
+
+    @app.route('/readyz')
+    def readyz():
+        """Readiness: a model is loaded and predictions can be served."""
+        if _active() is None:
+            return jsonify(status='not ready', error="Model not loaded."), 503
+        return jsonify(status='ready', model=registry.active_name, batching=batcher.stats())
+
+    @app.route('/cache/stats')
+    def cache_stats():
+        if cache is None:
+            return jsonify(enabled=False)
+        return jsonify(enabled=True, **cache.stats())
+
+    @app.route('/metrics')
+    def metrics():
+        """Prometheus text exposition of this process's latency/row/byte histograms."""
+        extra = []
+        stats = batcher.stats()
+        extra += sample_lines('micro_batches_total', 'Vectorized predict calls made by the batcher',
+                              stats['batches'], 'counter')
+        extra += sample_lines('micro_batch_rows_total', 'Rows scored through the batcher', stats['rows'], 'counter')
+        if cache is not None:
+            stats = cache.stats()
+            extra += sample_lines('prediction_cache_hits_total', 'Prediction cache hits', stats['hits'], 'counter')
+            extra += sample_lines('prediction_cache_misses_total', 'Prediction cache misses', stats['misses'], 'counter')
+            extra += sample_lines('prediction_cache_evictions_total', 'Entries evicted by the LRU bound',
+                                  stats['evictions'], 'counter')
+            extra += sample_lines('prediction_cache_size', 'Entries in the prediction cache', stats['size'])
+            extra += sample_lines('prediction_cache_hit_ratio', 'Hits / lookups since start', stats['hit_rate'])
+        return Response(render_prometheus(extra), mimetype='text/plain; version=0.0.4')
+
+    @app.route('/models')
+    def list_models():
+        return jsonify(models=registry.names(), active=registry.active_name, latest=registry.latest_name())
+
     @app.route('/download-model')
     def download_model():
-        mz = model_zip or DEFAULT_MODEL_ZIP
-        if os.path.exists(mz):
-            return send_file(mz, as_attachment=True)
+        key = registry.active_key
+        if key and os.path.exists(key[0]):
+            return send_file(key[0], as_attachment=True)
         return "Model file not found. Train the model first.", 404
 
     return app
 
 
 if __name__ == '__main__':
+    # Development server; serve.py runs the multi-worker production setup.
     app = create_app()
     app.run(host='127.0.0.1', port=5001, debug=True)
\ No newline at end of file
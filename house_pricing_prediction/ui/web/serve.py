@@ -0,0 +1,138 @@
+"""Production launcher for the house price web app.
+
+The parent process loads the model and binds the listening socket once,
+then forks ``--workers`` children that inherit both: the model pages are
+shared copy-on-write and the kernel spreads connections across the workers
+accepting on the same socket. Each worker runs a threaded WSGI server, so
+concurrent ``POST /predict`` requests in a worker are coalesced by its
+``MicroBatcher`` into one vectorized ``predict``. Dead workers are replaced;
+SIGTERM/SIGINT stop them all.
+
+    python -m house_price_prediction.ui.web.serve --workers 4 --port 8000
+
+Platforms without ``fork`` (Windows) fall back to one threaded process.
+"""
+import argparse
+import gc
+import os
+import signal
+import socket
+import sys
+import time
+
+from werkzeug.serving import make_server
+
+from house_price_prediction.core.prediction_cache import PredictionCache
+from house_price_prediction.ui.web.app import DEFAULT_MODEL_ZIP, create_app
+
+
+def bind_socket(host: str, port: int, backlog: int = 2048) -> socket.socket:
+    family = socket.AF_INET6 if ':' in host else socket.AF_INET
+    sock = socket.socket(family, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind((host, port))
+    sock.listen(backlog)
+    sock.set_inheritable(True)
+    return sock
+
+
+def serve_worker(app, sock: socket.socket, watch: bool = False):
+    """Serve ``app`` on the already-bound ``sock`` until the process is stopped."""
+    if watch:
+        # The watcher thread has to be started in the process that uses it.
+        app.config['MODEL_REGISTRY'].start_watching()
+    host, port = sock.getsockname()[:2]
+    server = make_server(host, port, app, threaded=True, fd=sock.fileno())
+    server.serve_forever()
+
+
+def run_prefork(app, sock: socket.socket, workers: int, watch: bool = False):
+    """Fork ``workers`` children serving ``sock`` and keep that many alive."""
+    children = set()
+    stopping = False
+
+    def spawn():
+        pid = os.fork()
+        if pid == 0:
+            signal.signal(signal.SIGTERM, signal.SIG_DFL)
+            # Ctrl-C reaches the whole process group; let the parent do the shutdown.
+            signal.signal(signal.SIGINT, signal.SIG_IGN)
+            code = 0
+            try:
+                serve_worker(app, sock, watch)
+            except BaseException:
+                code = 1
+            finally:
+                os._exit(code)
+        children.add(pid)
+
+    def stop(signum, frame):
+        nonlocal stopping
+        stopping = True
+        for pid in list(children):
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+    signal.signal(signal.SIGTERM, stop)
+    signal.signal(signal.SIGINT, stop)
+    # Keep the loaded model out of the collector's reach so workers do not
+    # dirty (and thereby copy) its pages while scanning for garbage.
+    gc.freeze()
+    for _ in range(workers):
+        spawn()
+    while children:
+        try:
+            pid, _ = os.wait()
+        except ChildProcessError:
+            break
+        children.discard(pid)
+        if not stopping:
+            print(f"Worker {pid} exited; starting a replacement.", file=sys.stderr)
+            time.sleep(0.5)
+            spawn()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Serve the house price predictor with several worker processes')
+    parser.add_argument('--model', default=DEFAULT_MODEL_ZIP, help='Model zip to serve')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8000)
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1,
+                        help='Worker processes (default: one per CPU)')
+    parser.add_argument('--max_batch', type=int, default=256, help='Most rows scored in one predict call')
+    parser.add_argument('--max_wait_ms', type=float, default=2.0,
+                        help='How long a batch waits for more rows before scoring')
+    parser.add_argument('--cache_size', type=int, default=0,
+                        help='Cache up to this many single-row predictions per worker (0: off)')
+    parser.add_argument('--cache_ttl', type=float, default=300.0, help='Seconds a cached prediction stays valid')
+    parser.add_argument('--cache_decimals', type=int, default=2,
+                        help='Decimals features are rounded to before the cache lookup')
+    parser.add_argument('--watch', action='store_true', help='Reload when a newer model zip appears')
+    args = parser.parse_args()
+
+    cache = None
+    if args.cache_size > 0:
+        cache = PredictionCache(maxsize=args.cache_size, ttl=args.cache_ttl, decimals=args.cache_decimals)
+    app = create_app(args.model, cache=cache)
+    registry = app.config['MODEL_REGISTRY']
+    batcher = app.config['MICRO_BATCHER']
+    batcher.max_batch = max(1, args.max_batch)
+    batcher.max_wait = args.max_wait_ms / 1000.0
+    if registry.active is None:
+        print(f"No model loaded yet; /readyz reports 503 until a zip is trained into {registry.model_dir}.",
+              file=sys.stderr)
+    else:
+        print(f"Loaded model: {registry.active_name}")
+
+    sock = bind_socket(args.host, args.port)
+    print(f"Serving on http://{args.host}:{args.port} with {args.workers} worker(s)")
+    if args.workers <= 1 or not hasattr(os, 'fork'):
+        serve_worker(app, sock, args.watch)
+    else:
+        run_prefork(app, sock, args.workers, args.watch)
+
+
+if __name__ == '__main__':
+    main()
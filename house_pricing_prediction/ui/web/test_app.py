@@ -0,0 +1,23 @@
+"""Flask app readiness on a cold start, before any model zip exists."""
+import numpy as np
+
+from house_price_prediction.core.artifact import save_artifact
+from house_price_prediction.core.data_loader import FEATURE_COLUMNS
+from house_price_prediction.ui.web.app import create_app
+
+
+def test_readyz_turns_ready_once_a_model_is_trained(tmp_path):
+    model_zip = tmp_path / 'house_price_model.zip'
+    client = create_app(str(model_zip)).test_client()
+
+    response = client.get('/readyz')
+    assert response.status_code == 503
+    assert client.post('/predict', json=[1, 2, 3, 4, 5]).status_code == 503
+
+    save_artifact(str(model_zip), np.ones(len(FEATURE_COLUMNS)), 100.0, FEATURE_COLUMNS)
+    response = client.get('/readyz')
+    assert response.status_code == 200
+    assert response.get_json()['model'] == 'house_price_model.zip'
+    response = client.post('/predict', json=[1, 2, 3, 4, 5])
+    assert response.status_code == 200
+    assert response.get_json()['prediction'] == 115.0
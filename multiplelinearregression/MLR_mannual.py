@@ -16,14 +16,33 @@ X = np.array([
 ])
 y = np.array([[65], [38], [51], [38], [55], [43], [25], [33], [71], [51], [49]])
 
-# (X'X)
-XTX = X.T @ X
-# (X'X)^-1
-XTX_inv = np.linalg.inv(XTX)
-# (X'Y)
-XTY = X.T @ y
-# B_hat = (X'X)^-1 * (X'Y)
-B_hat = XTX_inv @ XTY
+
+
+def solve_cholesky(X, y):
+    # X'X = L L'  ->  solve L z = X'Y, then L' B = z (no inverse)
+    L = np.linalg.cholesky(X.T @ X)
+    z = np.linalg.solve(L, X.T @ y)
+    return np.linalg.solve(L.T, z)
+
+
+def solve_qr(X, y):
+    # X = Q R  ->  R B = Q'Y (does not square the condition number like X'X)
+    Q, R = np.linalg.qr(X)
+    return np.linalg.solve(R, Q.T @ y)
+
+
+def solve_svd(X, y):
+    # X = U S V'  ->  B = V S^-1 U'Y, dropping ~0 singular values (collinear columns)
+    U, s, Vt = np.linalg.svd(X, full_matrices=False)
+    keep = s > np.finfo(float).eps * max(X.shape) * s[0]
+    return Vt[keep].T @ ((U[:, keep].T @ y) / s[keep][:, None])
+
+
+X = X.astype(float)
+y = y.astype(float)
+
+# B_hat = (X'X)^-1 * (X'Y), via Cholesky instead of np.linalg.inv
+B_hat = solve_cholesky(X, y)
 
 # Predicted values
 y_pred = X @ B_hat
@@ -39,3 +58,7 @@ print("\nPredicted y values:")
 print(y_pred)
 print("\nMSE =", mse)
 print("RMSE =", rmse)
+
+# QR and SVD give the same B_hat (use them when X'X is near singular)
+print("\nQR agrees:", np.allclose(solve_qr(X, y), B_hat))
+print("SVD agrees:", np.allclose(solve_svd(X, y), B_hat))
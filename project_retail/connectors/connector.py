@@ -9,6 +9,7 @@ class Connector:
         self.database=database
         self.username=username
         self.password=password
+        self.cursorConn=None
     def connect(self):
         try:
             self.conn = mysql.connector.connect(
@@ -25,9 +26,34 @@ class Connector:
         return None
 
     def disConnect(self):
+        self.closeCursor()
         if self.conn != None:
             self.conn.close()
 
+    def openCursor(self, sql, val=None):
+        """Execute ``sql`` on a second connection and return its unbuffered cursor.
+
+        Rows stay on the server until fetched, so a table model can page
+        through them with ``fetchmany`` while ``self.conn`` keeps serving
+        other queries. Opening a new cursor closes the previous one.
+        """
+        self.closeCursor()
+        self.cursorConn = mysql.connector.connect(
+            host=self.server,
+            port=self.port,
+            database=self.database,
+            user=self.username,
+            password=self.password,
+            use_pure=True)
+        cursor = self.cursorConn.cursor()
+        cursor.execute(sql, val)
+        return cursor
+
+    def closeCursor(self):
+        if self.cursorConn != None:
+            self.cursorConn.close()
+            self.cursorConn = None
+
     def queryDataset(self, sql):
         try:
             cursor = self.conn.cursor()
@@ -39,6 +65,21 @@ class Connector:
         except:
             traceback.print_exc()
         return None
+    def queryDatasetChunks(self, sql, chunksize=10000, val=None):
+        """Yield the result of ``sql`` as DataFrames of at most ``chunksize`` rows.
+
+        The query runs on an unbuffered cursor (see ``openCursor``), so only
+        one chunk is held in memory at a time however large the table is.
+        """
+        cursor = self.openCursor(sql, val)
+        try:
+            while True:
+                rows = cursor.fetchmany(chunksize)
+                if not rows:
+                    break
+                yield pd.DataFrame(rows, columns=cursor.column_names)
+        finally:
+            self.closeCursor()
     def getTablesName(self):
         cursor = self.conn.cursor()
         cursor.execute("Show tables;")
@@ -23,6 +23,10 @@ class EmployeeConnector(Connector):
                                dataset[4], dataset[5])
                 employees.append(emp)
         return employees
+    def open_employee_cursor(self):
+        # Unbuffered cursor on its own connection, paged by CursorTableModel.
+        sql = "SELECT * FROM employee "
+        return self.openCursor(sql)
     def insert_employee(self,emp):
         sql="INSERT "\
         " INTO "\
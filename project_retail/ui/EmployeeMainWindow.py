@@ -117,22 +117,14 @@ class Ui_MainWindow(object):
         self.groupBox_2.setObjectName("groupBox_2")
         self.verticalLayout = QtWidgets.QVBoxLayout(self.groupBox_2)
         self.verticalLayout.setObjectName("verticalLayout")
-        self.tableWidgetEmployee = QtWidgets.QTableWidget(parent=self.groupBox_2)
+        self.tableViewEmployee = QtWidgets.QTableView(parent=self.groupBox_2)
         font = QtGui.QFont()
         font.setPointSize(12)
-        self.tableWidgetEmployee.setFont(font)
-        self.tableWidgetEmployee.setObjectName("tableWidgetEmployee")
-        self.tableWidgetEmployee.setColumnCount(4)
-        self.tableWidgetEmployee.setRowCount(0)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidgetEmployee.setHorizontalHeaderItem(0, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidgetEmployee.setHorizontalHeaderItem(1, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidgetEmployee.setHorizontalHeaderItem(2, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidgetEmployee.setHorizontalHeaderItem(3, item)
-        self.verticalLayout.addWidget(self.tableWidgetEmployee)
+        self.tableViewEmployee.setFont(font)
+        self.tableViewEmployee.setObjectName("tableViewEmployee")
+        self.tableViewEmployee.setSelectionMode(QtWidgets.QAbstractItemView.SelectionMode.SingleSelection)
+        self.tableViewEmployee.setSelectionBehavior(QtWidgets.QAbstractItemView.SelectionBehavior.SelectRows)
+        self.verticalLayout.addWidget(self.tableViewEmployee)
         self.label_6 = QtWidgets.QLabel(parent=self.centralwidget)
         self.label_6.setGeometry(QtCore.QRect(290, 10, 371, 41))
         self.label_6.setStyleSheet("font: 26pt \"MS Shell Dlg 2\";\n"
@@ -168,12 +160,4 @@ class Ui_MainWindow(object):
         self.pushButtonPrevious.setText(_translate("MainWindow", "<<"))
         self.pushButtonNext.setText(_translate("MainWindow", ">>"))
         self.groupBox_2.setTitle(_translate("MainWindow", "List of Employee:"))
-        item = self.tableWidgetEmployee.horizontalHeaderItem(0)
-        item.setText(_translate("MainWindow", "ID"))
-        item = self.tableWidgetEmployee.horizontalHeaderItem(1)
-        item.setText(_translate("MainWindow", "Name"))
-        item = self.tableWidgetEmployee.horizontalHeaderItem(2)
-        item.setText(_translate("MainWindow", "Email"))
-        item = self.tableWidgetEmployee.horizontalHeaderItem(3)
-        item.setText(_translate("MainWindow", "Phone"))
         self.label_6.setText(_translate("MainWindow", "Employee Management"))
@@ -1,15 +1,17 @@
 from PyQt6.QtCore import Qt
-from PyQt6.QtWidgets import QTableWidgetItem, QMessageBox
+from PyQt6.QtWidgets import QMessageBox
 
 from ML_Excercises.project_retail.connectors.employee_connector import EmployeeConnector
 from ML_Excercises.project_retail.models.employee import Employee
 from ML_Excercises.project_retail.ui.EmployeeMainWindow import Ui_MainWindow
+from ML_Excercises.project_retail.ui.TableModel import CursorTableModel
 
 
 class EmployeeMainWindowEx(Ui_MainWindow):
     def setupUi(self, MainWindow):
         super().setupUi(MainWindow)
         self.MainWindow=MainWindow
+        self.employeeModel=None
         self.setupSignalAndSlot()
 
         self.ec = EmployeeConnector()
@@ -20,39 +22,31 @@ class EmployeeMainWindowEx(Ui_MainWindow):
     def closeWindow(self):
         self.MainWindow.close()
     def setupSignalAndSlot(self):
-        self.tableWidgetEmployee.itemSelectionChanged.connect(self.show_Detail)
         self.pushButtonNew.clicked.connect(self.clear_data)
         self.pushButtonInsert.clicked.connect(self.insert_data)
         self.pushButtonUpdate.clicked.connect(self.update_data)
     def display_all_employees(self):
-        #empty existing data:
-        self.tableWidgetEmployee.setRowCount(0)
-        #loop all employee, then show emp into table:
-        employees = self.ec.get_list_employee()
-        for emp in employees:
-            #get lasted row
-            row=self.tableWidgetEmployee.rowCount()
-            #insert new row at the end of table:
-            self.tableWidgetEmployee.insertRow(row)
-            #assign value for column:
-            column_id=QTableWidgetItem(str(emp.ID))
-            column_name=QTableWidgetItem(emp.Name)
-            column_email=QTableWidgetItem(emp.Email)
-            column_phone=QTableWidgetItem(emp.Phone)
-            if emp.IsDeleted==1:
-                column_id.setBackground(Qt.GlobalColor.yellow)
-                column_name.setBackground(Qt.GlobalColor.yellow)
-                column_email.setBackground(Qt.GlobalColor.yellow)
-                column_phone.setBackground(Qt.GlobalColor.yellow)
-
-            #push column(s) into row:
-            self.tableWidgetEmployee.setItem(row,0,column_id)
-            self.tableWidgetEmployee.setItem(row,1,column_name)
-            self.tableWidgetEmployee.setItem(row,2,column_email)
-            self.tableWidgetEmployee.setItem(row,3,column_phone)
+        #the model pages rows from the cursor while the table scrolls,
+        #so only the rows on screen are ever turned into cells:
+        if self.employeeModel is not None:
+            self.employeeModel.close()
+        cursor = self.ec.open_employee_cursor()
+        self.employeeModel = CursorTableModel(
+            cursor, headers=["ID", "Name", "Email", "Phone"], columns=[0, 1, 2, 3],
+            row_background=self.employee_background)
+        self.tableViewEmployee.setModel(self.employeeModel)
+        #setModel replaces the selection model, so reconnect every time:
+        self.tableViewEmployee.selectionModel().currentRowChanged.connect(self.show_Detail)
+    def employee_background(self, row):
+        #deleted employees (IsDeleted==1) are highlighted in yellow
+        if self.employeeModel.row(row)[5] == 1:
+            return Qt.GlobalColor.yellow
+        return None
     def show_Detail(self):
-        row_number=self.tableWidgetEmployee.currentIndex().row()
-        id=self.tableWidgetEmployee.item(row_number,0).text()
+        row_number=self.tableViewEmployee.currentIndex().row()
+        if row_number == -1:
+            return
+        id=self.employeeModel.row(row_number)[0]
         emp=self.ec.get_detail(id)
         if emp!=None:
             self.lineEditID.setText(str(emp.ID))
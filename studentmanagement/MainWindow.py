@@ -126,20 +126,12 @@ class Ui_MainWindow(object):
         self.groupBox_3.setObjectName("groupBox_3")
         self.verticalLayout = QtWidgets.QVBoxLayout(self.groupBox_3)
         self.verticalLayout.setObjectName("verticalLayout")
-        self.tableWidgetStudent = QtWidgets.QTableWidget(parent=self.groupBox_3)
-        self.tableWidgetStudent.setStyleSheet("background-color: rgb(207, 255, 235);")
-        self.tableWidgetStudent.setObjectName("tableWidgetStudent")
-        self.tableWidgetStudent.setColumnCount(4)
-        self.tableWidgetStudent.setRowCount(0)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidgetStudent.setHorizontalHeaderItem(0, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidgetStudent.setHorizontalHeaderItem(1, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidgetStudent.setHorizontalHeaderItem(2, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableWidgetStudent.setHorizontalHeaderItem(3, item)
-        self.verticalLayout.addWidget(self.tableWidgetStudent)
+        self.tableViewStudent = QtWidgets.QTableView(parent=self.groupBox_3)
+        self.tableViewStudent.setStyleSheet("background-color: rgb(207, 255, 235);")
+        self.tableViewStudent.setObjectName("tableViewStudent")
+        self.tableViewStudent.setSelectionMode(QtWidgets.QAbstractItemView.SelectionMode.SingleSelection)
+        self.tableViewStudent.setSelectionBehavior(QtWidgets.QAbstractItemView.SelectionBehavior.SelectRows)
+        self.verticalLayout.addWidget(self.tableViewStudent)
         MainWindow.setCentralWidget(self.centralwidget)
         self.menubar = QtWidgets.QMenuBar(parent=MainWindow)
         self.menubar.setGeometry(QtCore.QRect(0, 0, 456, 22))
@@ -151,7 +143,7 @@ class Ui_MainWindow(object):
 
         self.retranslateUi(MainWindow)
         QtCore.QMetaObject.connectSlotsByName(MainWindow)
-        MainWindow.setTabOrder(self.tableWidgetStudent, self.lineEditCode)
+        MainWindow.setTabOrder(self.tableViewStudent, self.lineEditCode)
         MainWindow.setTabOrder(self.lineEditCode, self.lineEditName)
         MainWindow.setTabOrder(self.lineEditName, self.lineEditAge)
         MainWindow.setTabOrder(self.lineEditAge, self.pushButtonNew)
@@ -176,11 +168,3 @@ class Ui_MainWindow(object):
         self.label_6.setText(_translate("MainWindow", "ID:"))
         self.pushButtonRemoveAvatar.setText(_translate("MainWindow", "Remove Avatar"))
         self.groupBox_3.setTitle(_translate("MainWindow", "List of Students:"))
-        item = self.tableWidgetStudent.horizontalHeaderItem(0)
-        item.setText(_translate("MainWindow", "ID"))
-        item = self.tableWidgetStudent.horizontalHeaderItem(1)
-        item.setText(_translate("MainWindow", "Code"))
-        item = self.tableWidgetStudent.horizontalHeaderItem(2)
-        item.setText(_translate("MainWindow", "Name"))
-        item = self.tableWidgetStudent.horizontalHeaderItem(3)
-        item.setText(_translate("MainWindow", "Age"))
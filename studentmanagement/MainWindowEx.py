@@ -2,8 +2,9 @@ import base64
 import traceback
 import mysql.connector
 from PyQt6.QtGui import QPixmap
-from PyQt6.QtWidgets import QTableWidgetItem, QFileDialog, QMessageBox
+from PyQt6.QtWidgets import QFileDialog, QMessageBox
 from MainWindow import Ui_MainWindow
+from TableModel import CursorTableModel
 
 class MainWindowEx(Ui_MainWindow):
     def __init__(self):
@@ -15,10 +16,11 @@ class MainWindowEx(Ui_MainWindow):
         self.age = None
         self.avatar = None
         self.intro = None
+        self.studentModel = None
+        self.listConn = None
     def setupUi(self, MainWindow):
         super().setupUi(MainWindow)
         self.MainWindow=MainWindow
-        self.tableWidgetStudent.itemSelectionChanged.connect(self.processItemSelection)
         self.pushButtonAvatar.clicked.connect(self.pickAvatar)
         self.pushButtonRemoveAvatar.clicked.connect(self.removeAvatar)
         self.pushButtonInsert.clicked.connect(self.processInsert)
@@ -33,44 +35,35 @@ class MainWindowEx(Ui_MainWindow):
         username = "root"
         password = "@Obama123"
 
-        self.conn = mysql.connector.connect(
+        self.connParams = dict(
             host=server,
             port=port,
             database=database,
             user=username,
             password=password)
+        self.conn = mysql.connector.connect(**self.connParams)
     def selectAllStudent(self):
-        cursor = self.conn.cursor()
+        # the list cursor gets its own connection: it stays open while the
+        # table pages through it, and self.conn keeps serving the other queries
+        if self.studentModel is not None:
+            self.studentModel.close()
+        if self.listConn is not None:
+            self.listConn.close()
+        self.listConn = mysql.connector.connect(**self.connParams)
+        cursor = self.listConn.cursor()
         # query all students
-        sql = "select * from student"
+        sql = "select Id, Code, Name, Age from student"
         cursor.execute(sql)
-        dataset = cursor.fetchall()
-        self.tableWidgetStudent.setRowCount(0)
-        row=0
-        for item in dataset:
-            row = self.tableWidgetStudent.rowCount()
-            self.tableWidgetStudent.insertRow(row)
-
-            self.id = item[0]
-            self.code = item[1]
-            self.name = item[2]
-            self.age = item[3]
-            self.avatar = item[4]
-            self.intro = item[5]
-
-            self.tableWidgetStudent.setItem(row, 0, QTableWidgetItem(str(self.id)))
-            self.tableWidgetStudent.setItem(row, 1, QTableWidgetItem(self.code))
-            self.tableWidgetStudent.setItem(row, 2, QTableWidgetItem(self.name))
-            self.tableWidgetStudent.setItem(row, 3, QTableWidgetItem(str(self.age)))
-
-        cursor.close()
+        self.studentModel = CursorTableModel(cursor, headers=["ID", "Code", "Name", "Age"])
+        self.tableViewStudent.setModel(self.studentModel)
+        self.tableViewStudent.selectionModel().currentRowChanged.connect(self.processItemSelection)
 
     def processItemSelection(self):
-        row=self.tableWidgetStudent.currentRow()
+        row=self.tableViewStudent.currentIndex().row()
         if row ==-1:
             return
         try:
-            code = self.tableWidgetStudent.item(row, 1).text()
+            code = self.studentModel.row(row)[1]
             cursor = self.conn.cursor()
             # query all students
             sql = "select * from student where code=%s"
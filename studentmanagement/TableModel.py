@@ -0,0 +1,102 @@
+from PyQt6.QtCore import QAbstractTableModel, QModelIndex, Qt
+
+
+class _PagedTableModel(QAbstractTableModel):
+    """Base for read-only models that expose their rows page by page.
+
+    Views call ``canFetchMore``/``fetchMore`` as the user scrolls towards the
+    end, so only the pages that were actually reached are counted as rows,
+    and ``data`` is only asked for the cells on screen. ``row_background``
+    may return a brush/color for a row (given the row index) or ``None``.
+    """
+
+    def __init__(self, headers, page_size=256, row_background=None, parent=None):
+        super().__init__(parent)
+        self._headers = list(headers)
+        self.page_size = page_size
+        self.row_background = row_background
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._headers)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+        if orientation == Qt.Orientation.Horizontal:
+            return self._headers[section]
+        return section + 1
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.ItemDataRole.DisplayRole:
+            value = self.cell(index.row(), index.column())
+            return '' if value is None else str(value)
+        if role == Qt.ItemDataRole.BackgroundRole and self.row_background is not None:
+            return self.row_background(index.row())
+        return None
+
+    def cell(self, row, column):
+        raise NotImplementedError
+
+
+class CursorTableModel(_PagedTableModel):
+    """Table model that pages rows out of an executed DB-API cursor.
+
+    Rows are pulled with ``cursor.fetchmany(page_size)`` only when the view
+    scrolls near the end, and the cursor is closed once it is exhausted.
+    ``columns`` picks which cursor columns (by index) are shown; ``row(r)``
+    still returns the full fetched tuple.
+
+    mysql-connector cursors are unbuffered: while rows are pending, the same
+    connection cannot run other statements, so open the cursor on its own
+    connection (see ``Connector.openCursor``).
+    """
+
+    def __init__(self, cursor, headers=None, columns=None, page_size=256, row_background=None,
+                 parent=None):
+        names = [d[0] for d in cursor.description] if cursor.description else []
+        self._columns = list(range(len(names))) if columns is None else list(columns)
+        super().__init__(headers or [names[i] for i in self._columns], page_size, row_background, parent)
+        self._cursor = cursor
+        self._rows = self._fetch()
+
+    def _fetch(self):
+        if self._cursor is None:
+            return []
+        rows = self._cursor.fetchmany(self.page_size)
+        if len(rows) < self.page_size:
+            self.close()
+        return rows
+
+    def close(self):
+        if self._cursor is not None:
+            try:
+                self._cursor.close()
+            except Exception:
+                # Some drivers refuse to close a cursor with unread rows;
+                # closing its connection releases them instead.
+                pass
+            self._cursor = None
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and self._cursor is not None
+
+    def fetchMore(self, parent=QModelIndex()):
+        if parent.isValid():
+            return
+        rows = self._fetch()
+        if not rows:
+            return
+        self.beginInsertRows(QModelIndex(), len(self._rows), len(self._rows) + len(rows) - 1)
+        self._rows.extend(rows)
+        self.endInsertRows()
+
+    def row(self, row):
+        return self._rows[row]
+
+    def cell(self, row, column):
+        return self._rows[row][self._columns[column]]